@@ -1,13 +1,25 @@
 from .core import SimpleRetryCore
 from .gui import SimpleRetryGUI
+from .options import DebuggerOptions
+from .debug_log import configure_logging
 import threading
 import logging
 
+logger = logging.getLogger(__name__)
+
 class RobotFrameworkDebugger:
     ROBOT_LISTENER_API_VERSION = 3
 
-    def __init__(self, listener_arg=''):
-        self.core = SimpleRetryCore()
+    def __init__(self, *listener_args):
+        # e.g. --listener rfdb.RobotFrameworkDebugger:log_level=DEBUG:log_path=debug.log
+        self.options = DebuggerOptions.parse(listener_args)
+        configure_logging(
+            self.options.log_path,
+            self.options.log_level,
+            self.options.log_max_bytes,
+            self.options.log_backups,
+        )
+        self.core = SimpleRetryCore(self.options)
         threading.Thread(
             target=self._start_gui,
             daemon=False
@@ -29,23 +41,89 @@ class RobotFrameworkDebugger:
     def end_test(self, data, result):
         self.core.end_test(data, result)
 
+    # RF 7 calls the specific hooks below; the generic ones remain the fallback for other keyword kinds
     def start_keyword(self, data, result):
         self.core.start_keyword(data, result)
 
     def end_keyword(self, data, result):
         self.core.end_keyword(data, result)
-    def library_import(self, name, attrs):
-        libname = getattr(attrs, 'name', None)
+
+    def start_library_keyword(self, data, implementation, result):
+        self.core.start_keyword(data, result)
+
+    def end_library_keyword(self, data, implementation, result):
+        self.core.end_keyword(data, result, user_keyword=False)
+
+    def start_user_keyword(self, data, implementation, result):
+        self.core.start_keyword(data, result)
+
+    def end_user_keyword(self, data, implementation, result):
+        self.core.end_keyword(data, result, user_keyword=True)
+
+    def start_invalid_keyword(self, data, implementation, result):
+        # Unknown keywords fail like any other, so they can be retried with a corrected name
+        self.core.start_keyword(data, result)
+
+    def end_invalid_keyword(self, data, implementation, result):
+        self.core.end_keyword(data, result)
+
+    # Control structures: only the hooks a feature needs. IF/TRY/GROUP/RETURN/BREAK/CONTINUE
+    # have no hook here, so Robot does not call the listener for them at all.
+    def start_for(self, data, result):
+        self.core.start_loop(data, result)
+
+    def end_for(self, data, result):
+        self.core.end_loop(data, result)
+
+    def start_while(self, data, result):
+        self.core.start_loop(data, result)
+
+    def end_while(self, data, result):
+        self.core.end_loop(data, result)
+
+    def start_for_iteration(self, data, result):
+        self.core.start_loop_iteration(data, result)
+
+    def end_for_iteration(self, data, result):
+        self.core.end_loop_iteration(data, result)
+
+    def start_while_iteration(self, data, result):
+        self.core.start_loop_iteration(data, result)
+
+    def end_while_iteration(self, data, result):
+        self.core.end_loop_iteration(data, result)
+
+    def end_var(self, data, result):
+        self.core.end_var(data, result)
+
+    def library_import(self, library, importer):
+        libname = getattr(importer, 'name', None)
         if libname and self.core and hasattr(self.core, "gui_controller") and self.core.gui_controller:
+            # Source, version and import args key the on-disk keyword catalog cache
+            source = getattr(library, 'source', None)
+            version = getattr(library, 'version', None)
+            args = tuple(getattr(importer, 'args', ()) or ())
             # Check if GUI is ready before accessing it
             if getattr(self.core.gui_controller, "gui_ready", False):
-                logging.info(f"[Debugger] Library imported: {libname}")
-                self.core.gui_controller.library_imported(libname)
+                logger.info(f"[Debugger] Library imported: {libname}")
+                self.core.gui_controller.library_imported(libname, source, version, args)
             else:
                 # Queue library for later loading
                 if not hasattr(self.core.gui_controller, '_pending_libraries'):
                     self.core.gui_controller._pending_libraries = []
-                self.core.gui_controller._pending_libraries.append(libname)
+                self.core.gui_controller._pending_libraries.append((libname, source, version, args))
+
+    def resource_import(self, resource, importer):
+        # Only the path is passed on; user keywords are parsed off the Robot thread
+        source = getattr(resource, 'source', None)
+        if source and self.core and hasattr(self.core, "gui_controller") and self.core.gui_controller:
+            if getattr(self.core.gui_controller, "gui_ready", False):
+                logger.info(f"[Debugger] Resource imported: {source}")
+                self.core.gui_controller.resource_imported(str(source))
+            else:
+                if not hasattr(self.core.gui_controller, '_pending_resources'):
+                    self.core.gui_controller._pending_resources = []
+                self.core.gui_controller._pending_resources.append(str(source))
 
 if __name__ == "__main__":
     listener = RobotFrameworkDebugger()
@@ -0,0 +1,116 @@
+# arg_converters.py
+import logging
+from robot.running.arguments.typeconverters import TypeConverter
+from robot.variables import search_variable
+
+logger = logging.getLogger(__name__)
+
+POSITIONAL_KINDS = ("POSITIONAL_ONLY", "POSITIONAL_OR_NAMED")
+NAMED_KINDS = ("POSITIONAL_OR_NAMED", "NAMED_ONLY")
+
+
+def normalize_name(name):
+    """Robot style keyword/argument name normalization (case, space and underscore insensitive)."""
+    return str(name).lower().replace(" ", "").replace("_", "")
+
+
+def _build_converter(type_info):
+    if type_info is None or not type_info:
+        return None
+    try:
+        return TypeConverter.converter_for(type_info)
+    except Exception as e:
+        logger.debug(f"[Debugger] No converter for type '{type_info}': {e}")
+        return None
+
+
+class KeywordConverter:
+    """Converts argument editor text to the types declared in a keyword's libdoc arg spec."""
+
+    def __init__(self, arg_specs):
+        self._specs = []  # (name, kind, converter) in spec order
+        self._positional = []
+        self._varargs = None
+        self._named = {}
+        for arg in arg_specs or []:
+            name = getattr(arg, "name", str(arg))
+            kind = str(getattr(arg, "kind", "POSITIONAL_OR_NAMED"))
+            entry = (name, kind, _build_converter(getattr(arg, "type", None)))
+            self._specs.append(entry)
+            if kind in POSITIONAL_KINDS:
+                self._positional.append(entry)
+            if kind in NAMED_KINDS:
+                self._named[name] = entry
+            if kind == "VAR_POSITIONAL":
+                self._varargs = entry
+
+    def convert(self, texts, spec_indexes=None):
+        """
+        Convert editor texts to argument values. Returns (values, errors) where
+        errors is a list of (field index, message).
+
+        spec_indexes[i] names the spec argument that field i was created for (custom tab);
+        without it texts are the positional arguments of the call (retry tab).
+        Text containing Robot variables is passed through for Robot to resolve.
+        """
+        values = []
+        errors = []
+        position = 0
+        for i, text in enumerate(texts):
+            index = spec_indexes[i] if spec_indexes and i < len(spec_indexes) else None
+            spec = self._specs[index] if index is not None and index < len(self._specs) else None
+            kind = spec[1] if spec is not None else None
+
+            if kind in ("VAR_POSITIONAL", "VAR_NAMED", "NAMED_ONLY") and not text:
+                continue  # Optional catch-all / named-only field left empty
+            if kind == "NAMED_ONLY":
+                self._check(spec, text, errors, i)
+                values.append(f"{spec[0]}={text}")
+                continue
+            if kind is None or kind == "VAR_NAMED":
+                # name=value stays text so Robot maps it, but is validated up front
+                named = self._named_target(text)
+                if named is not None or kind == "VAR_NAMED":
+                    if named is not None:
+                        self._check(named, text.split("=", 1)[1], errors, i)
+                    values.append(text)
+                    continue
+
+            if kind not in POSITIONAL_KINDS + ("VAR_POSITIONAL",):
+                spec = self._positional[position] if position < len(self._positional) else self._varargs
+            position += 1
+            values.append(self._check(spec, text, errors, i))
+        return values, errors
+
+    def _named_target(self, text):
+        if "=" not in text:
+            return None
+        return self._named.get(text.split("=", 1)[0].strip())
+
+    @staticmethod
+    def _check(spec, text, errors, field):
+        if spec is None or spec[2] is None or search_variable(text):
+            return text  # Untyped arguments and variables are handled by Robot itself
+        name, _, converter = spec
+        try:
+            return converter.convert(text, name)
+        except (ValueError, TypeError) as e:
+            errors.append((field, str(e)))
+            return text
+
+
+class ConverterCache:
+    """Builds KeywordConverter objects once per keyword and reuses them."""
+
+    def __init__(self):
+        self._converters = {}
+
+    def get(self, key, arg_specs):
+        converter = self._converters.get(key)
+        if converter is None:
+            converter = KeywordConverter(arg_specs)
+            self._converters[key] = converter
+        return converter
+
+    def clear(self):
+        self._converters.clear()
@@ -0,0 +1,84 @@
+# arg_resolver.py
+import logging
+from collections import OrderedDict, namedtuple
+from robot.libraries.BuiltIn import BuiltIn
+from robot.variables import search_variable
+
+logger = logging.getLogger(__name__)
+
+# One original keyword argument and what it resolved to.
+# kind: literal | scalar | string | list | dict
+# values: resolved objects (several for @{list}, "key=value" items for &{dict})
+ResolvedArg = namedtuple("ResolvedArg", "raw kind values error")
+
+
+class ArgumentResolver:
+    """
+    Resolves keyword arguments through Robot's own variable replacement.
+
+    Handles embedded variables, item access, @{list} and &{dict} expansion and
+    %{ENV} variables. Parsed argument templates are cached per keyword call so
+    repeated failures (e.g. in loops) skip the parsing step.
+    """
+
+    MAX_TEMPLATES = 256
+
+    def __init__(self):
+        self._templates = OrderedDict()
+
+    def resolve(self, keyword, args):
+        """Return a list of ResolvedArg for the given keyword call."""
+        template = self._template(keyword, args)
+        try:
+            variables = BuiltIn()._variables
+        except Exception as e:
+            logger.debug(f"[Debugger] No variable context for argument resolution: {e}")
+            return [ResolvedArg(raw, "literal", [raw], None) for _, raw, _ in template]
+        return [self._resolve_one(variables, kind, raw, source) for kind, raw, source in template]
+
+    def _template(self, keyword, args):
+        key = (keyword, tuple(a if isinstance(a, str) else id(a) for a in args))
+        template = self._templates.get(key)
+        if template is not None:
+            self._templates.move_to_end(key)
+            return template
+
+        template = tuple(self._parse(arg) for arg in args)
+        self._templates[key] = template
+        if len(self._templates) > self.MAX_TEMPLATES:
+            self._templates.popitem(last=False)
+        return template
+
+    @staticmethod
+    def _parse(arg):
+        """Classify an argument once: (kind, raw, text handed to the replacer)."""
+        if not isinstance(arg, str):
+            return "literal", arg, arg
+        match = search_variable(arg)
+        if match.is_list_variable():
+            return "list", arg, arg
+        if match.is_dict_variable():
+            return "dict", arg, "$" + arg[1:]
+        if match.is_variable():
+            return "scalar", arg, arg
+        if match or "\\" in arg:
+            return "string", arg, arg  # Embedded variables or escapes
+        return "literal", arg, arg
+
+    @staticmethod
+    def _resolve_one(variables, kind, raw, source):
+        if kind == "literal":
+            return ResolvedArg(raw, kind, [raw], None)
+        try:
+            if kind == "scalar":
+                values = [variables.replace_scalar(source)]
+            elif kind == "string":
+                values = [variables.replace_string(source)]
+            elif kind == "list":
+                values = list(variables.replace_list([source]))
+            else:
+                mapping = variables.replace_scalar(source)
+                values = [f"{k}={v}" for k, v in mapping.items()]
+            return ResolvedArg(raw, kind, values, None)
+        except Exception as e:
+            return ResolvedArg(raw, kind, [raw], str(e))
@@ -0,0 +1,175 @@
+# breakpoint_panel.py
+import tkinter as tk
+from tkinter import ttk, messagebox
+from .breakpoints import Breakpoint, WHEN
+from .call_tree_view import format_location
+
+
+class BreakpointPanel(tk.Frame):
+    """
+    Breakpoints tab: a form to add a breakpoint, the list of breakpoints with
+    their hit counts, and the Continue button used while paused at one.
+    `resolve(breakpoint)` returns the static call sites a breakpoint can
+    stop at, or None while they are not known.
+    All methods run on the Tk thread.
+    """
+
+    def __init__(self, parent, breakpoints, on_continue, on_change=None, resolve=None):
+        super().__init__(parent)
+        self.breakpoints = breakpoints
+        self.on_continue = on_continue
+        self.on_change = on_change
+        self.resolve = resolve
+
+        form = tk.LabelFrame(self, text="Add Breakpoint", padx=8, pady=5)
+        form.pack(fill=tk.X, padx=5, pady=5)
+        self.keyword_var = tk.StringVar(value="")
+        self.when_var = tk.StringVar(value=WHEN[0])
+        self.test_var = tk.StringVar()
+        self.suite_var = tk.StringVar()
+        self.tags_var = tk.StringVar()
+        self.hits_var = tk.StringVar()
+        self.condition_var = tk.StringVar()
+
+        row = tk.Frame(form)
+        row.pack(fill=tk.X, pady=(0, 3))
+        tk.Label(row, text="Keyword:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
+        tk.Entry(row, textvariable=self.keyword_var, width=30, font=("Consolas", 9)).pack(side=tk.LEFT, padx=3)
+        ttk.Combobox(row, textvariable=self.when_var, values=list(WHEN), state="readonly",
+                     width=7).pack(side=tk.LEFT, padx=3)
+        tk.Label(row, text="Hit count >=", font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=(6, 0))
+        tk.Entry(row, textvariable=self.hits_var, width=5, font=("Consolas", 9)).pack(side=tk.LEFT, padx=3)
+        tk.Label(row, text="Condition:", font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=(6, 0))
+        tk.Entry(row, textvariable=self.condition_var, width=30, font=("Consolas", 9)).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=3)
+
+        row = tk.Frame(form)
+        row.pack(fill=tk.X)
+        for label, var in (("Test:", self.test_var), ("Suite:", self.suite_var), ("Tags:", self.tags_var)):
+            tk.Label(row, text=label, font=("Segoe UI", 9)).pack(side=tk.LEFT)
+            tk.Entry(row, textvariable=var, width=18, font=("Consolas", 9)).pack(side=tk.LEFT, padx=(3, 8))
+        tk.Button(row, text="[+] Add", command=self._add, bg="#4CAF50", fg="white",
+                  font=("Segoe UI", 9), padx=10, pady=2).pack(side=tk.LEFT, padx=2)
+
+        tk.Label(
+            self,
+            text="[i] Keyword: exact name, Library.Keyword or glob (* = every keyword). "
+                 "Test/Suite: globs. Tags: Robot tag pattern (smokeANDui, NOTwip). "
+                 "Condition: as in IF, e.g. $count > 3 or '${status}' == 'ok'",
+            font=("Segoe UI", 8, "italic"), fg="#666666", anchor='w', justify=tk.LEFT
+        ).pack(fill=tk.X, padx=8)
+
+        list_frame = tk.Frame(self)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.tree = ttk.Treeview(list_frame, columns=("on", "when", "scope", "sites", "hits", "condition"),
+                                 show="tree headings", selectmode="browse", height=6)
+        self.tree.heading("#0", text="Keyword")
+        self.tree.heading("on", text="On")
+        self.tree.heading("when", text="When")
+        self.tree.heading("scope", text="Test / Suite / Tags")
+        self.tree.heading("sites", text="Call Sites")
+        self.tree.heading("hits", text="Hits")
+        self.tree.heading("condition", text="Condition")
+        self.tree.column("#0", width=220, stretch=True)
+        self.tree.column("on", width=40, stretch=False, anchor="center")
+        self.tree.column("when", width=60, stretch=False, anchor="center")
+        self.tree.column("scope", width=200, stretch=True)
+        self.tree.column("sites", width=70, stretch=False, anchor="e")
+        self.tree.column("hits", width=70, stretch=False, anchor="e")
+        self.tree.column("condition", width=200, stretch=True)
+        self.tree.tag_configure("paused", background="#ffe3e3")
+        self.tree.tag_configure("disabled", foreground="#999999")
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.LEFT, fill=tk.Y)
+        self.tree.bind("<Double-1>", lambda e: self._toggle())
+
+        buttons = tk.Frame(self)
+        buttons.pack(fill=tk.X, padx=5, pady=(0, 5))
+        tk.Button(buttons, text="Enable/Disable", command=self._toggle, font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=2)
+        tk.Button(buttons, text="[-] Remove", command=self._remove, bg="#f44336", fg="white",
+                  font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=2)
+        tk.Button(buttons, text="[CLEAR] All", command=self._clear, bg="#FFE4E1",
+                  font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=2)
+        self.continue_btn = tk.Button(buttons, text="[>] Continue", command=self._continue, bg="#4CAF50",
+                                      fg="white", font=("Segoe UI", 9, "bold"), state=tk.DISABLED)
+        self.continue_btn.pack(side=tk.RIGHT, padx=2)
+        self._paused_id = None
+
+    def _add(self):
+        try:
+            breakpoint = Breakpoint(
+                keyword=self.keyword_var.get(),
+                when=self.when_var.get(),
+                test=self.test_var.get(),
+                suite=self.suite_var.get(),
+                tags=self.tags_var.get(),
+                hit_count=self.hits_var.get().strip() or 0,
+                condition=self.condition_var.get()
+            )
+        except (ValueError, SyntaxError) as e:
+            messagebox.showerror("Invalid Breakpoint", str(e))
+            return
+        self.breakpoints.add(breakpoint)
+        self.condition_var.set("")
+        self.hits_var.set("")
+        self.refresh()
+        sites = self.resolve(breakpoint) if self.resolve else None
+        if sites:
+            where = format_location(sites[0].source, sites[0].lineno)
+            self._changed(f"Breakpoint added: {breakpoint.describe()} - {len(sites)} call site(s), first at {where}")
+        elif sites is not None:
+            self._changed(f"Breakpoint added: {breakpoint.describe()} - no static call site found")
+        else:
+            self._changed(f"Breakpoint added: {breakpoint.describe()}")
+
+    def _selected_id(self):
+        selection = self.tree.selection()
+        return int(selection[0]) if selection else None
+
+    def _toggle(self):
+        bp_id = self._selected_id()
+        breakpoint = next((bp for bp in self.breakpoints if bp.id == bp_id), None)
+        if breakpoint is not None:
+            self.breakpoints.set_enabled(bp_id, not breakpoint.enabled)
+            self.refresh()
+
+    def _remove(self):
+        bp_id = self._selected_id()
+        if bp_id is not None:
+            self.breakpoints.remove(bp_id)
+            self.refresh()
+            self._changed("Breakpoint removed")
+
+    def _clear(self):
+        if len(self.breakpoints):
+            self.breakpoints.clear()
+            self.refresh()
+            self._changed("All breakpoints cleared")
+
+    def _continue(self):
+        self.show_paused(None)
+        self.on_continue()
+
+    def _changed(self, text):
+        if self.on_change:
+            self.on_change(text)
+
+    def show_paused(self, breakpoint):
+        """Highlight the breakpoint execution is paused at (None when running again)."""
+        self._paused_id = breakpoint.id if breakpoint is not None else None
+        self.continue_btn.config(state=tk.NORMAL if breakpoint is not None else tk.DISABLED)
+        self.refresh()
+
+    def refresh(self):
+        """Redraw the list; hit counts change while the suite runs."""
+        self.tree.delete(*self.tree.get_children())
+        for bp in self.breakpoints:
+            scope = " / ".join(part or "*" for part in (bp.test, bp.suite, bp.tags))
+            hits = f"{bp.hits} / {bp.hit_count}" if bp.hit_count else str(bp.hits)
+            sites = self.resolve(bp) if self.resolve else None
+            tags = ("paused",) if bp.id == self._paused_id else () if bp.enabled else ("disabled",)
+            self.tree.insert("", tk.END, iid=str(bp.id), text=bp.keyword, tags=tags,
+                             values=("yes" if bp.enabled else "no", bp.when, scope,
+                                     "?" if sites is None else len(sites), hits, bp.condition))
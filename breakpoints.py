@@ -0,0 +1,221 @@
+# breakpoints.py
+import fnmatch
+import itertools
+import logging
+import re
+import threading
+from functools import lru_cache
+from io import StringIO
+from tokenize import generate_tokens, untokenize, NAME, TokenError
+from robot.model import TagPatterns
+from robot.variables.evaluation import EvaluationNamespace
+from .arg_converters import normalize_name
+
+logger = logging.getLogger(__name__)
+
+WHEN = ("before", "after")  # Pause in start_keyword or end_keyword
+RESOLVED_CACHE_SIZE = 2000  # Keyword names whose matching breakpoints are memoized
+TEXT_VARIABLE = re.compile(r"[$@&%]\{[^{}]*\}")  # Only for the syntax check, see check_condition
+
+
+@lru_cache(maxsize=256)
+def compile_condition(expression):
+    """
+    Code object for a condition, compiled once per expression text.
+    `$name` refers to a Robot variable, looked up when the condition is
+    evaluated; `${name}` is replaced as text before this, see evaluate_condition.
+    """
+    expression = expression.strip()
+    if "$" in expression:
+        tokens = []
+        dollar = False
+        try:
+            for toknum, tokval, _, _, _ in generate_tokens(StringIO(expression).readline):
+                if dollar and toknum == NAME:
+                    tokens[-1] = (NAME, "RF_VAR_" + tokval)
+                else:
+                    tokens.append((toknum, tokval))
+                dollar = tokval == "$"
+        except TokenError as e:  # Unbalanced brackets; reported like any other syntax error
+            raise SyntaxError(f"{e.args[0]} in condition {expression!r}") from None
+        expression = untokenize(tokens).strip()
+    return compile(expression, "<breakpoint condition>", "eval")
+
+
+def check_condition(expression):
+    """Raise SyntaxError for a condition that cannot compile, whatever its `${name}` values are."""
+    compile_condition(TEXT_VARIABLE.sub("RF_TEXT", expression))
+
+
+def evaluate_condition(expression, variables):
+    """
+    Evaluate like Robot's IF and WHILE: `${name}` is substituted as text
+    first (so quote it for strings: `'${name}' == 'abc'`), `$name` is the
+    variable object itself. `variables` is Robot's current Variables.
+    """
+    if "{" in expression:
+        expression = variables.replace_scalar(expression)
+        if not isinstance(expression, str):
+            return bool(expression)  # The whole condition was one variable
+    namespace = {}
+    return bool(eval(compile_condition(expression), namespace, EvaluationNamespace(variables.store, namespace)))
+
+
+def _glob(pattern):
+    return re.compile(fnmatch.translate(pattern.strip()), re.IGNORECASE) if pattern and pattern.strip() else None
+
+
+class Breakpoint:
+    """
+    Pause before or after keywords whose name matches `keyword` (exact,
+    Library.Keyword or glob; "*" for every keyword), optionally limited to
+    tests/suites matching a glob and tests whose tags match a Robot tag
+    pattern (`smoke`, `smokeANDslow`, `NOTwip`). Hits are counted once the
+    keyword is in scope; with `hit_count` the breakpoint only pauses from
+    that hit on, and `condition` is evaluated only after that.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, keyword="*", when="before", test="", suite="", tags="", hit_count=0, condition=""):
+        if when not in WHEN:
+            raise ValueError(f"when must be one of {', '.join(WHEN)}")
+        if condition:
+            check_condition(condition)  # SyntaxError surfaces when the breakpoint is added
+        self.id = next(self._ids)
+        self.keyword = keyword.strip() or "*"
+        self.when = when
+        self.test = test.strip()
+        self.suite = suite.strip()
+        self.tags = tags.strip()
+        self.hit_count = int(hit_count or 0)
+        self.condition = condition.strip()
+        self.enabled = True
+        self.hits = 0
+        self.is_glob = any(c in self.keyword for c in "*?[")
+        self._keyword_re = _glob(self.keyword) if self.is_glob else None
+        self._test_re = _glob(self.test)
+        self._suite_re = _glob(self.suite)
+        self._tags = TagPatterns(self.tags) if self.tags else None
+
+    def matches_name(self, name, full_name=None):
+        return bool(self._keyword_re.match(name) or (full_name and self._keyword_re.match(full_name)))
+
+    def in_scope(self, test, suite, tags):
+        if self._test_re is not None and not (test and self._test_re.match(test)):
+            return False
+        if self._suite_re is not None and not (suite and self._suite_re.match(suite)):
+            return False
+        return self._tags is None or self._tags.match(tags or ())
+
+    def describe(self):
+        parts = [f"{self.when} '{self.keyword}'"]
+        if self.test:
+            parts.append(f"test '{self.test}'")
+        if self.suite:
+            parts.append(f"suite '{self.suite}'")
+        if self.tags:
+            parts.append(f"tags {self.tags}")
+        if self.hit_count:
+            parts.append(f"hit >= {self.hit_count}")
+        if self.condition:
+            parts.append(f"if {self.condition}")
+        return ", ".join(parts)
+
+
+class BreakpointSet:
+    """
+    All breakpoints, edited from the GUI and checked from the listener hooks.
+
+    `active` is False while no breakpoint is enabled, so hooks skip
+    everything with one attribute check. Otherwise the breakpoints for a
+    keyword name are found with a dict lookup: exact names are indexed by
+    normalized name and glob results are memoized per name. Scope filters
+    and hit counts come next; conditions are evaluated last.
+    Edits rebuild the indexes and swap them in whole.
+    """
+
+    def __init__(self):
+        self.active = False
+        self._lock = threading.Lock()
+        self._breakpoints = []
+        self._exact = {}  # Normalized name -> [Breakpoint]
+        self._globs = []
+        self._resolved = {}  # (normalized name, normalized full name) -> (Breakpoint, ...)
+
+    def __iter__(self):
+        return iter(list(self._breakpoints))
+
+    def __len__(self):
+        return len(self._breakpoints)
+
+    def add(self, breakpoint):
+        with self._lock:
+            self._breakpoints.append(breakpoint)
+            self._rebuild()
+        return breakpoint
+
+    def remove(self, bp_id):
+        with self._lock:
+            self._breakpoints = [bp for bp in self._breakpoints if bp.id != bp_id]
+            self._rebuild()
+
+    def clear(self):
+        with self._lock:
+            self._breakpoints = []
+            self._rebuild()
+
+    def set_enabled(self, bp_id, enabled):
+        with self._lock:
+            for bp in self._breakpoints:
+                if bp.id == bp_id:
+                    bp.enabled = enabled
+            self._rebuild()
+
+    def _rebuild(self):
+        exact, globs = {}, []
+        for bp in self._breakpoints:
+            if not bp.enabled:
+                continue
+            if bp.is_glob:
+                globs.append(bp)
+            else:
+                exact.setdefault(normalize_name(bp.keyword), []).append(bp)
+        self._exact, self._globs, self._resolved = exact, globs, {}
+        self.active = bool(exact or globs)
+
+    def _candidates(self, name, full_name):
+        key = (normalize_name(name), normalize_name(full_name) if full_name else "")
+        resolved = self._resolved
+        found = resolved.get(key)
+        if found is None:
+            exact = self._exact
+            found = tuple(exact.get(key[0], ())) + (tuple(exact.get(key[1], ())) if key[1] else ())
+            found += tuple(bp for bp in self._globs if bp.matches_name(name, full_name))
+            if len(resolved) >= RESOLVED_CACHE_SIZE:
+                resolved.clear()
+            resolved[key] = found
+        return found
+
+    def match(self, name, full_name, when, test=None, suite=None, tags=(), variables=None):
+        """
+        (Breakpoint, condition error or None) for the first breakpoint that
+        should pause, or None. `variables` is a callable returning Robot's
+        current Variables, only called when a condition is evaluated.
+        A condition that fails to evaluate pauses, so the error is seen.
+        """
+        for bp in self._candidates(name, full_name):
+            if bp.when != when or not bp.in_scope(test, suite, tags):
+                continue
+            bp.hits += 1
+            if bp.hit_count and bp.hits < bp.hit_count:
+                continue
+            if not bp.condition:
+                return bp, None
+            try:
+                if evaluate_condition(bp.condition, variables()):
+                    return bp, None
+            except Exception as e:
+                logger.warning(f"[Debugger] Breakpoint condition '{bp.condition}' failed: {e}")
+                return bp, f"{type(e).__name__}: {e}"
+        return None
@@ -0,0 +1,74 @@
+# call_tree_view.py
+import os
+import tkinter as tk
+from tkinter import ttk
+
+
+def format_location(source, lineno):
+    return f"{os.path.basename(source)}:{lineno}" if source else ""
+
+
+class CallTreeWindow(tk.Toplevel):
+    """
+    Static call tree of one test from the SuiteIndex: setup, body steps and
+    teardown as written, with file:line. Keywords defined in suite files can
+    be expanded into their own steps; those are added when a node is opened.
+    """
+
+    def __init__(self, parent, index, entry):
+        super().__init__(parent)
+        self.index = index
+        self.title(f"[TREE] {entry.name}")
+        self.geometry("760x480")
+        self.minsize(500, 300)
+        self.transient(parent)
+        self._expandable = {}  # Placeholder item -> (keyword name, suite file)
+
+        tags = f"   [{', '.join(entry.tags)}]" if entry.tags else ""
+        tk.Label(
+            self,
+            text=f"Test {entry.position + 1} of {len(index.tests)}: {entry.longname}{tags}",
+            font=("Segoe UI", 10, "bold"), bg="#4A90E2", fg="white", anchor="w", padx=10, pady=6
+        ).pack(fill=tk.X)
+
+        frame = tk.Frame(self)
+        frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.tree = ttk.Treeview(frame, columns=("args", "location"), selectmode="browse")
+        self.tree.heading("#0", text="Keyword")
+        self.tree.heading("args", text="Arguments")
+        self.tree.heading("location", text="Location")
+        self.tree.column("#0", width=280, stretch=True)
+        self.tree.column("args", width=280, stretch=True)
+        self.tree.column("location", width=160, stretch=False)
+        self.tree.tag_configure("fixture", foreground="#6c757d")
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.LEFT, fill=tk.Y)
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+
+        if entry.setup is not None:
+            self._insert("", entry.setup, "[Setup] ", ("fixture",))
+        for site in entry.calls:
+            self._insert("", site)
+        if entry.teardown is not None:
+            self._insert("", entry.teardown, "[Teardown] ", ("fixture",))
+
+    def _insert(self, parent, site, prefix="", tags=()):
+        indent = "    " * site.depth  # Nesting inside FOR/IF/TRY blocks
+        item = self.tree.insert(parent, tk.END, text=f"{indent}{prefix}{site.name}", tags=tags,
+                                values=("  ".join(site.args), format_location(site.source, site.lineno)))
+        if self.index.user_keyword(site.name, site.source) is not None:
+            placeholder = self.tree.insert(item, tk.END, text="...")
+            self._expandable[placeholder] = (site.name, site.source)
+        return item
+
+    def _on_open(self, event=None):
+        item = self.tree.focus()
+        children = self.tree.get_children(item)
+        if len(children) != 1 or children[0] not in self._expandable:
+            return
+        name, source = self._expandable.pop(children[0])
+        self.tree.delete(children[0])
+        for site in self.index.user_keyword(name, source)[3]:
+            self._insert(item, site)
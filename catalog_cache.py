@@ -0,0 +1,233 @@
+# catalog_cache.py
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from robot.version import get_version
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = 4  # Bump when the entry layout changes
+
+
+def default_cache_dir():
+    return os.path.join(os.path.expanduser("~"), ".rfdb", "catalog")
+
+
+def _package_stamp(path):
+    """Digest of the (relative path, mtime_ns, size) of every .py file under a package directory."""
+    stats = []
+    for folder, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d != "__pycache__" and not d.startswith(".")]
+        for filename in files:
+            if filename.endswith(".py"):
+                full = os.path.join(folder, filename)
+                stat = os.stat(full)
+                stats.append((os.path.relpath(full, path), stat.st_mtime_ns, stat.st_size))
+    stats.sort()
+    return hashlib.sha1(json.dumps(stats).encode("utf-8")).hexdigest()
+
+
+def _source_stamp(source):
+    """
+    Identity of a library source: (path, mtime_ns, size) of a module file,
+    or (path, digest) of a package, which covers all of its modules so
+    editing a submodule also misses the cache.
+    """
+    if not source:
+        return None
+    path = str(source)
+    if os.path.basename(path) == "__init__.py":
+        path = os.path.dirname(path)  # Robot reports a package library by its __init__.py
+    try:
+        if os.path.isdir(path):
+            return os.path.abspath(path), _package_stamp(path)
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+class CachedArg:
+    """Argument spec restored from the cache, read like libdoc's ArgInfo (name, kind, default, type)."""
+
+    __slots__ = ("name", "kind", "default", "_type_text", "_type")
+
+    def __init__(self, name, kind, default=None, type_text=None):
+        self.name = name
+        self.kind = kind
+        self.default = default  # Default value as text, None when required
+        self._type_text = type_text
+        self._type = None
+
+    @classmethod
+    def from_arg(cls, arg):
+        required = getattr(arg, "required", True)
+        default = None if required else getattr(arg, "default_repr", None)
+        type_info = getattr(arg, "type", None)
+        return cls(arg.name, str(arg.kind), default, str(type_info) if type_info else None)
+
+    def to_json(self):
+        return [self.name, self.kind, self.default, self._type_text]
+
+    @property
+    def required(self):
+        return self.default is None and self.kind in ("POSITIONAL_ONLY", "POSITIONAL_OR_NAMED", "NAMED_ONLY")
+
+    @property
+    def type(self):
+        """TypeInfo parsed on first use, so unused keywords cost nothing."""
+        if self._type is None and self._type_text:
+            try:
+                from robot.running.arguments.typeinfo import TypeInfo
+                self._type = TypeInfo.from_string(self._type_text)
+            except Exception as e:
+                logger.debug(f"[Debugger GUI] Cannot parse cached type '{self._type_text}': {e}")
+                self._type_text = None
+        return self._type
+
+    def __str__(self):
+        prefix = {"VAR_POSITIONAL": "*", "VAR_NAMED": "**"}.get(self.kind, "")
+        text = prefix + self.name
+        if self._type_text:
+            text += f": {self._type_text}"
+        if self.default is not None:
+            text += f" = {self.default}" if self._type_text else f"={self.default}"
+        return text
+
+
+class CatalogCache:
+    """
+    One JSON file per loaded library under `directory`, holding keyword
+    names, argument specs (with types) and source locations. Docs go to a
+    `.docs` side file next to it; the entry keeps each doc's byte offset and
+    length, so a doc lookup is one seek and read. Dynamic libraries are
+    stored with names only ("lazy"); their arguments and docs are still
+    fetched from the library when a keyword is looked at.
+
+    Entries are keyed by library name, version, import arguments, Robot
+    version and the source file's path/mtime/size, so editing or upgrading
+    a library simply misses the cache. Files are written to a temp file and
+    moved into place with os.replace, so parallel Robot processes sharing
+    the directory only ever see complete entries.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or default_cache_dir()
+
+    def key(self, name, version=None, args=(), source=None):
+        """Cache key, or None when the library has no source file to validate against."""
+        stamp = _source_stamp(source)
+        if stamp is None:
+            return None
+        identity = [CACHE_FORMAT, get_version(), name, str(version or ""), [str(a) for a in args or ()], *stamp]
+        return hashlib.sha1(json.dumps(identity).encode("utf-8")).hexdigest()[:20]
+
+    def _prefix(self, name):
+        return re.sub(r"[^\w.-]", "_", name)[:80] + "-"
+
+    def _path(self, name, key, suffix=".json"):
+        return os.path.join(self.directory, f"{self._prefix(name)}{key}{suffix}")
+
+    def _read(self, name, key):
+        try:
+            with open(self._path(name, key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"[Debugger GUI] Unreadable catalog cache entry for '{name}': {e}")
+            return None
+        return entry if entry.get("format") == CACHE_FORMAT else None
+
+    def load(self, name, key):
+        """
+        (library name, keyword names, {name: args}, lazy, {name: (source, line)},
+        {name: doc span}) or None on a miss. Spans are passed to `load_doc`.
+        """
+        entry = self._read(name, key)
+        if entry is None:
+            return None
+        names = [kw[0] for kw in entry["keywords"]]
+        args = {kw[0]: [CachedArg(*arg) for arg in kw[1]] for kw in entry["keywords"] if kw[1] is not None}
+        sources = entry.get("sources", [])
+        locations = {kw[0]: (sources[kw[3]], kw[4]) for kw in entry["keywords"] if kw[3] is not None}
+        spans = {kw[0]: kw[2] for kw in entry["keywords"] if kw[2] is not None}
+        return entry["library"], names, args, entry.get("lazy", False), locations, spans
+
+    def load_doc(self, name, key, span):
+        """Doc at an (offset, length) span of the entry's side file, read on demand."""
+        offset, length = span
+        try:
+            with open(self._path(name, key, ".docs"), "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+        except OSError as e:
+            logger.debug(f"[Debugger GUI] Unreadable catalog doc file for '{name}': {e}")
+            return None
+        return data.decode("utf-8", "replace") if len(data) == length else None
+
+    def store(self, name, key, library):
+        """Write an entry for a LibrarySource atomically and drop older entries of the same library."""
+        keywords = []
+        docs = []  # Encoded docs, concatenated into the side file
+        offset = 0
+        sources = {}  # Source file -> index in the entry's "sources" list
+        locations = library.locations()
+        for kw_name in library.names:
+            source, lineno = locations.get(kw_name, (None, None))
+            source_index = sources.setdefault(source, len(sources)) if source else None
+            if library.lazy:
+                keywords.append([kw_name, None, None, source_index, lineno])
+            else:
+                args, doc = library.describe(kw_name)
+                span = None
+                if doc is not None:
+                    data = str(doc).encode("utf-8")
+                    docs.append(data)
+                    span = [offset, len(data)]
+                    offset += len(data)
+                keywords.append([kw_name, [CachedArg.from_arg(arg).to_json() for arg in args], span,
+                                 source_index, lineno])
+        entry = {"format": CACHE_FORMAT, "library": library.name, "lazy": library.lazy,
+                 "sources": list(sources), "keywords": keywords}
+        path = self._path(name, key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Side file first: an entry is only visible once the docs it points into are in place
+            self._write_atomic(self._path(name, key, ".docs"), lambda f: f.write(b"".join(docs)))
+            self._write_atomic(path, lambda f: f.write(
+                json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8")))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"[Debugger GUI] Cannot write catalog cache for '{name}': {e}")
+            return
+        self._prune(name, key)
+
+    def _write_atomic(self, path, write):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _prune(self, name, keep_key):
+        prefix = self._prefix(name)
+        try:
+            stale = [f for f in os.listdir(self.directory)
+                     if f.startswith(prefix) and f.endswith((".json", ".docs"))]
+        except OSError:
+            return
+        for filename in stale:
+            path = os.path.join(self.directory, filename)
+            entry_key = filename[len(prefix):-5]
+            if entry_key == keep_key or "-" in entry_key:
+                continue  # Keep the new entry and entries of libraries whose name extends this one
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Already removed by another process
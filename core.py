@@ -6,13 +6,27 @@ import tkinter as tk
 from robot.libraries.BuiltIn import BuiltIn
 from datetime import datetime
 from copy import deepcopy
+from .variable_history import VariableHistory, VariableSnapshotter
+from .variable_scopes import ScopedVariableCache, SCOPE_SETTERS, VAR_SCOPES
+from .pass_baseline import BaselineStore, BaselineRecorder, PassDiff
+from .options import DebuggerOptions
+from .keyword_trace import KeywordTrace
+from .loop_aggregator import LoopTracker
+from .output_import import RunBaseline, RunEstimator
+from .ignore_rules import IgnoreRules, load_profile
+from .breakpoints import BreakpointSet
+from .suite_index import SuiteIndex
+
+logger = logging.getLogger(__name__)
 
 class SimpleRetryCore:
     ROBOT_LISTENER_API_VERSION = 3
     GUI_TIMEOUT_SECONDS = 300  # 5 minutes max wait for GUI response
     MAX_SEEN_KEYWORDS = 500  # Limit tracked keywords to prevent unbounded growth
+    VARIABLE_HISTORY_BUDGET_BYTES = 4 * 1024 * 1024  # Memory budget for time-travel variable history
 
-    def __init__(self):
+    def __init__(self, options=None):
+        self.options = options or DebuggerOptions()
         self.builtin = BuiltIn()
         self.failed_keyword = None
         self.current_test = None
@@ -25,16 +39,61 @@ class SimpleRetryCore:
         self.skip_keyword = False
         self.call_stack = []
         self.keyword_stack = []
+        self.current_test_tags = ()
         
         # Test start control
         self.test_start_event = threading.Event()
         self._test_started = False
         
         # Keyword ignore functionality with memory limits
-        self.ignored_keywords = set()  # Exact keyword names to ignore
+        self.ignored_keywords = IgnoreRules()  # Names, globs, regexes and message patterns to ignore
         self.seen_keywords = set()  # Track all keywords seen during execution
         self._seen_keywords_queue = []  # Track insertion order for LRU eviction
 
+        # Time-travel variable history (disabled until enabled from the Variable Inspector)
+        self.variable_history = None
+        self._variable_snapshotter = VariableSnapshotter()
+
+        # Diff vs last passing run (disabled until enabled from the Variable Inspector)
+        self.pass_baseline_store = None
+        self._baseline_recorder = None
+        self.pass_diff = None
+
+        # Per-scope variable views, invalidated only when a scope changes
+        self.variable_scopes = ScopedVariableCache()
+        self._in_test = False
+
+        # Live keyword trace (level from listener args or the GUI; "off" is a single flag check)
+        self.trace = KeywordTrace(self.options.trace, self.options.trace_rate)
+
+        # FOR/WHILE loops are aggregated into one summary instead of per-keyword work
+        self.loops = LoopTracker()
+
+        # Previous run's output.xml (listener arg baseline_output=), parsed in the background
+        self.run_baseline = None
+        self.run_estimator = None
+        self._planned_tests = None
+        self._plan_lock = threading.Lock()  # Index and baseline threads publish plan and estimator under it
+        self._tests_finished = 0
+        self._baseline_seeded = False
+
+        # Static index of the whole run (tests, tags, keyword call sites), built in the background
+        self.suite_index = None
+        if self.options.baseline_output:
+            threading.Thread(
+                target=self._load_run_baseline,
+                args=(self.options.baseline_output,),
+                daemon=True
+            ).start()
+
+        # Breakpoints ("active" stays False until one is enabled, so hooks pay a single flag check)
+        self.breakpoints = BreakpointSet()
+        self.paused_at_breakpoint = None
+
+        # Saved ignore rules (listener arg ignore_profile=)
+        if self.options.ignore_profile:
+            self.load_ignore_profile(self.options.ignore_profile)
+
         raw_mutes = {
             "Run Keyword And Ignore Error",
             "Run Keyword And Expect Error",
@@ -43,36 +102,36 @@ class SimpleRetryCore:
         }
         self.muting_keywords = {kw.strip().lower() for kw in raw_mutes}
 
-        logging.basicConfig(
-            filename="retry_debug.log",
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s"
-        )
-
     def start_suite(self, data, result):
         self.current_suite = data.name
+        self.variable_scopes.invalidate_all()
+
+        # The first suite is the whole run: index it off the Robot thread
+        if self.suite_index is None:
+            self.suite_index = SuiteIndex.build(data, self._on_suite_indexed)
         
         # Wait for user to click Start button (only once per execution)
         if not self._test_started:
             self._test_started = True
-            logging.info(f"Suite ready: {self.current_suite}. Waiting for user to start...")
+            logger.info(f"Suite ready: {self.current_suite}. Waiting for user to start...")
             
             if self.gui_controller and getattr(self.gui_controller, "gui_ready", False):
                 self.gui_controller.show_ready_state(data.name)
             
             # Block until user clicks Start button
             self.test_start_event.wait()
-            logging.info("User started test execution")
+            logger.info("User started test execution")
             
             if self.gui_controller:
                 self.gui_controller.show_running_state()
         
-        logging.info(f"Suite started: {self.current_suite}")
+        logger.info(f"Suite started: {self.current_suite}")
         if self.gui_controller and getattr(self.gui_controller, "gui_ready", False):
             if hasattr(self.gui_controller, "log_suite_start"):
                 self.gui_controller.log_suite_start(data)
 
     def end_suite(self, data, result):
+        self.variable_scopes.invalidate_all()
         if self.gui_controller and getattr(self.gui_controller, "gui_ready", False):
             self.gui_controller.update_status("Suite finished", "green")
 
@@ -86,14 +145,31 @@ class SimpleRetryCore:
                     try:
                         self.gui_controller.root.after(0, self.gui_controller.root.quit)
                     except Exception as e:
-                        logging.warning(f"Safe GUI shutdown failed: {e}")
+                        logger.warning(f"Safe GUI shutdown failed: {e}")
 
             self.gui_controller.root.after(1000, ask_to_close)
 
     def start_test(self, data, result):
         self.current_test = data.name
+        self.current_test_tags = result.tags  # Live: reflects Set Tags / Remove Tags
         self.skip_test = False  # Reset skip flag for new test
-        logging.info(f"Test started: {self.current_test}")
+        self._in_test = True
+        self.variable_scopes.invalidate("test")
+        logger.info(f"Test started: {self.current_test}")
+
+        # Compare against the previous run's output.xml once it is loaded
+        if self.run_baseline is not None:
+            if not self._baseline_seeded:
+                self._seed_seen_keywords(self.run_baseline.keyword_names())
+                self._baseline_seeded = True
+            self.run_estimator.test_started(self._test_longname(data))
+
+        # Load last passing baseline and start recording this run's positions
+        if self.pass_baseline_store is not None:
+            longname = self._test_longname(data)
+            self._baseline_recorder = BaselineRecorder(longname)
+            record = self.pass_baseline_store.load(longname)
+            self.pass_diff = PassDiff(record) if record else None
 
         # Stack view
         if self.gui_controller:
@@ -112,14 +188,29 @@ class SimpleRetryCore:
                 threading.Timer(0.5, delayed_log).start()
 
     def end_test(self, data, result):
+        self._in_test = False
+        self._tests_finished += 1
+        self.current_test_tags = ()
+        self.variable_scopes.invalidate("test")
         # If skip_test was triggered, mark test as failed but continue to next test
         if self.skip_test:
             result.status = 'FAIL'
             result.message = 'Test skipped by user'
             self.skip_test = False
-            logging.info(f"Test '{data.name}' was skipped by user - moving to next test")
+            logger.info(f"Test '{data.name}' was skipped by user - moving to next test")
         
-        logging.info(f"Test ended: {data.name} | Status: {result.status}")
+        logger.info(f"Test ended: {data.name} | Status: {result.status}")
+
+        if self.run_estimator is not None:
+            elapsed = getattr(result, "elapsed_time", None)
+            self.run_estimator.test_ended(
+                self._test_longname(data), elapsed.total_seconds() if elapsed is not None else None
+            )
+
+        # Only passing runs become the new baseline
+        recorder, self._baseline_recorder = self._baseline_recorder, None
+        if recorder is not None and self.pass_baseline_store is not None and result.status == 'PASS':
+            self.pass_baseline_store.save_async(recorder.longname, recorder.to_record())
 
         if self.gui_controller:
             if getattr(self.gui_controller, "gui_ready", False):
@@ -135,6 +226,18 @@ class SimpleRetryCore:
     def start_keyword(self, data, result):
         # Store full keyword data object for accurate trace
         self.keyword_stack.append(data)
+
+        # 🔁 Loop bookkeeping (loops themselves arrive through the loop hooks below)
+        if self.loops.active:
+            self.loops.count_call()
+
+        # Inside loops only the first iteration is traced; the rest is summarized at loop end
+        if self.trace.enabled and self.loops.sampling:
+            self._trace_keyword_start(data)
+
+        # 🔴 Breakpoints before the keyword runs
+        if self.breakpoints.active:
+            self._check_breakpoint(data, result, "before")
         
         # Track all keywords seen during execution with memory limit
         if hasattr(data, 'name'):
@@ -149,22 +252,35 @@ class SimpleRetryCore:
                 if len(self.seen_keywords) > self.MAX_SEEN_KEYWORDS:
                     oldest = self._seen_keywords_queue.pop(0)
                     self.seen_keywords.discard(oldest)
-                    logging.debug(f"[Debugger] Evicted oldest keyword from seen_keywords: {oldest}")
+                    logger.debug(f"[Debugger] Evicted oldest keyword from seen_keywords: {oldest}")
 
     from copy import deepcopy
     from uuid import uuid4
 
-    def end_keyword(self, data, result):
+    def end_keyword(self, data, result, user_keyword=None):
         current_kw = self.keyword_stack[-1] if self.keyword_stack else data
         normalized_name = self._normalize_keyword_name(current_kw.name)
 
-        # 🔍 Check if keyword is in user's ignore list (case-insensitive, applies to entire execution)
+        if self.trace.enabled and (self.loops.sampling or result.status == "FAIL"):
+            self._trace_keyword_end(current_kw, result, user_keyword)
+
+        # 🕰️ Record variable snapshot for history / pass baseline (no cost when both disabled)
+        if self.variable_history is not None or self._baseline_recorder is not None:
+            self._record_variable_snapshot(current_kw.name, result)
+
+        # 🔄 Invalidate cached variable scopes this keyword may have written to
+        self._invalidate_written_scopes(current_kw, normalized_name)
+
+        # 🔍 Check if the failure matches the user's ignore rules (applies to entire execution)
         # Convert failure to PASS so test continues without interruption
-        normalized_ignored = {self._normalize_keyword_name(kw) for kw in self.ignored_keywords}
-        if normalized_name in normalized_ignored and result.status == 'FAIL':
+        ignore_rule = None
+        if result.status == 'FAIL' and self.ignored_keywords:
+            ignore_rule = self.ignored_keywords.match(
+                current_kw.name, getattr(result, 'full_name', None), result.message)
+        if ignore_rule is not None:
             result.status = 'PASS'
             result.message = f"[Ignored by debugger] Original failure: {result.message}"
-            logging.info(f"[Debugger] Auto-ignored failure in '{current_kw.name}' - marked as PASS")
+            logger.info(f"[Debugger] Auto-ignored failure in '{current_kw.name}' (rule '{ignore_rule}') - marked as PASS")
             if self.keyword_stack:
                 self.keyword_stack.pop()
             return
@@ -178,7 +294,7 @@ class SimpleRetryCore:
 
         # ✅ If failure is inside wrapper, skip GUI but let Robot handle it
         if result.status == 'FAIL' and muted_parent:
-            logging.info(f"[Debugger] Ignoring failure inside wrapper '{muted_parent}'. Robot will handle it.")
+            logger.info(f"[Debugger] Ignoring failure inside wrapper '{muted_parent}'. Robot will handle it.")
             if self.keyword_stack:
                 self.keyword_stack.pop()
             return
@@ -187,7 +303,7 @@ class SimpleRetryCore:
         if self.abort_suite:
             result.status = 'FAIL'
             result.message = 'Suite aborted by user'
-            logging.warning("Suite aborted by user.")
+            logger.warning("Suite aborted by user.")
             if self.keyword_stack:
                 self.keyword_stack.pop()
             return
@@ -197,11 +313,15 @@ class SimpleRetryCore:
             # Convert to PASS so remaining keywords are skipped without blocking
             result.status = 'PASS'
             result.message = 'Keyword skipped (test skip in progress)'
-            logging.info(f"Skipping keyword '{current_kw.name}' - test skip in progress")
+            logger.info(f"Skipping keyword '{current_kw.name}' - test skip in progress")
             if self.keyword_stack:
                 self.keyword_stack.pop()
             return
 
+        # 🔴 Breakpoints after the keyword ran (failures pause below anyway)
+        if self.breakpoints.active and result.status != 'FAIL':
+            self._check_breakpoint(current_kw, result, "after")
+
         # 🧠 Handle real failures
         if result.status == 'FAIL' and not self.retry_success:
             self.failed_keyword = deepcopy(current_kw)
@@ -211,7 +331,7 @@ class SimpleRetryCore:
 
                 # ✅ Setup/Teardown → async show, do not block
                 if "setup" in normalized_name or "teardown" in normalized_name:
-                    logging.info(
+                    logger.info(
                         f"[Debugger] Setup/Teardown failure in '{current_kw.name}' → showing GUI async (no block)")
                     threading.Thread(
                         target=lambda: self.gui_controller.show_failure(
@@ -241,20 +361,7 @@ class SimpleRetryCore:
 
                 self.continue_event.clear()
                 self.gui_controller.root.after(0, show_failure_and_wait)
-
-                # 🔒 Block Robot but keep GUI responsive
-                while not self.continue_event.is_set():
-                    try:
-                        self.gui_controller.root.update()
-                        time.sleep(0.01)  # Prevent busy waiting and reduce CPU usage
-                    except tk.TclError as e:
-                        logging.error(f"[Debugger] GUI destroyed: {e} - auto-continuing")
-                        self.continue_event.set()
-                        break
-                    except Exception as e:
-                        logging.error(f"GUI update error during wait: {e}")
-                        # Don't break on transient errors, only on critical ones
-                        time.sleep(0.1)  # Back off a bit
+                self._wait_for_gui()
 
                 # ✅ Handle Skip and Retry actions after unblock
                 if self.skip_keyword:
@@ -265,7 +372,7 @@ class SimpleRetryCore:
                         self.builtin.log(f"[Debugger] Skipped keyword: {self.failed_keyword.name}", "WARN")
                         self.builtin.set_tags("debugger-skipped")
                     except Exception as e:
-                        logging.warning(f"Failed to log/set tag for skipped keyword: {e}")
+                        logger.warning(f"Failed to log/set tag for skipped keyword: {e}")
                     self.skip_keyword = False
                     self.failed_keyword = None
                     return
@@ -278,7 +385,7 @@ class SimpleRetryCore:
                         self.builtin.log(f"[Debugger] Retried keyword succeeded: {self.failed_keyword.name}", "INFO")
                         self.builtin.set_tags("debugger-retried")
                     except Exception as e:
-                        logging.warning(f"Failed to log/set tag for retried keyword: {e}")
+                        logger.warning(f"Failed to log/set tag for retried keyword: {e}")
                     self.retry_success = False
                     self.failed_keyword = None
                     return
@@ -286,15 +393,229 @@ class SimpleRetryCore:
         # 🔄 Refresh variable view if execution is active
         if self.gui_controller and getattr(self.gui_controller, "gui_ready", False):
             try:
-                if self.continue_event.is_set():  # Only refresh if not paused
+                # Only refresh if not paused; inside loops wait for the loop to end or fail
+                if self.continue_event.is_set() and (not self.loops.active or result.status == "FAIL"):
                     self.gui_controller.schedule_variable_refresh()
             except Exception as e:
-                logging.warning(f"Variable refresh failed: {e}")
+                logger.warning(f"Variable refresh failed: {e}")
 
         # 🧹 Pop keyword from stack
         if self.keyword_stack:
             self.keyword_stack.pop()
 
+    # === RF 7 control structure hooks ===
+    # Only loops (aggregated summaries) and VAR (variable scope cache) are followed. Control
+    # structures never get keyword_stack frames: loop context lives in self.loops instead.
+    def start_loop(self, data, result):
+        self.loops.enter(data)
+
+    def end_loop(self, data, result):
+        loop_stats = self.loops.exit()
+        if loop_stats is not None:
+            self._report_loop(loop_stats)
+        # 🔄 Refreshes were held back while looping; catch up once the outermost loop is done
+        if not self.loops.active and self.gui_controller and getattr(self.gui_controller, "gui_ready", False):
+            try:
+                if self.continue_event.is_set():
+                    self.gui_controller.schedule_variable_refresh()
+            except Exception as e:
+                logger.warning(f"Variable refresh failed: {e}")
+
+    def start_loop_iteration(self, data, result):
+        self.loops.start_iteration()
+        # 🔄 FOR assigns its loop variables without a keyword (never reaching end_keyword)
+        self._invalidate_scope("local")
+
+    def end_loop_iteration(self, data, result):
+        self.loops.end_iteration(result)
+
+    def end_var(self, data, result):
+        # 🔄 VAR writes its scope directly, without a setter keyword, and never reaches end_keyword
+        self._invalidate_scope(VAR_SCOPES.get(str(getattr(data, "scope", None) or "local").lower(), "local"))
+
+    def _wait_for_gui(self):
+        """🔒 Block Robot until the user acts (continue_event), keeping the GUI responsive."""
+        while not self.continue_event.is_set():
+            try:
+                self.gui_controller.root.update()
+                time.sleep(0.01)  # Prevent busy waiting and reduce CPU usage
+            except tk.TclError as e:
+                logger.error(f"[Debugger] GUI destroyed: {e} - auto-continuing")
+                self.continue_event.set()
+                break
+            except Exception as e:
+                logger.error(f"GUI update error during wait: {e}")
+                # Don't break on transient errors, only on critical ones
+                time.sleep(0.1)  # Back off a bit
+
+    def _check_breakpoint(self, data, result, when):
+        """Pause at the first breakpoint matching this keyword, if any."""
+        if self.abort_suite or self.skip_test:
+            return
+        hit = self.breakpoints.match(
+            data.name, getattr(result, 'full_name', None), when,
+            self.current_test, self.current_suite, self.current_test_tags,
+            lambda: self.builtin._variables.current
+        )
+        if hit is None:
+            return
+        breakpoint, error = hit
+        logger.info(f"[Debugger] Breakpoint hit {breakpoint.describe()} at '{data.name}' (hit {breakpoint.hits})")
+        if not (self.gui_controller and getattr(self.gui_controller, "gui_ready", False)):
+            return
+        stack = list(self.keyword_stack)
+        args = list(getattr(data, 'args', ()))
+
+        def show_breakpoint():
+            self.gui_controller.show_breakpoint(
+                breakpoint=breakpoint,
+                when=when,
+                suite=self.current_suite,
+                test=self.current_test,
+                keyword=data.name,
+                args=args,
+                status=result.status if when == "after" else None,
+                error=error,
+                call_stack=stack
+            )
+
+        self.paused_at_breakpoint = breakpoint
+        self.continue_event.clear()
+        self.gui_controller.root.after(0, show_breakpoint)
+        self._wait_for_gui()
+        self.paused_at_breakpoint = None
+        self.gui_controller.root.after(0, self.gui_controller.breakpoint_resumed)
+
+    def _on_suite_indexed(self, index):
+        # Planned tests for remaining-time prediction against the baseline run (tests already run excluded)
+        with self._plan_lock:
+            self._planned_tests = index.longnames()[self._tests_finished:]
+            if self.run_estimator is not None:
+                self.run_estimator.plan(self._planned_tests)
+
+    def _load_run_baseline(self, path):
+        try:
+            baseline = RunBaseline.load(path)
+        except Exception as e:
+            logger.warning(f"[Debugger] Could not load baseline output {path}: {e}")
+            return
+        estimator = RunEstimator(baseline)
+        # Whichever of this and _on_suite_indexed publishes second does the planning
+        with self._plan_lock:
+            if self._planned_tests:
+                estimator.plan(self._planned_tests)
+            self.run_estimator = estimator
+            self.run_baseline = baseline
+        logger.info(
+            f"[Debugger] Baseline output loaded in {baseline.load_seconds:.1f}s: "
+            f"{len(baseline.test_seconds)} tests, {len(baseline.keywords)} keywords, "
+            f"{len(baseline.flaky_keywords())} flaky"
+        )
+
+    def _seed_seen_keywords(self, names):
+        """Prefill the seen-keyword catalog (Robot thread only, respects MAX_SEEN_KEYWORDS)."""
+        for name in sorted(names):
+            if len(self.seen_keywords) >= self.MAX_SEEN_KEYWORDS:
+                break
+            if name not in self.seen_keywords:
+                self.seen_keywords.add(name)
+                self._seen_keywords_queue.append(name)
+
+    def _report_loop(self, stats):
+        """Log one aggregated entry for a finished loop when the live trace is on."""
+        gui = self.gui_controller
+        if not self.trace.enabled or gui is None or not getattr(gui, "gui_ready", False):
+            return
+        if self.trace.level == "failures" and not stats.any_failed:
+            return
+        gui.log_loop_summary(stats, depth=len(self.keyword_stack))
+
+    def _trace_keyword_start(self, data):
+        gui = self.gui_controller
+        if gui is None or not getattr(gui, "gui_ready", False):
+            return
+        event = self.trace.start_event(data)
+        if event is not None:
+            name, args = event
+            gui.log_keyword_event("start", name, args=args, depth=len(self.keyword_stack) - 1,
+                                  skipped=self.trace.take_skipped())
+
+    def _trace_keyword_end(self, data, result, user_keyword=None):
+        gui = self.gui_controller
+        if gui is None or not getattr(gui, "gui_ready", False):
+            return
+        event = self.trace.end_event(data, result, user_keyword)
+        if event is not None:
+            name, status, message, seconds = event
+            gui.log_keyword_event("end", name, status=status, message=message, elapsed=seconds,
+                                  depth=len(self.keyword_stack) - 1, skipped=self.trace.take_skipped())
+
+    def _invalidate_written_scopes(self, data, normalized_name):
+        """Invalidate the scope a finished keyword wrote: Set X Variable, or `${x} =` assignment."""
+        scope = SCOPE_SETTERS.get(normalized_name.rsplit(".", 1)[-1])
+        if scope is None and getattr(data, "assign", None):
+            scope = "local"
+        if scope is not None:
+            self._invalidate_scope(scope)
+
+    def _invalidate_scope(self, scope):
+        # Local writes outside any user keyword land directly in the test or suite scope
+        if scope == "local":
+            try:
+                scopes = self.builtin._variables
+                if scopes.current is getattr(scopes, "_test", None):
+                    scope = "test"
+                elif scopes.current is getattr(scopes, "_suite", None):
+                    scope = "suite"
+            except Exception:
+                scope = "test" if self._in_test else "suite"
+        self.variable_scopes.invalidate(scope)
+
+    def enable_variable_history(self, budget_bytes=None):
+        """Start recording variable snapshots at keyword ends."""
+        if self.variable_history is None:
+            self.variable_history = VariableHistory(budget_bytes or self.VARIABLE_HISTORY_BUDGET_BYTES)
+            logger.info("[Debugger] Variable history recording enabled")
+
+    def disable_variable_history(self):
+        """Stop recording and release all stored snapshots."""
+        self.variable_history = None
+        self._variable_snapshotter.reset()
+        logger.info("[Debugger] Variable history recording disabled")
+
+    def enable_pass_baseline(self, directory=None):
+        """Record variables of passing tests and diff failures against them."""
+        if self.pass_baseline_store is None:
+            try:
+                self.pass_baseline_store = BaselineStore(directory)
+                logger.info(f"[Debugger] Pass baseline store: {self.pass_baseline_store.directory}")
+            except OSError as e:
+                logger.warning(f"[Debugger] Cannot open pass baseline store: {e}")
+
+    def disable_pass_baseline(self):
+        self.pass_baseline_store = None
+        self._baseline_recorder = None
+        self.pass_diff = None
+
+    def _record_variable_snapshot(self, keyword_name, result=None):
+        history = self.variable_history
+        recorder = self._baseline_recorder
+        try:
+            snapshot = self._variable_snapshotter.snapshot(self.builtin.get_variables())
+            if history is not None:
+                history.record(keyword_name, snapshot)
+            if recorder is not None:
+                position = getattr(result, "id", None) or f"{len(self.keyword_stack)}:{keyword_name}"
+                recorder.record(position, snapshot)
+                if self.pass_diff is not None:
+                    self.pass_diff.update(position, snapshot)
+        except Exception as e:
+            logger.debug(f"[Debugger] Variable snapshot skipped: {e}")
+
+    @staticmethod
+    def _test_longname(data):
+        return getattr(data, "full_name", None) or getattr(data, "longname", None) or data.name
+
     # ✅ Add helper for safe async waiting
     def _wait_for_user_action(self):
         if self.continue_event.is_set():
@@ -312,7 +633,7 @@ class SimpleRetryCore:
             self.builtin.log(f"[Debugger] Skipped keyword: {self.failed_keyword.name}", "WARN")
             self.builtin.set_tags("debugger-skipped")
         except Exception as e:
-            logging.warning(f"Failed to log/set tag for skipped keyword: {e}")
+            logger.warning(f"Failed to log/set tag for skipped keyword: {e}")
         self.skip_keyword = False
         self.failed_keyword = None
 
@@ -321,17 +642,17 @@ class SimpleRetryCore:
             self.builtin.log(f"[Debugger] Retried keyword succeeded: {self.failed_keyword.name}", "INFO")
             self.builtin.set_tags("debugger-retried")
         except Exception as e:
-            logging.warning(f"Failed to log/set tag for retried keyword: {e}")
+            logger.warning(f"Failed to log/set tag for retried keyword: {e}")
         self.retry_success = False
         self.failed_keyword = None
 
     def retry_keyword(self, kw_name, args):
         try:
             result = self.builtin.run_keyword_and_ignore_error(kw_name, *args)
-            logging.info(f"Retry result for {kw_name}: {result}")
+            logger.info(f"Retry result for {kw_name}: {result}")
             return result
         except Exception as e:
-            logging.exception("Exception during retry:")
+            logger.exception("Exception during retry:")
             return ('FAIL', str(e))
 
     def parse_arg(self, val):
@@ -355,5 +676,16 @@ class SimpleRetryCore:
         except:
             return val
 
+    def load_ignore_profile(self, name):
+        """Add the rules of a saved ignore profile. Returns the number of rules, or None on error."""
+        try:
+            rules = load_profile(name)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[Debugger] Cannot load ignore profile '{name}': {e}")
+            return None
+        self.ignored_keywords.update(rules)
+        logger.info(f"[Debugger] Loaded ignore profile '{name}' with {len(rules)} rules")
+        return len(rules)
+
     def _normalize_keyword_name(self, raw_name):
         return raw_name.strip().split("  ")[0].strip().lower()
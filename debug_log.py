@@ -0,0 +1,96 @@
+# debug_log.py
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOGGER_NAME = __package__ or "rfdb"  # Parent of every module logger in the package
+DEFAULT_LOG_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_LOG_BACKUPS = 3
+
+_listener = None
+
+
+def default_log_path():
+    return os.path.join(os.path.expanduser("~"), ".rfdb", "logs", "retry_debug.log")
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, thread, msg (+ exc)."""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Queues records with the message merged but the traceback kept in its own field."""
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+def configure_logging(path=None, level="INFO", max_bytes=DEFAULT_LOG_MAX_BYTES, backups=DEFAULT_LOG_BACKUPS):
+    """
+    Route the "rfdb" logger through a queue to a background writer thread
+    with a size-rotated JSON-lines file. The root logger is left untouched.
+    Calling again replaces the previous configuration.
+    """
+    global _listener
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(logging.getLevelName(str(level).upper()) if isinstance(level, str) else level)
+    logger.propagate = False
+    shutdown_logging()
+
+    path = path or default_log_path()
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        file_handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8", delay=True)
+    except OSError as e:
+        # Unwritable location: keep hooks cheap and silent rather than failing the run
+        logger.addHandler(logging.NullHandler())
+        logger.warning(f"[Debugger] Cannot open log file {path}: {e}")
+        return None
+    file_handler.setFormatter(JsonLineFormatter())
+
+    records = queue.SimpleQueue()
+    logger.addHandler(_RecordQueueHandler(records))
+    _listener = QueueListener(records, file_handler, respect_handler_level=True)
+    _listener.start()
+    return path
+
+
+def shutdown_logging():
+    """Flush queued records, stop the writer thread and detach rfdb handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+
+atexit.register(shutdown_logging)
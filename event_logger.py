@@ -1,5 +1,6 @@
 # event_logger.py
 from datetime import datetime
+from .payload_store import FOLD_CHARS
 
 
 def log_suite_start(gui, data):
@@ -11,20 +12,17 @@ def log_suite_start(gui, data):
         f"  Documentation: {doc}\n"
         f"{'-' * 60}\n"
     )
-    _write(gui, text, "header")
+    return _write(gui, text, "header", "suite_start", test="")
 
 def log_suite_end(gui, data, result):
     timestamp = datetime.now().strftime("%H:%M:%S")
-    message = result.message.strip() if result.message else "(Empty)"
-    text = (
+    header = (
         f"[{timestamp}] SUITE ENDED\n"
         f"  Name     : {data.name}\n"
         f"  Status   : {result.status}\n"
-        f"  Message  : {message}\n"
-        f"{'-' * 60}\n"
     )
     tag = "pass" if result.status.upper() == "PASS" else "fail"
-    _write(gui, text, tag)
+    return _write_with_message(gui, header, result.message, tag, "suite_end", test="")
 
 def log_test_start(gui, data):
     timestamp = datetime.now().strftime("%H:%M:%S")
@@ -45,44 +43,35 @@ def log_test_start(gui, data):
         f"  Arguments  : {args_str}\n"
         f"{'-' * 60}\n"
     )
-    _write(gui, text, "header")
+    return _write(gui, text, "header", "test_start", test=data.name)
 
 
 def log_test_end(gui, data, result):
     timestamp = datetime.now().strftime("%H:%M:%S")
-    message = result.message.strip() if result.message else "(Empty)"
-    text = (
+    header = (
         f"[{timestamp}] TEST ENDED\n"
         f"  Name     : {data.name}\n"
         f"  Status   : {result.status}\n"
-        f"  Message  : {message}\n"
-        f"{'-' * 60}\n"
     )
     tag = "pass" if result.status.upper() == "PASS" else "fail"
-    _write(gui, text, tag)
-
-def _write(gui, text, tag=None):
-    def log_task():
-        text_widget = gui.failure_text
-        text_widget.configure(state='normal')
-
-        # Insert log
-        text_widget.insert("end", f"{_timestamp()} {text}\n", tag)
+    return _write_with_message(gui, header, result.message, tag, "test_end", test=data.name)
 
-        # Limit number of lines
-        try:
-            max_lines = getattr(gui, "max_log_lines", 1000)
-            current_line_count = int(text_widget.index('end-1c').split('.')[0])
-            if current_line_count > max_lines:
-                lines_to_delete = current_line_count - max_lines
-                text_widget.delete("1.0", f"{lines_to_delete + 1}.0")
-        except Exception as e:
-            import logging
-            logging.warning(f"Log trim error: {e}")
+def _write(gui, text, tag=None, kind="info", test=None):
+    # Entries go into the GUI's ring buffer; the render scheduler batches the redraw
+    line = f"{_timestamp()} {text}\n"
+    return gui.append_log(kind, [(line, tag)], tag=tag, test=test)
 
-        text_widget.configure(state='disabled')
-        text_widget.see("end")
+def _write_with_message(gui, header, message, tag, kind, test):
+    # Failure messages can be megabytes: large ones are folded like in the failure display
+    message = message.strip() if message else "(Empty)"
+    segments = [(f"{_timestamp()} {header}  Message  : ", tag)]
+    if len(message) <= FOLD_CHARS and "\n" not in message:
+        segments.append((f"{message}\n", tag))
+    else:
+        segments.append(("\n", tag))
+        segments.extend(gui.payloads.fold_message(message, tag, indent="    "))
+    segments.append((f"{'-' * 60}\n\n", tag))
+    return gui.append_log(kind, segments, tag=tag, test=test)
 
-    gui.root.after_idle(log_task)
 def _timestamp():
     return datetime.now().strftime("[%H:%M:%S]")
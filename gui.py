@@ -3,10 +3,27 @@ from tkinter import scrolledtext, messagebox, ttk
 from datetime import datetime
 import threading
 from functools import wraps
-from robot.libdocpkg import LibraryDocumentation
 import logging
 from robot.libraries.BuiltIn import BuiltIn
 import os
+from .arg_resolver import ArgumentResolver
+from .arg_converters import ConverterCache, normalize_name
+from .log_model import LogBuffer
+from .log_index import LogIndex, LogSearch
+from .log_panel import LogPanel
+from .payload_store import PayloadStore
+from .payload_viewer import PayloadViewer
+from .log_viewer import LogViewer
+from .keyword_trace import TRACE_LEVELS
+from .keyword_catalog import LibraryLoader
+from .catalog_cache import CatalogCache
+from .keyword_index import KeywordIndex, SortedNames
+from .ignore_rules import rule_kind, rule_error, list_profiles, save_profile
+from .result_tree import ResultTree
+from .breakpoint_panel import BreakpointPanel
+from .call_tree_view import CallTreeWindow
+from .suite_index import TestEntry
+from .render_scheduler import RenderScheduler
 from .event_logger import (
     log_suite_start,
     log_suite_end,
@@ -14,13 +31,38 @@ from .event_logger import (
     log_test_end,
 )
 
+logger = logging.getLogger(__name__)
+
 
 
 
 class SimpleRetryGUI:
     # Class constants
-    MAX_LOG_LINES = 1000
-    MAX_FAILURE_LOG_LINES = 500
+    MAX_LOG_ENTRIES = 2000  # Ring buffer capacity of the failure/event log
+    LOG_RENDER_WINDOW = 300  # Entries kept rendered in the log widget at once
+    MAX_RENDER_FPS = 20  # Batched log/status redraws per second
+    PAYLOAD_BUDGET_BYTES = 32 * 1024 * 1024  # Folded messages/args kept for the expand viewer
+    ESTIMATE_REFRESH_MS = 1000  # Baseline-run comparison refresh interval
+    LOG_STATUS_TAGS = {"pass": "PASS", "fail": "FAIL", "warning": "WARN", "pending": "PENDING"}
+    LOG_SEARCH_KINDS = {  # Search bar label -> log entry kind
+        "All": None,
+        "Failure": "failure",
+        "Retry": "retry",
+        "Custom": "custom",
+        "Test start": "test_start",
+        "Test end": "test_end",
+        "Suite start": "suite_start",
+        "Suite end": "suite_end",
+        "Ignore list": "ignore",
+        "Skip": "skip",
+        "Control": "control",
+        "Trace": "trace",
+        "Breakpoint": "breakpoint",
+    }
+    KEYWORD_SEARCH_LIMIT = 100  # Ranked matches shown for a keyword search
+    IGNORE_DROPDOWN_WINDOW = 200  # Names handed to the ignore dropdown at once when browsing
+    IGNORE_PREV_ITEM = "▲ previous..."
+    IGNORE_NEXT_ITEM = "▼ more..."
     VARIABLE_REFRESH_DELAY_MS = 1000  # Increased from 300ms for VDI performance
     # DEBUGGER_VERSION = "1.5.1"
     
@@ -32,6 +74,13 @@ class SimpleRetryGUI:
         self.execution_in_progress = False
         self._current_call_stack = None  # Store current call stack for viewing
         self._var_refresh_id = None  # Track variable refresh timer
+        self.arg_resolver = ArgumentResolver()  # Cached Robot variable resolution for retry args
+        self.arg_vars = []
+        self._arg_sources = []  # Per retry field: (group index, initial text) or None if added by user
+        self._arg_groups = []  # ResolvedArg per original keyword argument
+        self.converter_cache = ConverterCache()  # Typed argument converters built once per keyword
+        self.custom_arg_vars = []
+        self._custom_arg_specs = []  # Per custom field: index into the keyword's arg spec, or None
 
         self.root = tk.Tk()
         self.root.title(f"Robot Framework Debugger")
@@ -42,22 +91,38 @@ class SimpleRetryGUI:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(1, weight=1)  # Failure log should expand
         self.root.rowconfigure(2, weight=2)  # Tabs should expand more
-        self.max_log_lines = self.MAX_LOG_LINES
-
-
-        self.libraries = {}
+        self.log_buffer = LogBuffer(self.MAX_LOG_ENTRIES)
+        self.log_index = LogIndex(self.log_buffer)
+        self.log_search = LogSearch(self.log_index)
+        self._log_append_lock = threading.Lock()  # Seqs must reach the index in append order
+        self.payloads = PayloadStore(self.PAYLOAD_BUDGET_BYTES)
+        self.render_scheduler = RenderScheduler(self.root, self.MAX_RENDER_FPS)
+
+        self.libraries = {}  # Library name, or normalized path for resource files -> LibraryCatalog
+        self._library_labels = {}  # Name shown in the library dropdown (and search results) -> libraries key
+        self.keyword_index = KeywordIndex()  # Fuzzy search over library, resource and seen keywords
+        self.ignore_catalog = SortedNames()  # Every known keyword name, for browsing the ignore dropdown
+        self._ignore_window_start = 0
         self.library_names = []
         self._pending_libraries = []
+        self._pending_resources = []
         self._libraries_loaded = False  # Track if libraries have been loaded for lazy-loading
+        cache_dir = self.core.options.catalog_cache
+        catalog_cache = None if str(cache_dir).lower() in ("off", "none", "") else CatalogCache(cache_dir)
+        self.library_loader = LibraryLoader(self._on_library_loaded, catalog_cache)  # libdoc off the Robot/Tk threads
         self._setup_ui()
         self.gui_ready = True
+        self.root.after(self.ESTIMATE_REFRESH_MS, self._update_run_estimate)
         
-        # Process any libraries that were imported before GUI was ready
+        # Queue libraries that were imported before GUI was ready
         if self._pending_libraries:
-            for libname in self._pending_libraries:
-                logging.info(f"[Debugger GUI] Processing pending library: {libname}")
-                self.library_imported(libname)
+            for libname, source, version, args in self._pending_libraries:
+                logger.info(f"[Debugger GUI] Processing pending library: {libname}")
+                self.library_imported(libname, source, version, args)
             self._pending_libraries.clear()
+        for path in self._pending_resources:
+            self.resource_imported(path)
+        self._pending_resources.clear()
 
     def _setup_ui(self):
         # === TEST CONTROL BAR ===
@@ -90,6 +155,36 @@ class SimpleRetryGUI:
         )
         self.start_test_btn.pack(side=tk.RIGHT, padx=8, pady=3)
         
+        # Large log file viewer (defaults to the debugger's own log)
+        tk.Button(
+            control_bar,
+            text="[LOG] Files",
+            command=lambda: LogViewer(self.root, self.core.options.log_path),
+            bg="#6c757d",
+            fg="white",
+            font=("Segoe UI", 9),
+            padx=10,
+            pady=3,
+            cursor="hand2"
+        ).pack(side=tk.RIGHT, padx=3, pady=3)
+
+        # Live keyword trace level
+        self.trace_level_var = tk.StringVar(value=self.core.trace.level)
+        trace_box = ttk.Combobox(
+            control_bar,
+            textvariable=self.trace_level_var,
+            values=list(TRACE_LEVELS),
+            state="readonly",
+            width=8
+        )
+        trace_box.pack(side=tk.RIGHT, padx=(0, 3), pady=3)
+        trace_box.bind("<<ComboboxSelected>>", self._on_trace_level_changed)
+        tk.Label(control_bar, text="Trace:", font=("Segoe UI", 9), bg="#d0e8ff").pack(side=tk.RIGHT)
+
+        # Comparison against the baseline run (baseline_output= listener arg)
+        self.estimate_label = tk.Label(control_bar, text="", font=("Segoe UI", 9), bg="#d0e8ff", fg="#003366")
+        self.estimate_label.pack(side=tk.RIGHT, padx=6)
+
         # View Call Stack button (hidden by default)
         self.view_stack_btn = tk.Button(
             control_bar,
@@ -105,9 +200,17 @@ class SimpleRetryGUI:
         # Initially hidden, will show when there's a failure with stack
         # self.view_stack_btn.pack(side=tk.RIGHT, padx=3, pady=3)
 
-        # === Failure Info Panel ===
-        self.failure_text = scrolledtext.ScrolledText(
-            self.root,
+        # === Failure Info Panel (search bar + virtualized view over the log ring buffer) ===
+        log_frame = tk.Frame(self.root)
+        log_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
+        log_frame.columnconfigure(0, weight=1)
+        log_frame.rowconfigure(1, weight=1)
+        self._setup_log_search_bar(log_frame)
+
+        self.log_panel = LogPanel(
+            log_frame,
+            self.log_buffer,
+            window=self.LOG_RENDER_WINDOW,
             wrap=tk.WORD,
             height=20,
             bg="#1e1e1e",
@@ -117,6 +220,9 @@ class SimpleRetryGUI:
             borderwidth=1,
             relief=tk.FLAT
         )
+        self.failure_text = self.log_panel.text
+        # New entries are rendered once per frame, merged into a single insert
+        self.render_scheduler.on_flush(self.log_panel.refresh)
         
         # Enhanced tag configurations for better visual hierarchy
         # Status tags
@@ -141,9 +247,14 @@ class SimpleRetryGUI:
         # Labels and values
         self.failure_text.tag_config("label", foreground="#74c0fc", font=("Consolas", 10))
         self.failure_text.tag_config("value", foreground="#e0e0e0", font=("Consolas", 10))
+
+        # Folded payload summaries open the paged viewer on click
+        self.failure_text.tag_config("fold", foreground="#4dabf7", underline=True)
+        self.failure_text.tag_bind("fold", "<Button-1>", self._on_fold_click)
+        self.failure_text.tag_bind("fold", "<Enter>", lambda e: self.failure_text.config(cursor="hand2"))
+        self.failure_text.tag_bind("fold", "<Leave>", lambda e: self.failure_text.config(cursor=""))
         
-        self.failure_text.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
-        self.failure_text.config(state=tk.DISABLED)
+        self.log_panel.grid(row=1, column=0, sticky="nsew")
 
         # Use improved tab style
         style = ttk.Style()
@@ -170,10 +281,14 @@ class SimpleRetryGUI:
         self.retry_tab = tk.Frame(self.sub_tabs)
         self.custom_tab = tk.Frame(self.sub_tabs)
         self.var_tab = tk.Frame(self.sub_tabs)
+        self.results_tab = tk.Frame(self.sub_tabs)
+        self.breakpoints_tab = tk.Frame(self.sub_tabs)
 
         self.sub_tabs.add(self.retry_tab, text="Retry Failed Keyword")
         self.sub_tabs.add(self.custom_tab, text="Run Custom Keyword")
         self.sub_tabs.add(self.var_tab, text="Variable Inspector")
+        self.sub_tabs.add(self.results_tab, text="Results")
+        self.sub_tabs.add(self.breakpoints_tab, text="Breakpoints")
 
         self.sub_tabs.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
@@ -181,6 +296,19 @@ class SimpleRetryGUI:
         self._setup_retry_tab()
         self._setup_custom_tab()
 
+        # Suite/test result tree, updated from the listener hooks through the render scheduler
+        self.result_tree = ResultTree(self.results_tab, on_test_selected=self._jump_to_test_log,
+                                      on_test_activated=self._show_static_call_tree)
+        self.result_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        self.breakpoint_panel = BreakpointPanel(
+            self.breakpoints_tab, self.core.breakpoints,
+            on_continue=self._on_breakpoint_continue,
+            on_change=lambda text: self.update_status(text, "gray"),
+            resolve=self._breakpoint_call_sites
+        )
+        self.breakpoint_panel.pack(fill=tk.BOTH, expand=True)
+
     def _on_tab_changed(self, event):
         selected_tab = event.widget.tab(event.widget.select(), "text")
         if selected_tab == "Variable Inspector":
@@ -191,12 +319,15 @@ class SimpleRetryGUI:
         else:
             self._stop_variable_refresh()  # Stop refresh when tab not visible
             
+        if selected_tab == "Breakpoints":
+            self.breakpoint_panel.refresh()  # Hit counts
+
         if selected_tab == "Run Custom Keyword":
             # Lazy-load libraries when custom tab is first accessed
             if not self._libraries_loaded:
                 self._libraries_loaded = True
                 self._refresh_library_dropdown()
-                logging.info("[Debugger GUI] Lazy-loading libraries for custom keyword tab")
+                logger.info("[Debugger GUI] Lazy-loading libraries for custom keyword tab")
 
     def _start_variable_refresh(self):
         """Start periodic variable refresh"""
@@ -262,7 +393,8 @@ class SimpleRetryGUI:
         # Info note
         info_label = tk.Label(
             ignore_frame,
-            text="[i] Click 'Refresh' button to load keywords from test libraries before adding to ignore list",
+            text="[i] Pick a keyword (Refresh loads library keywords), or type a rule in Search and click 'Add Pattern': "
+                 "Wait *, Lib.Keyword, re:<regex>, message:*stale*",
             font=("Segoe UI", 8, "italic"),
             fg="#666666",
             anchor='w'
@@ -287,6 +419,7 @@ class SimpleRetryGUI:
             font=("Consolas", 9)
         )
         self.ignore_keyword_dropdown.pack(side=tk.LEFT, padx=3)
+        self.ignore_keyword_dropdown.bind("<<ComboboxSelected>>", self._on_ignore_dropdown_selected)
         
         tk.Button(
             top_row,
@@ -299,6 +432,15 @@ class SimpleRetryGUI:
             pady=2
         ).pack(side=tk.LEFT, padx=2)
         
+        tk.Button(
+            top_row,
+            text="[+] Add Pattern",
+            command=self._add_pattern_to_ignore,
+            font=("Segoe UI", 9),
+            padx=10,
+            pady=2
+        ).pack(side=tk.LEFT, padx=2)
+        
         tk.Button(
             top_row,
             text="[R] Refresh",
@@ -308,6 +450,37 @@ class SimpleRetryGUI:
             pady=2
         ).pack(side=tk.LEFT, padx=2)
         
+        # Profile row: saved rule sets under ~/.rfdb/ignore_profiles
+        profile_row = tk.Frame(ignore_frame)
+        profile_row.pack(fill=tk.X, pady=(0, 3))
+        
+        tk.Label(profile_row, text="Profile:", font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=(0, 3))
+        
+        self.ignore_profile_dropdown = ttk.Combobox(profile_row, width=25, font=("Consolas", 9))
+        self.ignore_profile_dropdown.pack(side=tk.LEFT, padx=3)
+        self.ignore_profile_dropdown.set(self.core.options.ignore_profile)
+        self.ignore_profile_dropdown.bind("<Button-1>", lambda e: self._refresh_ignore_profiles())
+        
+        tk.Button(
+            profile_row,
+            text="Load",
+            command=self._load_ignore_profile,
+            font=("Segoe UI", 9),
+            padx=10,
+            pady=2
+        ).pack(side=tk.LEFT, padx=2)
+        
+        tk.Button(
+            profile_row,
+            text="Save",
+            command=self._save_ignore_profile,
+            font=("Segoe UI", 9),
+            padx=10,
+            pady=2
+        ).pack(side=tk.LEFT, padx=2)
+        
+        self._refresh_ignore_profiles()
+        
         # Bottom row: Compact ignored list display
         bottom_row = tk.Frame(ignore_frame)
         bottom_row.pack(fill=tk.X, pady=(3, 0))
@@ -352,7 +525,6 @@ class SimpleRetryGUI:
             pady=2
         ).pack(side=tk.TOP, pady=1)
         
-        self._all_keywords = []  # Store all available keywords
         self._refresh_ignore_keyword_list()
 
     # === CUSTOM EXECUTOR TAB ===
@@ -429,28 +601,51 @@ class SimpleRetryGUI:
         # Note: Libraries are loaded lazily when user first accesses the custom tab
         # This improves startup performance in VDI environments
 
+    def _catalog(self, label):
+        """LibraryCatalog shown as `label` in the library dropdown, or None."""
+        return self.libraries.get(self._library_labels.get(label))
+
+    def _label_for(self, key, catalog):
+        """
+        Dropdown label of a newly loaded catalog: its name, unless an earlier library or
+        resource file already uses it (resource names are not unique); then a resource
+        gets its folder, a library "(library)", and a counter if even that is taken.
+        """
+        label = catalog.name
+        if label in self._library_labels:
+            where = (os.path.basename(os.path.dirname(key)) or key) if catalog.kind == "resource" else "library"
+            label = f"{catalog.name} ({where})"
+            base, n = label, 2
+            while label in self._library_labels:
+                label, n = f"{base} #{n}", n + 1
+        return label
+
     def _on_library_selected(self, event=None):
-        lib = self.library_var.get()
-        if lib not in self.libraries:
+        catalog = self._catalog(self.library_var.get())
+        if catalog is None:
             return
-        self.keyword_dropdown['values'] = [kw['name'] for kw in self.libraries[lib]]
+        self.keyword_dropdown['values'] = list(catalog.names)
         if self.keyword_dropdown['values']:
             self.keyword_var.set(self.keyword_dropdown['values'][0])
             self._on_keyword_selected()
     
     def _filter_custom_keywords(self):
-        """Filter keyword dropdown based on search text"""
+        """Filter keyword dropdown based on search text.
+        Matches in the selected library come first, then matches from other
+        libraries as Library.Keyword (selecting one switches library).
+        """
         lib = self.library_var.get()
-        if not lib or lib not in self.libraries:
-            return
-        
-        search_text = self.custom_search_var.get().lower()
-        all_keywords = [kw['name'] for kw in self.libraries[lib]]
-        
+        search_text = self.custom_search_var.get().strip()
+
         if search_text:
-            filtered = [kw for kw in all_keywords if search_text in kw.lower()]
+            # Selected library searched on its own first, so other libraries cannot crowd it out
+            filtered = [name for name, _ in self.keyword_index.search(search_text, self.KEYWORD_SEARCH_LIMIT, source=lib)]
+            filtered += [f"{source}.{name}" for name, source in self.keyword_index.search(search_text, self.KEYWORD_SEARCH_LIMIT)
+                         if source != lib and source in self._library_labels]
+        elif self._catalog(lib) is not None:
+            filtered = self._catalog(lib).names
         else:
-            filtered = all_keywords
+            return
         
         self.keyword_dropdown['values'] = filtered
         
@@ -467,33 +662,64 @@ class SimpleRetryGUI:
         lib = self.library_var.get()
         kw_name = self.keyword_var.get()
 
-        if not lib or not kw_name:
+        if not kw_name:
             return
 
-        if lib in self.libraries:
-            for kw in self.libraries[lib]:
-                if kw['name'] == kw_name:
-                    self._populate_custom_args_editor(kw['args'])
+        catalog = self._catalog(lib)
+        if (catalog is None or catalog.find(kw_name) is None) and "." in kw_name:
+            # Qualified search result from another library (labels may contain dots themselves)
+            other = max((label for label in self._library_labels if kw_name.startswith(label + ".")),
+                        key=len, default=None)
+            if other is not None:
+                lib, kw_name, catalog = other, kw_name[len(other) + 1:], self._catalog(other)
+                self.library_var.set(lib)
+                self.keyword_var.set(kw_name)
+        if catalog is None:
+            return
 
-                    # ✅ Show signature
-                    args_text = ", ".join(
-                        a.name if hasattr(a, "name") else str(a)
-                        for a in kw['args']
-                    )
-                    signature = f"{kw_name}({args_text})"
-                    self.command_var.set(signature)
+        # Args/doc are fetched on first selection (in the background) and kept in a bounded LRU
+        details = self.library_loader.describe(
+            catalog, kw_name,
+            lambda args, doc: self.render_scheduler.post(
+                lambda: self._show_keyword_details(lib, kw_name, args, doc))
+        )
+        if details is not None:
+            self._show_keyword_details(lib, kw_name, *details)
+            return
+        self._populate_custom_args_editor([])
+        self.command_var.set(kw_name)
+        self.doc_display.config(state=tk.NORMAL)
+        self.doc_display.delete("1.0", tk.END)
+        self.doc_display.insert(tk.END, f"{kw_name}\n\nLoading documentation...")
+        self.doc_display.config(state=tk.DISABLED)
 
-                    # ✅ Show doc
-                    self.doc_display.config(state=tk.NORMAL)
-                    self.doc_display.delete("1.0", tk.END)
-                    self.doc_display.insert(tk.END, f"{kw_name}\n\nSignature:\n{signature}\n\nDoc:\n{kw.get('doc', '')}")
-                    self.doc_display.config(state=tk.DISABLED)
-                    break
+    def _show_keyword_details(self, lib, kw_name, args, doc):
+        if self.library_var.get() != lib or self.keyword_var.get() != kw_name:
+            return  # Selection changed while the details were loading
+        self._populate_custom_args_editor(args)
+
+        # ✅ Show signature
+        args_text = ", ".join(
+            a.name if hasattr(a, "name") else str(a)
+            for a in args
+        )
+        signature = f"{kw_name}({args_text})"
+        self.command_var.set(signature)
+
+        # ✅ Show doc (and where the keyword is defined)
+        catalog = self._catalog(lib)
+        location = catalog.location(kw_name) if catalog is not None else None
+        source = f"\n\nSource:\n{location[0]}:{location[1] or ''}" if location else ""
+        self.doc_display.config(state=tk.NORMAL)
+        self.doc_display.delete("1.0", tk.END)
+        self.doc_display.insert(tk.END, f"{kw_name}\n\nSignature:\n{signature}{source}\n\nDoc:\n{doc}")
+        self.doc_display.config(state=tk.DISABLED)
 
     def _populate_custom_args_editor(self, args):
         for widget in self.custom_args_frame.winfo_children():
             widget.destroy()
         self.custom_arg_vars = []
+        self._custom_arg_specs = []
 
         for i, arg in enumerate(args or []):
             if hasattr(arg, "name"):
@@ -537,6 +763,7 @@ class SimpleRetryGUI:
 
             create_tooltip(entry, label)
             self.custom_arg_vars.append(var)
+            self._custom_arg_specs.append(i)
 
         # self._add_custom_argument_field()  # start with one empty field
 
@@ -548,40 +775,15 @@ class SimpleRetryGUI:
         tk.Entry(frame, textvariable=var, width=60).pack(side='left', padx=2)
         tk.Button(frame, text="–", command=lambda f=frame: self._remove_custom_argument_field(f)).pack(side='left')
         self.custom_arg_vars.append(var)
+        self._custom_arg_specs.append(None)
 
     def _remove_custom_argument_field(self, frame):
         idx = list(self.custom_args_frame.children.values()).index(frame)
         frame.destroy()
         del self.custom_arg_vars[idx]
+        del self._custom_arg_specs[idx]
 
 
-    def _update_keywords(self):
-        lib = self.library_var.get()
-        menu = self.keyword_dropdown["menu"]
-        menu.delete(0, "end")
-
-        if lib not in self.libraries:
-            return
-
-        keywords = self.libraries[lib]
-        for kw in keywords:
-            menu.add_command(label=kw['name'], command=lambda name=kw['name']: self.keyword_var.set(name))
-
-    def _update_command_from_keyword(self):
-        lib = self.library_var.get()
-        kw_name = self.keyword_var.get()
-        if lib in self.libraries:
-            for kw in self.libraries[lib]:
-                if kw['name'] == kw_name:
-                    args = [arg for arg in kw['args'] if '=' not in arg]
-                    self.command_var.set(f"{lib}.{kw_name}    {'    '.join(args)}")
-
-                    self.doc_display.config(state=tk.NORMAL)
-                    self.doc_display.delete("1.0", tk.END)
-                    self.doc_display.insert(tk.END, f"{kw_name}\n\nArgs:\n{kw['args']}\n\nDoc:\n{kw['doc']}")
-                    self.doc_display.config(state=tk.DISABLED)
-                    break
-
     def _execute_command(self):
         if self.execution_in_progress:
             self._update_failure_display(
@@ -601,12 +803,25 @@ class SimpleRetryGUI:
             )
             return
 
-        args = [self.core.parse_arg(var.get()) for var in getattr(self, 'custom_arg_vars', [])]
+        texts = [var.get() for var in self.custom_arg_vars]
+        key, spec = self._find_keyword_spec(kw, library=lib)
+        if spec is not None:
+            args, errors = self.converter_cache.get(key, spec).convert(texts, spec_indexes=self._custom_arg_specs)
+            if errors:
+                self._report_conversion_errors(f"{lib}.{kw}", errors)
+                return
+        elif key is not None:
+            args = texts  # Known keyword without a spec: Robot converts the text as it would from a test
+        else:
+            args = [self.core.parse_arg(text) for text in texts]
         self.execution_in_progress = True
+        # Run by library/resource name: the dropdown label of a same-named resource adds its folder
+        catalog = self._catalog(lib)
+        qualified = f"{catalog.name if catalog is not None else lib}.{kw}"
 
         def _run():
             try:
-                result = BuiltIn().run_keyword(f"{lib}.{kw}", *args)
+                result = BuiltIn().run_keyword(qualified, *args)
                 BuiltIn().set_test_variable("${RETURN_VALUE}", result)
                 self._update_failure_display(
                     f"Executed: {lib}.{kw}\nArgs: {args}\n\n${{RETURN_VALUE}} = {result}",
@@ -626,7 +841,45 @@ class SimpleRetryGUI:
 
     def show_failure(self, suite, test, keyword, message, args, call_stack=None):
         timestamp = datetime.now().strftime("%H:%M:%S")
+        self._set_call_stack(call_stack)
+        
+        # Enhanced failure display
+        segments = [
+            # Header with visual separator
+            (f"\n{'═' * 70}\n", "separator"),
+            ("[!] TEST FAILURE DETECTED\n", "fail"),
+            (f"[TIME] {timestamp}\n", "timestamp"),
+            (f"{'═' * 70}\n", "separator"),
+            # Test details with labels
+            ("\n[TEST] ", "label"),
+            (f"{test}\n", "value"),
+            ("[KEYWORD] ", "label"),
+            (f"{keyword}\n", "keyword"),
+            *self._baseline_keyword_note(keyword),
+            # Message
+            ("\n[ERROR]:\n", "label"),
+        ]
+        segments.extend(self.payloads.fold_message(message.strip(), "message"))
+        # Footer separator
+        segments.append((f"\n{'═' * 70}\n", "separator"))
+        self.append_log("failure", segments, tag="fail")
+
+        # Set keyword for retry tab
+        self.kw_name_var.set(keyword)
 
+        # Resolve arguments for retry through Robot's variable replacement
+        resolved_args = self.arg_resolver.resolve(keyword, list(args or []))
+
+        self._build_args_editor(resolved_args)
+        self._show_window()
+        if hasattr(self, "retry_btn"):
+            self.retry_btn.config(state=tk.NORMAL)
+        if hasattr(self, "skip_kw_btn"):
+            self.skip_kw_btn.config(state=tk.NORMAL)
+
+        self.update_status("Ready for action.", "blue")
+
+    def _set_call_stack(self, call_stack):
         # Store call stack optimized - only keep necessary data, not full objects
         if call_stack:
             self._current_call_stack = [
@@ -644,67 +897,85 @@ class SimpleRetryGUI:
             self.view_stack_btn.pack(side=tk.RIGHT, padx=3, pady=3)
         else:
             self.view_stack_btn.pack_forget()
-        
-        # Enhanced failure display
-        self.failure_text.config(state=tk.NORMAL)
-        
-        # Header with visual separator
-        self.failure_text.insert(tk.END, f"\n{'═' * 70}\n", "separator")
-        self.failure_text.insert(tk.END, f"[!] TEST FAILURE DETECTED\n", "fail")
-        self.failure_text.insert(tk.END, f"[TIME] {timestamp}\n", "timestamp")
-        self.failure_text.insert(tk.END, f"{'═' * 70}\n", "separator")
-        
-        # Test details with labels
-        self.failure_text.insert(tk.END, "\n[TEST] ", "label")
-        self.failure_text.insert(tk.END, f"{test}\n", "value")
-        
-        self.failure_text.insert(tk.END, "[KEYWORD] ", "label")
-        self.failure_text.insert(tk.END, f"{keyword}\n", "keyword")
-        
-        # Message
-        self.failure_text.insert(tk.END, "\n[ERROR]:\n", "label")
-        for line in message.strip().split('\n'):
-            if line.strip():
-                self.failure_text.insert(tk.END, f"   {line}\n", "message")
-        
-        # Footer separator
-        self.failure_text.insert(tk.END, f"\n{'═' * 70}\n", "separator")
-
-        self.failure_text.see(tk.END)
-        self.failure_text.config(state=tk.DISABLED)
 
-        # Set keyword for retry tab
-        self.kw_name_var.set(keyword)
-
-        # Resolve arguments for retry
-        builtin = BuiltIn()
-        resolved_args = []
-        for a in args:
-            if isinstance(a, str) and a.startswith("${") and a.endswith("}"):
-                try:
-                    resolved_args.append(builtin.get_variable_value(a))
-                except:
-                    resolved_args.append(a)
-            else:
-                resolved_args.append(a)
+    def show_breakpoint(self, breakpoint, when, suite, test, keyword, args, status=None, error=None, call_stack=None):
+        """Execution is paused at a breakpoint; Continue in the Breakpoints tab resumes it."""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._set_call_stack(call_stack)
+        segments = [
+            (f"\n{'═' * 70}\n", "separator"),
+            ("[BP] BREAKPOINT HIT\n", "warning"),
+            (f"[TIME] {timestamp}\n", "timestamp"),
+            (f"{'═' * 70}\n", "separator"),
+            ("\n[TEST] ", "label"),
+            (f"{test or '(suite level)'}\n", "value"),
+            ("[KEYWORD] ", "label"),
+            (f"{keyword}\n", "keyword"),
+            ("[ARGS] ", "label"),
+            (f"{', '.join(str(a) for a in args) or '(none)'}\n", "args"),
+            ("[WHERE] ", "label"),
+            (f"{'before the keyword runs' if when == 'before' else f'after the keyword ({status})'}\n", "value"),
+            ("[BREAKPOINT] ", "label"),
+            (f"{breakpoint.describe()} (hit {breakpoint.hits})\n", "value"),
+        ]
+        if error:
+            segments += [("[CONDITION ERROR] ", "label"), (f"{error}\n", "message")]
+        segments.append((f"{'═' * 70}\n", "separator"))
+        self.append_log("breakpoint", segments, tag="warning")
 
-        self._build_args_editor(resolved_args)
+        self.breakpoint_panel.show_paused(breakpoint)
+        self.sub_tabs.select(self.breakpoints_tab)
         self._show_window()
-        if hasattr(self, "retry_btn"):
-            self.retry_btn.config(state=tk.NORMAL)
-        if hasattr(self, "skip_kw_btn"):
-            self.skip_kw_btn.config(state=tk.NORMAL)
+        self.update_status(f"[BP] Paused {when} '{keyword}'", "orange")
 
-        self.update_status("Ready for action.", "blue")
+    def _on_breakpoint_continue(self):
+        if self.core.paused_at_breakpoint is None:
+            return
+        self.update_status("[>] Running...", "green")
+        self.core.continue_event.set()
 
-    def _build_args_editor(self, args):
+    def _breakpoint_call_sites(self, breakpoint):
+        """Static call sites a breakpoint can stop at, from the suite index (None until it is built)."""
+        index = self.core.suite_index
+        if index is None or not index.ready:
+            return None
+        if breakpoint.is_glob:
+            sites = index.call_sites(matches=breakpoint.matches_name)
+        else:
+            # Library.Keyword breakpoints also stop where the keyword is called without its library
+            names = {breakpoint.keyword, breakpoint.keyword.rsplit(".", 1)[-1]}
+            sites = [site for name in names for site in index.call_sites(name)]
+        # Calls inside suite-file keywords can run from any test
+        return [site for site in sites if not isinstance(site.owner, TestEntry)
+                or breakpoint.in_scope(site.owner.name, site.owner.suite, site.owner.tags)]
+
+    def breakpoint_resumed(self):
+        """Robot left a breakpoint pause (Continue, Skip Test or Abort)."""
+        self.breakpoint_panel.show_paused(None)
+
+    def _build_args_editor(self, resolved_args):
+        """Show one field per resolved value, labelled with the raw argument it came from."""
         for widget in self.args_frame.winfo_children():
             widget.destroy()
         self.arg_vars = []
-        for val in args or []:
-            self._add_argument_field(val)
-
-    def _add_argument_field(self, value=""):
+        self._arg_sources = []
+        self._arg_groups = list(resolved_args or [])
+
+        for group, resolved in enumerate(self._arg_groups):
+            raw = str(resolved.raw)
+            for i, value in enumerate(resolved.values):
+                if resolved.kind == "literal":
+                    raw_label = ""
+                elif len(resolved.values) == 1 and resolved.kind not in ("list", "dict"):
+                    raw_label = raw
+                else:
+                    raw_label = f"{raw}[{i}]"
+                if resolved.error:
+                    raw_label += " (unresolved)"
+                text = str(value)
+                self._add_argument_field(text, raw_label=raw_label, source=(group, text))
+
+    def _add_argument_field(self, value="", raw_label="", source=None):
         index = len(self.arg_vars)
         var = tk.StringVar(value=str(value))
         frame = tk.Frame(self.args_frame)
@@ -712,12 +983,106 @@ class SimpleRetryGUI:
         tk.Label(frame, text=f"Arg {index + 1}:").pack(side='left')
         tk.Entry(frame, textvariable=var, width=70).pack(side='left', padx=2)
         tk.Button(frame, text="–", command=lambda f=frame: self._remove_argument_field(f)).pack(side='left')
+        if raw_label:
+            tk.Label(frame, text=raw_label, fg="#666666", font=("Consolas", 8)).pack(side='left', padx=5)
         self.arg_vars.append(var)
+        self._arg_sources.append(source)
 
     def _remove_argument_field(self, frame):
         idx = list(self.args_frame.children.values()).index(frame)
         frame.destroy()
         del self.arg_vars[idx]
+        del self._arg_sources[idx]
+
+    def _collect_retry_args(self):
+        """
+        Build retry arguments from the editor. Arguments whose fields were left
+        untouched are passed in raw form so Robot resolves them exactly as in the
+        original call (keeping objects, list/dict expansion and named args).
+        Returns None if an edited field cannot be converted to its declared type.
+        """
+        fields_per_group = {}
+        for var, source in zip(self.arg_vars, self._arg_sources):
+            if source is not None:
+                fields_per_group.setdefault(source[0], []).append(var.get() == source[1])
+        unchanged = {
+            group for group, flags in fields_per_group.items()
+            if all(flags) and len(flags) == len(self._arg_groups[group].values)
+        }
+
+        texts = [var.get() for var in self.arg_vars]
+        edited = [source is None or source[0] not in unchanged for source in self._arg_sources]
+
+        # Edited fields are converted using the keyword's declared argument types
+        key, spec = self._find_keyword_spec(self.kw_name_var.get().strip())
+        if spec is not None:
+            converted, errors = self.converter_cache.get(key, spec).convert(texts)
+            errors = [(i, message) for i, message in errors if edited[i]]
+            if errors:
+                self._report_conversion_errors(self.kw_name_var.get().strip(), errors)
+                return None
+        elif key is not None:
+            converted = texts  # Known keyword without a spec: Robot converts the text as it would from a test
+        else:
+            converted = [self.core.parse_arg(text) if edited[i] else text for i, text in enumerate(texts)]
+
+        args = []
+        emitted = set()
+        for i, source in enumerate(self._arg_sources):
+            if not edited[i]:
+                if source[0] not in emitted:
+                    emitted.add(source[0])
+                    args.append(self._arg_groups[source[0]].raw)
+                continue
+            args.append(converted[i])
+        return args
+
+    def _resolve_keyword(self, kw_name, library=None):
+        """
+        (dropdown label, catalog, keyword name) for an (optionally qualified) name, or None.
+        `library` and the qualifier match a dropdown label or a library/resource name.
+        """
+        def named(label, catalog, wanted):
+            return normalize_name(wanted) in (normalize_name(label), normalize_name(catalog.name))
+
+        if library is None and "." in kw_name:
+            prefix, short = kw_name.rsplit(".", 1)
+            if any(named(label, self.libraries[key], prefix) for label, key in self._library_labels.items()):
+                library, kw_name = prefix, short
+        for label, key in self._library_labels.items():
+            catalog = self.libraries[key]
+            if library and not named(label, catalog, library):
+                continue
+            name = catalog.find(kw_name)
+            if name is not None:
+                return label, catalog, name
+        return None
+
+    def _find_keyword_spec(self, kw_name, library=None):
+        """
+        Look up a keyword's libdoc arg spec by (optionally library-qualified) name.
+        Returns (key, spec); spec is None for a known keyword whose spec cannot be had,
+        and (None, None) for an unknown keyword.
+        """
+        resolved = self._resolve_keyword(kw_name, library)
+        if resolved is None:
+            return None, None
+        lib, catalog, name = resolved
+        args = catalog.args(name)
+        if args is None and catalog.fetch is not None:
+            # Dynamic/remote keyword not described yet: it is one keyword, fetch its spec now
+            try:
+                args, _ = catalog.fetch(name)
+            except Exception as e:
+                logger.warning(f"[Debugger GUI] Cannot fetch arguments of '{lib}.{name}': {e}")
+                args = None
+            if args is not None:
+                catalog.set_args(name, args)
+        return (lib, name), args
+
+    def _report_conversion_errors(self, kw_name, errors):
+        details = "\n".join(f"Arg {i + 1}: {message}" for i, message in errors)
+        messagebox.showerror("Invalid Arguments", f"Cannot run '{kw_name}':\n\n{details}")
 
     def _on_add_argument(self):
         self._add_argument_field()
@@ -726,97 +1091,114 @@ class SimpleRetryGUI:
     def _on_start_test(self):
         """Handle Start Test button click."""
         self.start_test_btn.config(state=tk.DISABLED)
-        self.control_status_label.config(text="[>] Starting...", fg="#006600")
+        self._post_status("[>] Starting...", "#006600")
         
         # Enhanced log message
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.failure_text.config(state=tk.NORMAL)
-        self.failure_text.insert(tk.END, f"\n{'─' * 70}\n", "separator")
-        self.failure_text.insert(tk.END, "[>] TEST EXECUTION STARTED", "pass")
-        self.failure_text.insert(tk.END, f" [{timestamp}]\n", "timestamp")
-        self.failure_text.insert(tk.END, f"   User initiated test run\n", "value")
-        self.failure_text.insert(tk.END, f"{'─' * 70}\n\n", "separator")
-        self.failure_text.see(tk.END)
-        self.failure_text.config(state=tk.DISABLED)
+        self.append_log("control", [
+            (f"\n{'─' * 70}\n", "separator"),
+            ("[>] TEST EXECUTION STARTED", "pass"),
+            (f" [{timestamp}]\n", "timestamp"),
+            ("   User initiated test run\n", "value"),
+            (f"{'─' * 70}\n\n", "separator"),
+        ], tag="pass")
         
         # Unblock the test suite
         self.core.test_start_event.set()
         
-        logging.info("[Debugger GUI] User clicked Start Test")
+        logger.info("[Debugger GUI] User clicked Start Test")
     
     def show_ready_state(self, suite_name):
         """Show that test is ready but not started."""
-        self.control_status_label.config(
-            text=f"[READY] {suite_name}",
-            fg="#003366"
-        )
+        self._post_status(f"[READY] {suite_name}", "#003366")
         self.start_test_btn.config(state=tk.NORMAL)
         
         # Show message in log
-        self.failure_text.config(state=tk.NORMAL)
-        self.failure_text.insert(
-            tk.END,
+        self.append_log("control", [(
             f"\n{'='*60}\n"
             f"Test Suite Ready: {suite_name}\n"
             f"Click '[>] Start' button to begin\n"
             f"Configure ignore keywords in Retry tab before starting\n"
             f"{'='*60}\n\n",
             "header"
-        )
-        self.failure_text.see(tk.END)
-        self.failure_text.config(state=tk.DISABLED)
+        )], tag="header")
         
         # Bring window to front
         self._show_window()
     
     def show_running_state(self):
         """Update UI when test starts running."""
-        self.control_status_label.config(
-            text="[>] Running...",
-            fg="#006600"
-        )
+        self._post_status("[>] Running...", "#006600")
         self.start_test_btn.config(state=tk.DISABLED, text="[>] Running...")
 
     # === IGNORE KEYWORDS HANDLERS ===
     def _refresh_ignore_keyword_list(self):
-        """Populate the keyword dropdown from libraries and seen keywords."""
-        # Gather all keywords
-        all_keywords = set()
-        
-        # From loaded libraries
-        for lib, keywords in self.libraries.items():
-            for kw in keywords:
-                all_keywords.add(kw['name'])
+        """Merge library and seen keywords into the ignore catalog and redisplay."""
+        for lib, catalog in self.libraries.items():
+            self.ignore_catalog.merge(catalog.names)
         
         # From seen keywords during execution
         if hasattr(self.core, 'seen_keywords'):
-            all_keywords.update(self.core.seen_keywords)
-        
-        self._all_keywords = sorted(list(all_keywords))
+            seen = list(self.core.seen_keywords)
+            self.ignore_catalog.merge(seen)
+            self.keyword_index.add_many(seen, "seen")
         
         # Update dropdown with filter
         self._filter_ignore_dropdown()
         
         # Update ignored list display
         self._update_ignored_display()
+
+    def _merge_ignore_candidates(self, names):
+        """Add newly loaded keywords to the ignore catalog; only the visible window is redrawn."""
+        if self.ignore_catalog.merge(names) and not self.ignore_search_var.get().strip():
+            self._filter_ignore_dropdown(keep_selection=True)
     
-    def _filter_ignore_dropdown(self):
-        """Filter dropdown based on search term."""
-        search_term = self.ignore_search_var.get().lower()
+    def _filter_ignore_dropdown(self, keep_selection=False):
+        """Filter dropdown based on search term.
+        Without a term the dropdown shows a window of the sorted catalog with
+        previous/more items to move it, so Tk never holds the full list.
+        """
+        search_term = self.ignore_search_var.get().strip()
         
         if search_term:
-            filtered = [kw for kw in self._all_keywords if search_term in kw.lower()]
+            # Ranked fuzzy matches; the same name from several sources is listed once
+            matches = self.keyword_index.search(search_term, self.KEYWORD_SEARCH_LIMIT * 2)
+            filtered = list(dict.fromkeys(name for name, _ in matches))[:self.KEYWORD_SEARCH_LIMIT]
+            values = filtered
         else:
-            filtered = self._all_keywords
-        
-        self.ignore_keyword_dropdown['values'] = filtered
+            size = self.IGNORE_DROPDOWN_WINDOW
+            start = self._ignore_window_start = min(self._ignore_window_start, max(0, len(self.ignore_catalog) - 1))
+            filtered = self.ignore_catalog.window(start, size)
+            values = ([self.IGNORE_PREV_ITEM] if start > 0 else []) + filtered
+            if start + size < len(self.ignore_catalog):
+                values.append(self.IGNORE_NEXT_ITEM)
+        
+        current = self.ignore_keyword_dropdown.get()
+        self.ignore_keyword_dropdown['values'] = values
+        if keep_selection and current in filtered:
+            return
         if filtered:
-            self.ignore_keyword_dropdown.current(0)
+            self.ignore_keyword_dropdown.set(filtered[0])
+        else:
+            self.ignore_keyword_dropdown.set("")
+
+    def _on_ignore_dropdown_selected(self, event=None):
+        """Move the browsing window when a previous/more item is picked, and reopen the list."""
+        selected = self.ignore_keyword_dropdown.get()
+        if selected == self.IGNORE_PREV_ITEM:
+            self._ignore_window_start = max(0, self._ignore_window_start - self.IGNORE_DROPDOWN_WINDOW)
+        elif selected == self.IGNORE_NEXT_ITEM:
+            self._ignore_window_start += self.IGNORE_DROPDOWN_WINDOW
+        else:
+            return
+        self._filter_ignore_dropdown()
+        self.ignore_keyword_dropdown.after_idle(lambda: self.ignore_keyword_dropdown.event_generate("<Down>"))
     
     def _add_keyword_to_ignore(self):
         """Add selected keyword from dropdown to ignore list."""
         selected = self.ignore_keyword_dropdown.get()
-        if not selected:
+        if not selected or selected in (self.IGNORE_PREV_ITEM, self.IGNORE_NEXT_ITEM):
             messagebox.showwarning("No Selection", "Please select a keyword from the dropdown.")
             return
         
@@ -829,16 +1211,90 @@ class SimpleRetryGUI:
         
         # Enhanced log message
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.failure_text.config(state=tk.NORMAL)
-        self.failure_text.insert(tk.END, f"\n{'─' * 70}\n", "separator")
-        self.failure_text.insert(tk.END, "[+] KEYWORD IGNORED", "pass")
-        self.failure_text.insert(tk.END, f" [{timestamp}]\n", "timestamp")
-        self.failure_text.insert(tk.END, f"   Added '", "value")
-        self.failure_text.insert(tk.END, f"{selected}", "keyword")
-        self.failure_text.insert(tk.END, f"' to ignore list\n", "value")
-        self.failure_text.insert(tk.END, f"{'─' * 70}\n", "separator")
-        self.failure_text.see(tk.END)
-        self.failure_text.config(state=tk.DISABLED)
+        self.append_log("ignore", [
+            (f"\n{'─' * 70}\n", "separator"),
+            ("[+] KEYWORD IGNORED", "pass"),
+            (f" [{timestamp}]\n", "timestamp"),
+            ("   Added '", "value"),
+            (f"{selected}", "keyword"),
+            ("' to ignore list\n", "value"),
+            (f"{'─' * 70}\n", "separator"),
+        ], tag="pass")
+    
+    def _add_pattern_to_ignore(self):
+        """Add the Search text as an ignore rule (glob, re:, message:, Library.Keyword or exact name)."""
+        rule = self.ignore_search_var.get().strip()
+        if not rule:
+            messagebox.showwarning("No Pattern", "Type a rule in the Search field, e.g. 'Wait Until *' or 'message:*stale*'.")
+            return
+        error = rule_error(rule)
+        if error:
+            messagebox.showerror("Invalid Pattern", f"'{rule}' is not a valid rule:\n{error}")
+            return
+        if rule in self.core.ignored_keywords:
+            messagebox.showinfo("Already Ignored", f"'{rule}' is already in the ignore list.")
+            return
+        
+        self.core.ignored_keywords.add(rule)
+        self._update_ignored_display()
+        
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.append_log("ignore", [
+            (f"\n{'─' * 70}\n", "separator"),
+            ("[+] IGNORE RULE ADDED", "pass"),
+            (f" [{timestamp}]\n", "timestamp"),
+            (f"   Added {rule_kind(rule)} rule '", "value"),
+            (f"{rule}", "keyword"),
+            ("' to ignore list\n", "value"),
+            (f"{'─' * 70}\n", "separator"),
+        ], tag="pass")
+    
+    def _refresh_ignore_profiles(self):
+        self.ignore_profile_dropdown['values'] = list_profiles()
+    
+    def _load_ignore_profile(self):
+        """Add the rules of the selected profile to the ignore list."""
+        name = self.ignore_profile_dropdown.get().strip()
+        if not name:
+            messagebox.showwarning("No Profile", "Select or type a profile name.")
+            return
+        count = self.core.load_ignore_profile(name)
+        if count is None:
+            messagebox.showerror("Load Failed", f"Cannot load ignore profile '{name}'. See the debugger log.")
+            return
+        self._update_ignored_display()
+        
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.append_log("ignore", [
+            (f"\n{'─' * 70}\n", "separator"),
+            ("[+] IGNORE PROFILE LOADED", "pass"),
+            (f" [{timestamp}]\n", "timestamp"),
+            (f"   Loaded {count} rule(s) from profile '{name}'\n", "value"),
+            (f"{'─' * 70}\n", "separator"),
+        ], tag="pass")
+    
+    def _save_ignore_profile(self):
+        """Save the current ignore list as the named profile."""
+        name = self.ignore_profile_dropdown.get().strip()
+        if not name:
+            messagebox.showwarning("No Profile", "Type a profile name to save the ignore list under.")
+            return
+        try:
+            path = save_profile(name, self.core.ignored_keywords)
+        except OSError as e:
+            logger.warning(f"[Debugger GUI] Cannot save ignore profile '{name}': {e}")
+            messagebox.showerror("Save Failed", f"Cannot save ignore profile '{name}':\n{e}")
+            return
+        self._refresh_ignore_profiles()
+        
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.append_log("ignore", [
+            (f"\n{'─' * 70}\n", "separator"),
+            ("[S] IGNORE PROFILE SAVED", "pass"),
+            (f" [{timestamp}]\n", "timestamp"),
+            (f"   Saved {len(self.core.ignored_keywords)} rule(s) to {path}\n", "value"),
+            (f"{'─' * 70}\n", "separator"),
+        ], tag="pass")
     
     def _remove_keyword_from_ignore(self):
         """Remove keyword from ignored list (asks user to type or select)."""
@@ -874,16 +1330,15 @@ class SimpleRetryGUI:
             
             # Enhanced log message
             timestamp = datetime.now().strftime("%H:%M:%S")
-            self.failure_text.config(state=tk.NORMAL)
-            self.failure_text.insert(tk.END, f"\n{'─' * 70}\n", "separator")
-            self.failure_text.insert(tk.END, "[-] KEYWORD REMOVED FROM IGNORE LIST", "warning")
-            self.failure_text.insert(tk.END, f" [{timestamp}]\n", "timestamp")
-            self.failure_text.insert(tk.END, f"   Removed '", "value")
-            self.failure_text.insert(tk.END, f"{keyword}", "keyword")
-            self.failure_text.insert(tk.END, f"' from ignore list\n", "value")
-            self.failure_text.insert(tk.END, f"{'─' * 70}\n", "separator")
-            self.failure_text.see(tk.END)
-            self.failure_text.config(state=tk.DISABLED)
+            self.append_log("ignore", [
+                (f"\n{'─' * 70}\n", "separator"),
+                ("[-] KEYWORD REMOVED FROM IGNORE LIST", "warning"),
+                (f" [{timestamp}]\n", "timestamp"),
+                ("   Removed '", "value"),
+                (f"{keyword}", "keyword"),
+                ("' from ignore list\n", "value"),
+                (f"{'─' * 70}\n", "separator"),
+            ], tag="warning")
         else:
             messagebox.showwarning("Not Found", f"'{keyword}' not in ignore list.")
     
@@ -898,14 +1353,13 @@ class SimpleRetryGUI:
         
         # Enhanced log message
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.failure_text.config(state=tk.NORMAL)
-        self.failure_text.insert(tk.END, f"\n{'─' * 70}\n", "separator")
-        self.failure_text.insert(tk.END, "[X] IGNORE LIST CLEARED", "warning")
-        self.failure_text.insert(tk.END, f" [{timestamp}]\n", "timestamp")
-        self.failure_text.insert(tk.END, f"   Cleared {count} keyword(s) from ignore list\n", "value")
-        self.failure_text.insert(tk.END, f"{'─' * 70}\n", "separator")
-        self.failure_text.see(tk.END)
-        self.failure_text.config(state=tk.DISABLED)
+        self.append_log("ignore", [
+            (f"\n{'─' * 70}\n", "separator"),
+            ("[X] IGNORE LIST CLEARED", "warning"),
+            (f" [{timestamp}]\n", "timestamp"),
+            (f"   Cleared {count} keyword(s) from ignore list\n", "value"),
+            (f"{'─' * 70}\n", "separator"),
+        ], tag="warning")
     
     def _update_ignored_display(self):
         """Update the compact text display of ignored keywords."""
@@ -938,6 +1392,11 @@ class SimpleRetryGUI:
             messagebox.showerror("Error", "Cannot retry - keyword information missing.")
             return
 
+        # Convert before running so bad input is reported instantly instead of as a failing retry
+        args = self._collect_retry_args()
+        if args is None:
+            return
+
         # Disable buttons safely during retry
         if hasattr(self, "retry_btn"):
             self.retry_btn.config(state=tk.DISABLED)
@@ -945,7 +1404,6 @@ class SimpleRetryGUI:
             self.skip_kw_btn.config(state=tk.DISABLED)
 
         kw_name = self.kw_name_var.get().strip()
-        args = [self.core.parse_arg(var.get()) for var in self.arg_vars]
 
         self.update_status("Retrying keyword...", "blue")
 
@@ -1017,49 +1475,37 @@ class SimpleRetryGUI:
         if args is None:
             args = self.core.failed_keyword.args if self.core.failed_keyword else []
 
-        self.failure_text.config(state=tk.NORMAL)
-        
         # Status indicator and header
         status_icons = {"pass": "[OK]", "fail": "[FAIL]", "pending": "[WAIT]", "warning": "[WARN]"}
         icon = status_icons.get(status, "[INFO]")
-        
-        # Header with colored box
-        header_text = f"\n{'═' * 70}\n"
-        self.failure_text.insert(tk.END, header_text, "separator")
-        
         status_text = f"{icon} {'PASSED' if status == 'pass' else 'FAILED' if status == 'fail' else status.upper()}"
-        self.failure_text.insert(tk.END, f"{status_text}\n", status)
-        
-        # Timestamp
-        self.failure_text.insert(tk.END, f"[TIME] {timestamp}\n", "timestamp")
-        self.failure_text.insert(tk.END, f"{'─' * 70}\n", "separator")
-        
-        # Test name
-        self.failure_text.insert(tk.END, "\n[TEST] ", "label")
-        self.failure_text.insert(tk.END, f"{test_name}\n", "value")
-        
-        # Keyword name
-        self.failure_text.insert(tk.END, "[KEYWORD] ", "label")
-        self.failure_text.insert(tk.END, f"{keyword_name}\n", "keyword")
+
+        segments = [
+            # Header with colored box
+            (f"\n{'═' * 70}\n", "separator"),
+            (f"{status_text}\n", status),
+            # Timestamp
+            (f"[TIME] {timestamp}\n", "timestamp"),
+            (f"{'─' * 70}\n", "separator"),
+            # Test name
+            ("\n[TEST] ", "label"),
+            (f"{test_name}\n", "value"),
+            # Keyword name
+            ("[KEYWORD] ", "label"),
+            (f"{keyword_name}\n", "keyword"),
+        ]
         
         # Arguments
         if args:
-            self.failure_text.insert(tk.END, "[ARGS]:\n", "label")
-            for i, arg in enumerate(args, 1):
-                arg_str = str(arg)
-                if len(arg_str) > 100:
-                    arg_str = arg_str[:97] + "..."
-                self.failure_text.insert(tk.END, f"   [{i}] ", "label")
-                self.failure_text.insert(tk.END, f"{arg_str}\n", "args")
+            segments.append(("[ARGS]:\n", "label"))
+            segments.extend(self.payloads.fold_args(list(args)))
         
         # Reason/Message
         reason = text.strip()
         if reason:
-            self.failure_text.insert(tk.END, "\n[MESSAGE]:\n", "label")
-            # Handle multi-line messages
-            for line in reason.split('\n'):
-                if line.strip():
-                    self.failure_text.insert(tk.END, f"   {line}\n", "message")
+            segments.append(("\n[MESSAGE]:\n", "label"))
+            # Large messages are folded into a bounded preview
+            segments.extend(self.payloads.fold_message(reason, "message"))
         
         # Return value if present
         if "${RETURN_VALUE}" in text or "return value" in text.lower():
@@ -1067,15 +1513,25 @@ class SimpleRetryGUI:
             for line in lines:
                 if "${RETURN_VALUE}" in line or "return value" in line.lower():
                     ret_val = line.split('=')[-1].strip()
-                    self.failure_text.insert(tk.END, "\n[RETURN] ", "label")
-                    self.failure_text.insert(tk.END, f"{ret_val}\n", "value")
+                    segments.append(("\n[RETURN]\n", "label"))
+                    segments.extend(self.payloads.fold_message(ret_val, "value"))
         
         # Footer
-        self.failure_text.insert(tk.END, f"{'═' * 70}\n", "separator")
-        
-        self.failure_text.see(tk.END)
-        self.failure_text.config(state=tk.DISABLED)
-        self._trim_failure_log()
+        segments.append((f"{'═' * 70}\n", "separator"))
+        self.append_log(self._entry_kind(prefix), segments, tag=status)
+
+    @staticmethod
+    def _entry_kind(prefix):
+        """Map a display prefix like '[Custom] ...' or '[Test] Retry' to a log entry kind."""
+        if prefix.startswith("[Custom]"):
+            return "custom"
+        if prefix.startswith("[Variables]"):
+            return "variables"
+        if prefix.endswith("Retry"):
+            return "retry"
+        if prefix.endswith("Skip Keyword"):
+            return "skip"
+        return "info"
     
     def _log_custom_execution(self, text, status):
         """Log custom keyword execution with enhanced formatting"""
@@ -1083,34 +1539,101 @@ class SimpleRetryGUI:
         status_icons = {"pass": "[OK]", "fail": "[FAIL]", "pending": "[WAIT]", "warning": "[WARN]"}
         icon = status_icons.get(status, "[INFO]")
         
-        self.failure_text.config(state=tk.NORMAL)
-        
-        self.failure_text.insert(tk.END, f"\n{'─' * 70}\n", "separator")
-        self.failure_text.insert(tk.END, f"{icon} Custom Keyword Execution", "section")
-        self.failure_text.insert(tk.END, f" [{timestamp}]\n", "timestamp")
-        self.failure_text.insert(tk.END, f"   {text}\n", status)
-        self.failure_text.insert(tk.END, f"{'─' * 70}\n", "separator")
-        
-        self.failure_text.see(tk.END)
-        self.failure_text.config(tk.DISABLED)
-        self._trim_failure_log()
-
-    def _trim_failure_log(self, max_lines=None):
-        if max_lines is None:
-            max_lines = self.MAX_FAILURE_LOG_LINES
-        lines = self.failure_text.get("1.0", tk.END).splitlines()
-        if len(lines) > max_lines:
-            trimmed = "\n".join(lines[-max_lines:])
-            self.failure_text.config(state=tk.NORMAL)
-            self.failure_text.delete("1.0", tk.END)
-            self.failure_text.insert(tk.END, trimmed)
-            self.failure_text.config(state=tk.DISABLED)
+        self.append_log("custom", [
+            (f"\n{'─' * 70}\n", "separator"),
+            (f"{icon} Custom Keyword Execution", "section"),
+            (f" [{timestamp}]\n", "timestamp"),
+            *self.payloads.fold_message(text, status),
+            (f"{'─' * 70}\n", "separator"),
+        ], tag=status)
+
+    def append_log(self, kind, segments, tag=None, test=None):
+        """
+        Add a structured entry to the log ring buffer and search index. Safe from any
+        thread; rendering happens on the next scheduler frame if the view follows the tail.
+        test defaults to the running test; pass "" for entries outside any test.
+        """
+        if test is None:
+            test = self.core.current_test
+        with self._log_append_lock:
+            entry = self.log_buffer.append(kind, segments, tag, test or None, self.LOG_STATUS_TAGS.get(tag))
+            self.log_index.add(entry)
+        self.render_scheduler.request_flush()
+        return entry
+
+    def _on_fold_click(self, event):
+        """Open the paged viewer for the folded payload under the mouse."""
+        segment = self.log_panel.segment_at(f"@{event.x},{event.y}")
+        payload_id = next((t for t in segment[1] if type(t) is int), None) if segment else None
+        if payload_id is None:
+            return
+        text = self.payloads.get_text(payload_id)
+        if text is None:
+            messagebox.showinfo("Payload", "This payload is no longer kept in memory.")
+            return
+        PayloadViewer(self.root, "Full Content", text)
+
+    # === LOG SEARCH ===
+    def _setup_log_search_bar(self, parent):
+        bar = tk.Frame(parent)
+        bar.grid(row=0, column=0, sticky="ew", pady=(0, 3))
+
+        tk.Label(bar, text="Search:").pack(side=tk.LEFT)
+        self.log_search_var = tk.StringVar()
+        search_entry = tk.Entry(bar, textvariable=self.log_search_var, width=24)
+        search_entry.pack(side=tk.LEFT, padx=(2, 6))
+        search_entry.bind("<Return>", lambda e: self._on_log_search_step(forward=True))
+        search_entry.bind("<Shift-Return>", lambda e: self._on_log_search_step(forward=False))
+
+        tk.Label(bar, text="Kind:").pack(side=tk.LEFT)
+        self.log_kind_var = tk.StringVar(value="All")
+        ttk.Combobox(
+            bar, textvariable=self.log_kind_var, values=list(self.LOG_SEARCH_KINDS),
+            state="readonly", width=11
+        ).pack(side=tk.LEFT, padx=(2, 6))
+
+        tk.Label(bar, text="Status:").pack(side=tk.LEFT)
+        self.log_status_var = tk.StringVar(value="All")
+        ttk.Combobox(
+            bar, textvariable=self.log_status_var, values=["All"] + sorted(set(self.LOG_STATUS_TAGS.values())),
+            state="readonly", width=7
+        ).pack(side=tk.LEFT, padx=(2, 6))
+
+        tk.Label(bar, text="Test:").pack(side=tk.LEFT)
+        self.log_test_var = tk.StringVar()
+        test_entry = tk.Entry(bar, textvariable=self.log_test_var, width=16)
+        test_entry.pack(side=tk.LEFT, padx=(2, 6))
+        test_entry.bind("<Return>", lambda e: self._on_log_search_step(forward=True))
+
+        tk.Button(bar, text="<", width=2, command=lambda: self._on_log_search_step(forward=False)).pack(side=tk.LEFT)
+        tk.Button(bar, text=">", width=2, command=lambda: self._on_log_search_step(forward=True)).pack(side=tk.LEFT, padx=(2, 6))
+        self.log_search_label = tk.Label(bar, text="", fg="#666666")
+        self.log_search_label.pack(side=tk.LEFT)
+
+    def _on_log_search_step(self, forward=True):
+        """Jump to the next/previous log entry matching the search bar filters."""
+        kind = self.LOG_SEARCH_KINDS.get(self.log_kind_var.get())
+        status = self.log_status_var.get()
+        self.log_search.set_query(
+            self.log_search_var.get().strip(),
+            kind,
+            None if status == "All" else status,
+            self.log_test_var.get().strip() or None,
+        )
+        if self.log_search.query == ("", None, None, None):
+            self.log_search_label.config(text="")
+            return
+        seq = self.log_search.next() if forward else self.log_search.previous()
+        if seq is None or not self.log_panel.show_seq(seq):
+            self.log_search_label.config(text="No matches", fg="#8B0000")
+            return
+        index, total = self.log_search.position()
+        self.log_search_label.config(text=f"{index} / {total}", fg="#666666")
 
     # def update_status(self, text, color="black"):
     #     self.control_status_label.config(text=text, fg=color)
     def update_status(self, text, color="black"):
         # Now uses control_status_label (merged with control bar)
-        self.control_status_label.config(text=text)
         # Keep control bar background consistent
         fg_color = {
             "blue": "#003366",
@@ -1119,7 +1642,13 @@ class SimpleRetryGUI:
             "gray": "#666666",
             "orange": "#CC6600"
         }.get(color, "#003366")
-        self.control_status_label.config(fg=fg_color)
+        self._post_status(text, fg_color)
+
+    def _post_status(self, text, fg):
+        # Coalesced: only the latest status of a frame reaches Tk
+        self.render_scheduler.post(
+            lambda: self.control_status_label.config(text=text, fg=fg), key="status"
+        )
 
     def _on_skip_test(self):
         self.update_status("[SKIP] Test skipped", "orange")
@@ -1198,6 +1727,10 @@ class SimpleRetryGUI:
         # Header style
         stack_text.tag_config("header", foreground="#FFFFFF", font=("Consolas", 11, "bold"))
         stack_text.tag_config("arrow", foreground="#00FF00")
+        stack_text.tag_config("location", foreground="#888888", font=("Consolas", 9))
+        stack_text.tag_config("kwlink", underline=True)
+        stack_text.tag_bind("kwlink", "<Enter>", lambda e: stack_text.config(cursor="hand2"))
+        stack_text.tag_bind("kwlink", "<Leave>", lambda e: stack_text.config(cursor=""))
         
         # Insert header
         stack_text.insert(tk.END, "Execution Call Stack:\n", "header")
@@ -1228,11 +1761,23 @@ class SimpleRetryGUI:
             # Color based on depth (cycle through colors)
             color_tag = f"level{depth % len(colors)}"
             
-            # Insert with color
+            # Insert with color; known keywords link to the custom tab
             stack_text.insert(tk.END, f"{indent}", color_tag)
             stack_text.insert(tk.END, "↳ ", "arrow")
-            stack_text.insert(tk.END, f"{kw_name}", color_tag)
-            stack_text.insert(tk.END, f"({args_preview})\n", color_tag)
+            resolved = self._resolve_keyword(kw_name)
+            if resolved is not None:
+                lib, catalog, name = resolved
+                link_tag = f"kwlink{depth}"
+                stack_text.insert(tk.END, f"{kw_name}", (color_tag, "kwlink", link_tag))
+                stack_text.tag_bind(link_tag, "<Button-1>",
+                                    lambda e, lib=lib, name=name: self._open_keyword_in_custom_tab(lib, name))
+            else:
+                stack_text.insert(tk.END, f"{kw_name}", color_tag)
+            stack_text.insert(tk.END, f"({args_preview})", color_tag)
+            location = resolved[1].location(resolved[2]) if resolved is not None else None
+            if location:
+                stack_text.insert(tk.END, f"  {os.path.basename(location[0])}:{location[1] or ''}", "location")
+            stack_text.insert(tk.END, "\n")
         
         stack_text.config(state=tk.DISABLED)
         
@@ -1255,45 +1800,64 @@ class SimpleRetryGUI:
         y = (stack_window.winfo_screenheight() // 2) - (stack_window.winfo_height() // 2)
         stack_window.geometry(f"+{x}+{y}")
 
-    def library_imported(self, name):
-        """Handle a library import event and populate keyword list for the executor tab.
-        If the library fails to load or parse, skip it.
-        """
-        try:
-            # ✅ Normalize path if it's a file-based library
-            if os.path.isfile(name) or name.endswith(".py"):
-                normalized_name = os.path.splitext(os.path.basename(name))[0]
-            else:
-                normalized_name = name
-
-            # ✅ Check if library already loaded to avoid duplicate processing
-            if normalized_name in self.libraries:
-                logging.debug(f"[Debugger GUI] Library '{normalized_name}' already loaded, skipping")
-                return
+    def _open_keyword_in_custom_tab(self, lib, kw_name):
+        """Show a keyword's signature, docs and source in the Run Custom Keyword tab."""
+        self.sub_tabs.select(self.custom_tab)
+        self.custom_search_var.set("")
+        self.library_var.set(lib)
+        self._on_library_selected()
+        self.keyword_var.set(kw_name)
+        self._on_keyword_selected()
+        self._show_window()
 
-            libdoc = LibraryDocumentation(normalized_name)
-            keywords = [{'name': kw.name, 'args': kw.args, 'doc': kw.doc} for kw in libdoc.keywords]
-            self.libraries[libdoc.name] = keywords
-            logging.info(f"[Debugger GUI] Loaded library: {libdoc.name} with {len(keywords)} keywords")
-            
-            # ✅ Update status indicator
-            if hasattr(self, 'library_status_var'):
-                lib_count = len(self.libraries)
-                kw_count = sum(len(kws) for kws in self.libraries.values())
-                self.library_status_var.set(f"[LIBS] {lib_count} libraries, {kw_count} keywords loaded")
+    def library_imported(self, name, source=None, version=None, args=()):
+        """Handle a library import event: queue the library for background libdoc parsing
+        (or a catalog cache read). Returns immediately, so the Robot thread never waits on libdoc.
+        """
+        if self.library_loader.submit(name, source, version, args):
+            self.render_scheduler.post(self._update_library_status, key="library_status")
+        else:
+            logger.debug(f"[Debugger GUI] Library '{name}' already loaded, skipping")
+
+    def resource_imported(self, path):
+        """Handle a resource import event: index its user keywords in the background."""
+        if self.library_loader.submit_resource(path):
+            self.render_scheduler.post(self._update_library_status, key="library_status")
+
+    def _on_library_loaded(self, key, libname, catalog, error):
+        """Worker callback: hand the library's keyword catalog to the Tk thread."""
+        self.render_scheduler.post(lambda: self._apply_library(key, libname, catalog, error))
+
+    def _apply_library(self, key, libname, catalog, error):
+        # Resource files are keyed by their normalized path: two common.resource files are two catalogs
+        key = key if catalog is not None and catalog.kind == "resource" else libname
+        if error is None and key not in self.libraries:
+            label = self._label_for(key, catalog)
+            self.libraries[key] = catalog
+            self._library_labels[label] = key
+            self.keyword_index.add_many(catalog.names, label)
 
             # ✅ Refresh dropdown only if custom tab is ready
             if getattr(self, "executor_ready", False):
                 self._refresh_library_dropdown()
-            
-            # ✅ Refresh ignore keywords list to include new library keywords
-            if hasattr(self, '_all_keywords'):
-                self._refresh_ignore_keyword_list()
 
-        except ImportError as e:
-            logging.warning(f"[Debugger GUI] Library '{name}' not found: {e}")
-        except Exception as e:
-            logging.warning(f"[Debugger GUI] Failed to load library '{name}': {e}")
+            # ✅ Merge the new keywords into the ignore catalog
+            if hasattr(self, 'ignore_keyword_dropdown'):
+                self._merge_ignore_candidates(catalog.names)
+        self._update_library_status()
+
+    def _update_library_status(self):
+        if not hasattr(self, 'library_status_var'):
+            return
+        done, total = self.library_loader.progress()
+        res_count = sum(1 for catalog in self.libraries.values() if catalog.kind == "resource")
+        lib_count = len(self.libraries) - res_count
+        kw_count = sum(len(kws) for kws in self.libraries.values())
+        if done < total:
+            self.library_status_var.set(f"[LIBS] Loading libraries {done}/{total}... ({kw_count} keywords so far)")
+        else:
+            self.library_status_var.set(
+                f"[LIBS] {lib_count} libraries, {res_count} resources, {kw_count} keywords loaded")
 
     def _refresh_library_dropdown(self):
         """Refresh the library and keyword dropdowns in the Custom Keyword tab."""
@@ -1302,7 +1866,7 @@ class SimpleRetryGUI:
         if not all(hasattr(self, attr) for attr in required):
             return  # GUI not ready yet
 
-        lib_names = sorted(self.libraries.keys())
+        lib_names = sorted(self._library_labels)
         self.library_dropdown["values"] = lib_names
         
         # Only auto-select if we have libraries and nothing is selected
@@ -1327,7 +1891,10 @@ class SimpleRetryGUI:
             self.doc_display.config(state=tk.DISABLED)
 
     def start(self):
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.library_loader.shutdown()
 
     # def _on_skip_keyword(self):
     #     # ✅ Debounce: If button is already disabled, return immediately
@@ -1397,47 +1964,80 @@ class SimpleRetryGUI:
 
         threading.Thread(target=do_skip, daemon=True).start()
 
-    def log_keyword_event(self, action, name, args=None, status="pending", message=""):
-        if status.lower() == "pending":
-            return
+    def _on_trace_level_changed(self, event=None):
+        self.core.trace.set_level(self.trace_level_var.get())
+        logger.info(f"[Debugger GUI] Keyword trace level set to {self.core.trace.level}")
+
+    def log_loop_summary(self, stats, depth=0):
+        """One aggregated trace entry for a finished FOR/WHILE loop (called from the Robot thread)."""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        indent = "  " * min(depth, 10)
+        tag = "fail" if stats.any_failed else "pass"
+        segments = [
+            (f"[{timestamp}] {indent}🔁 ", "timestamp"),
+            (stats.label, "keyword"),
+            (f"  {stats.iterations:,} iterations", tag),
+            (f" ({stats.passed:,} pass, {stats.failed:,} fail", tag),
+            (f", {stats.other:,} other)" if stats.other else ")", tag),
+        ]
+        if stats.iterations:
+            segments.append((
+                f"  min/avg/max {stats.min_seconds:.3f}/{stats.avg_seconds:.3f}/{stats.max_seconds:.3f}s"
+                f"  {stats.keyword_calls:,} keyword calls",
+                "timestamp"
+            ))
+        if stats.nested_loops:
+            segments.append((
+                f"  | nested: {stats.nested_loops:,} loops, {stats.nested_iterations:,} iterations"
+                f" ({stats.nested_failed:,} fail)",
+                "fail" if stats.nested_failed else "timestamp"
+            ))
+            if stats.nested_iterations:
+                segments.append((
+                    f" min/avg/max {stats.nested_min_seconds:.3f}/{stats.nested_avg_seconds:.3f}"
+                    f"/{stats.nested_max_seconds:.3f}s",
+                    "timestamp"
+                ))
+        segments.append(("\n", None))
+        self.append_log("trace", segments, tag=tag)
+
+    def log_keyword_event(self, action, name, args=None, status="pending", message="",
+                          elapsed=None, depth=0, skipped=0):
+        """
+        One compact live-trace line per keyword start/end, indented by call depth.
+        Called from the Robot thread; filtering and rate limiting happen in core.trace.
+        """
         timestamp = datetime.now().strftime("%H:%M:%S")
         icons = {"start": "➡", "end": "⬅", "fail": "❌", "pass": "✅", "skip": "⏭️", "pending": "🕓"}
 
         tag = {"PASS": "pass", "FAIL": "fail", "SKIP": "pending"}.get(status.upper(), "pending")
         icon = icons.get(action, "📝")
+        indent = "  " * min(depth, 10)
+
+        segments = []
+        if skipped:
+            segments.append((f"[{timestamp}] ... {skipped} trace events skipped (rate limit)\n", "timestamp"))
+        segments.append((f"[{timestamp}] {indent}{icon} ", "timestamp"))
+        segments.append((name, "keyword"))
+        if action == "start":
+            if args:
+                segments.append((f"  {' | '.join(str(arg) for arg in args)}", "args"))
+        else:
+            segments.append((f"  [{status.upper()}]", tag))
+            if elapsed is not None:
+                segments.append((f" {elapsed:.2f}s", "timestamp"))
+            if message:
+                segments.append((f"  {message}", "message"))
+        segments.append(("\n", None))
 
-        # Format args
-        args_lines = ""
-        if args:
-            for i, arg in enumerate(args):
-                args_lines += f"    Arg{i + 1}: {arg}\n"
-
-        # Format message
-        msg_block = f"      {message}\n" if message else ""
-
-        # Compose final log block
-        full_text = (
-            f"[{timestamp}] {icon} {name}  [{status.upper()}]\n"
-            f"{args_lines}"
-            f"{msg_block}"
-            f"{'-' * 60}\n"
-        )
-
-        self.failure_text.config(state=tk.NORMAL)
-        self.failure_text.insert(tk.END, f"[{timestamp}] {icon} {name}  [{status.upper()}]\n", ("header", tag))
-        self.failure_text.insert(tk.END, args_lines, tag)
-        if msg_block:
-            self.failure_text.insert(tk.END, msg_block, tag)
-        self.failure_text.insert(tk.END, f"{'-' * 60}\n", tag)
-        self.failure_text.see(tk.END)
-        self.failure_text.config(state=tk.DISABLED)
+        self.append_log("trace", segments, tag=tag if action == "end" else None)
 
     def _setup_variable_tab(self):
         from tkinter import StringVar
 
         # === Layout using grid instead of mix of pack/grid ===
         self.var_tab.columnconfigure(0, weight=1)
-        self.var_tab.rowconfigure(1, weight=1)
+        self.var_tab.rowconfigure(2, weight=1)
 
         # --- Top Bar: Search + Refresh ---
         control_frame = tk.Frame(self.var_tab)
@@ -1450,22 +2050,68 @@ class SimpleRetryGUI:
         search_entry.grid(row=0, column=1, sticky="ew", padx=5)
         search_entry.bind("<KeyRelease>", lambda e: self._refresh_variable_view())
 
-        tk.Button(control_frame, text=" Refresh", command=self._refresh_variable_view).grid(row=0, column=2)
+        tk.Label(control_frame, text="Scope:").grid(row=0, column=2, sticky="w", padx=(5, 0))
+        self.var_scope_var = StringVar(value="All")
+        scope_dropdown = ttk.Combobox(control_frame, textvariable=self.var_scope_var, state="readonly", width=8,
+                                      values=["All", "Local", "Test", "Suite", "Global"])
+        scope_dropdown.grid(row=0, column=3, padx=5)
+        scope_dropdown.bind("<<ComboboxSelected>>", lambda e: self._refresh_variable_view())
+
+        tk.Button(control_frame, text=" Refresh", command=self._refresh_variable_view).grid(row=0, column=4)
+
+        # --- History Bar: record toggle + time-travel slider ---
+        history_frame = tk.Frame(self.var_tab)
+        history_frame.grid(row=1, column=0, sticky="ew", padx=10)
+        history_frame.columnconfigure(1, weight=1)
+
+        self.history_enabled_var = tk.BooleanVar(value=self.core.variable_history is not None)
+        tk.Checkbutton(
+            history_frame,
+            text="Record history",
+            variable=self.history_enabled_var,
+            command=self._on_history_toggled
+        ).grid(row=0, column=0, sticky="w")
+
+        self.history_scale = tk.Scale(
+            history_frame,
+            from_=0,
+            to=0,
+            orient=tk.HORIZONTAL,
+            showvalue=False,
+            command=lambda v: self._refresh_variable_view()
+        )
+        self.history_scale.grid(row=0, column=1, sticky="ew", padx=5)
+
+        self.history_label_var = StringVar(value="[LIVE]")
+        tk.Label(history_frame, textvariable=self.history_label_var, font=("Consolas", 9),
+                 fg="#666666", width=45, anchor="w").grid(row=0, column=2, sticky="w")
+
+        self.pass_baseline_var = tk.BooleanVar(value=self.core.pass_baseline_store is not None)
+        tk.Checkbutton(
+            history_frame,
+            text="Track last pass",
+            variable=self.pass_baseline_var,
+            command=self._on_pass_baseline_toggled
+        ).grid(row=0, column=3, sticky="w")
+        tk.Button(history_frame, text="Diff vs Last Pass", command=self._show_pass_diff_window).grid(
+            row=0, column=4, padx=(5, 0))
 
         # --- Treeview for Variables ---
         self.variable_tree = ttk.Treeview(self.var_tab)
-        self.variable_tree.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
-        self.variable_tree["columns"] = ("value", "type")
+        self.variable_tree.grid(row=2, column=0, sticky="nsew", padx=10, pady=5)
+        self.variable_tree["columns"] = ("value", "type", "scope")
         self.variable_tree.heading("#0", text="Variable")
         self.variable_tree.heading("value", text="Value")
         self.variable_tree.heading("type", text="Type")
+        self.variable_tree.heading("scope", text="Scope")
         self.variable_tree.column("value", width=350)
         self.variable_tree.column("type", width=100)
+        self.variable_tree.column("scope", width=60)
         self.variable_tree.bind("<<TreeviewSelect>>", self._on_variable_select)
 
         # --- Editor Section ---
         editor = tk.LabelFrame(self.var_tab, text="Create or Update Variable")
-        editor.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
+        editor.grid(row=3, column=0, sticky="ew", padx=10, pady=10)
         editor.columnconfigure(1, weight=1)
 
         tk.Label(editor, text="Name:").grid(row=0, column=0, padx=5, sticky="e")
@@ -1484,11 +2130,21 @@ class SimpleRetryGUI:
         tk.Button(editor, text="Set Variable", command=self._set_variable_from_editor).grid(
             row=2, column=2, padx=10)
 
+        tk.Label(editor, text="Scope:").grid(row=3, column=0, padx=5, sticky="e")
+        self.var_target_scope_var = StringVar(value="Test")
+        ttk.Combobox(editor, textvariable=self.var_target_scope_var, state="readonly", width=8,
+                     values=["Local", "Test", "Suite", "Global"]).grid(row=3, column=1, padx=5, pady=(0, 5), sticky="w")
+
     def _refresh_variable_view(self):
-        from robot.libraries.BuiltIn import BuiltIn
         search = self.var_search_var.get().lower()
         self.variable_tree.delete(*self.variable_tree.get_children())
 
+        # Historical snapshot selected on the slider → render it instead of live values
+        steps_back = self._update_history_slider()
+        if steps_back:
+            self._show_history_snapshot(steps_back, search)
+            return
+
         # Check if execution context is available
         if not self._has_active_execution_context():
             self.variable_tree.insert("", "end", 
@@ -1497,18 +2153,15 @@ class SimpleRetryGUI:
             return
 
         try:
-            all_vars = BuiltIn().get_variables()
-
-            for name, value in sorted(all_vars.items()):
-                name_str = str(name)
-                value_str = str(value)
-                vtype = type(value).__name__
+            scope = self.var_scope_var.get().lower()
+            rows = self.core.variable_scopes.rows(scope)
 
+            for name_str, value_str, vtype, origin in sorted(rows):
                 if search and (search not in name_str.lower() and search not in value_str.lower()):
                     continue
 
                 display_value = value_str[:100] + "..." if len(value_str) > 100 else value_str
-                self.variable_tree.insert("", "end", text=name_str, values=(display_value, vtype))
+                self.variable_tree.insert("", "end", text=name_str, values=(display_value, vtype, origin.title()))
 
         except RuntimeError as e:
             # Execution context not available (test ended or not started)
@@ -1516,17 +2169,106 @@ class SimpleRetryGUI:
                 self.variable_tree.insert("", "end", 
                     text="[WARN] Execution context lost", 
                     values=("Test may have ended", ""))
-                logging.debug("[Debugger GUI] Variable refresh skipped - no execution context")
+                logger.debug("[Debugger GUI] Variable refresh skipped - no execution context")
             else:
                 self.variable_tree.insert("", "end", 
                     text="[ERROR] Error loading variables", 
                     values=(str(e), ""))
-                logging.error(f"[Debugger GUI] Variable refresh error: {e}")
+                logger.error(f"[Debugger GUI] Variable refresh error: {e}")
         except Exception as e:
             self.variable_tree.insert("", "end", 
                 text="[ERROR] Unexpected error", 
                 values=(str(e)[:100], ""))
-            logging.error(f"[Debugger GUI] Variable refresh unexpected error: {e}", exc_info=True)
+            logger.error(f"[Debugger GUI] Variable refresh unexpected error: {e}", exc_info=True)
+
+    def _on_history_toggled(self):
+        if self.history_enabled_var.get():
+            self.core.enable_variable_history()
+        else:
+            self.core.disable_variable_history()
+            self.history_scale.set(0)
+        self._refresh_variable_view()
+
+    def _on_pass_baseline_toggled(self):
+        if self.pass_baseline_var.get():
+            self.core.enable_pass_baseline()
+        else:
+            self.core.disable_pass_baseline()
+
+    def _show_pass_diff_window(self):
+        """Show variables that differ from the last passing run at the same keyword position."""
+        if self.core.pass_baseline_store is None:
+            messagebox.showinfo("Diff vs Last Pass", "Enable 'Track last pass' first. Baselines are recorded from passing tests.")
+            return
+
+        diff = self.core.pass_diff
+        window = tk.Toplevel(self.root)
+        window.title("[DIFF] Variables vs Last Pass")
+        window.geometry("800x450")
+        window.transient(self.root)
+
+        if diff is None:
+            summary = f"No passing baseline stored for '{self.core.current_test}'."
+        elif diff.position is None:
+            summary = "Baseline found, but no keyword position matched yet."
+        elif diff.missing is not None and diff.truncated:
+            summary = (f"No baseline at position {diff.missing}: the last pass only recorded "
+                       f"its first {diff.recorded_positions} keyword positions.")
+        elif diff.missing is not None:
+            summary = f"No baseline at position {diff.missing}: the last pass did not run this keyword."
+        else:
+            saved = datetime.fromtimestamp(diff.saved).strftime("%Y-%m-%d %H:%M") if diff.saved else "?"
+            summary = f"Compared at position {diff.position} with pass from {saved}"
+        tk.Label(window, text=summary, font=("Segoe UI", 9, "italic"), fg="#666666", anchor="w").pack(
+            fill=tk.X, padx=10, pady=5)
+
+        tree = ttk.Treeview(window, columns=("current", "baseline", "change"))
+        tree.heading("#0", text="Variable")
+        tree.heading("current", text="Now")
+        tree.heading("baseline", text="Last Pass")
+        tree.heading("change", text="Change")
+        tree.column("current", width=250)
+        tree.column("baseline", width=250)
+        tree.column("change", width=70)
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        rows = diff.differences() if diff is not None else []
+        for name, now, then, kind in rows:
+            tree.insert("", "end", text=name, values=(now[:100], then[:100], kind))
+        if diff is not None and diff.position is not None and diff.missing is None and not rows:
+            tree.insert("", "end", text="[OK] No differences", values=("", "", ""))
+
+    def _update_history_slider(self):
+        """Sync the slider range with the recorded history and return the selected steps back."""
+        history = self.core.variable_history
+        count = len(history) if history is not None else 0
+        self.history_scale.config(from_=-(count - 1) if count > 1 else 0)
+        steps_back = -int(self.history_scale.get())
+        if steps_back >= count:
+            steps_back = 0
+        if not steps_back:
+            if history is not None:
+                used_kb = history.memory_used // 1024
+                self.history_label_var.set(f"[LIVE] {count} snapshots, {used_kb} KB")
+            else:
+                self.history_label_var.set("[LIVE]")
+        return steps_back
+
+    def _show_history_snapshot(self, steps_back, search):
+        entry = self.core.variable_history.snapshot_at(steps_back) if self.core.variable_history else None
+        if entry is None:
+            self.variable_tree.insert("", "end", text="[WARN] Snapshot no longer available",
+                                      values=("Evicted by memory budget", ""))
+            return
+
+        keyword, timestamp, snapshot = entry
+        when = datetime.fromtimestamp(timestamp).strftime("%H:%M:%S")
+        self.history_label_var.set(f"[-{steps_back}] after {keyword[:25]} @ {when}")
+
+        for name, value in sorted(snapshot.items()):
+            if search and (search not in name.lower() and search not in value.preview.lower()):
+                continue
+            self.variable_tree.insert("", "end", text=name, values=(value.preview, value.type, ""))
 
     def _has_active_execution_context(self):
         """Check if Robot Framework execution context is available"""
@@ -1547,9 +2289,12 @@ class SimpleRetryGUI:
         item = selected[0]
         name = self.variable_tree.item(item, "text")
         value = self.variable_tree.set(item, "value")
+        scope = self.variable_tree.set(item, "scope")
 
         self.var_name_var.set(name)
         self.var_value_var.set(value)
+        if scope:
+            self.var_target_scope_var.set(scope)
 
     def _set_variable_from_editor(self):
         from robot.libraries.BuiltIn import BuiltIn
@@ -1559,14 +2304,25 @@ class SimpleRetryGUI:
         if not name.startswith("${"):
             name = "${" + name.strip("${}") + "}"  # auto-wrap
 
+        scope = self.var_target_scope_var.get().lower()
+        builtin = BuiltIn()
+        setters = {
+            "global": builtin.set_global_variable,
+            "suite": builtin.set_suite_variable,
+            "test": builtin.set_test_variable,
+            "local": getattr(builtin, "set_local_variable", builtin.set_test_variable),
+        }
+
         try:
             # Use parse_arg for proper type conversion
             value = self.core.parse_arg(value_str)
-            BuiltIn().set_test_variable(name, value)
+            setters.get(scope, builtin.set_test_variable)(name, value)
+            # A local set outside a user keyword writes to the test scope
+            self.core.variable_scopes.invalidate("test" if scope == "local" else scope)
 
             # ✅ Correct logging format — avoid retry/keyword confusion
             self._update_failure_display(
-                text=f"Set variable: {name} = {value!r}",
+                text=f"Set {scope} variable: {name} = {value!r}",
                 prefix="[Variables]",
                 status="pass",
                 keyword_name="Set Variable",
@@ -1587,15 +2343,99 @@ class SimpleRetryGUI:
 
     def log_suite_start(self, data):
         log_suite_start(self, data)
+        # Plain data only: the tree is updated later on the Tk thread
+        suite_id, name = data.id, data.name
+        child_suites = [(suite.id, suite.name) for suite in data.suites]
+        tests = [(test.id, test.name) for test in data.tests]
+        self.render_scheduler.post(lambda: self.result_tree.suite_started(suite_id, name, child_suites, tests))
 
     def log_suite_end(self, data, result):
         log_suite_end(self, data, result)
+        suite_id, status, seconds = data.id, result.status, self._elapsed_seconds(result)
+        self.render_scheduler.post(lambda: self.result_tree.suite_ended(suite_id, status, seconds))
 
     def log_test_start(self, data):
-        log_test_start(self, data)
+        entry = log_test_start(self, data)
+        test_id, name, seq = data.id, data.name, entry.seq if entry is not None else None
+        self.render_scheduler.post(lambda: self.result_tree.test_started(test_id, name, seq))
+        index = self.core.suite_index
+        position = index.position(test_id) if index is not None else None
+        if position is not None:
+            # update_status only posts to the render scheduler (key "status"), like the line above
+            self.update_status(f"[>] Test {position[0]} of {position[1]}: {name}", "green")
+
+    def _show_static_call_tree(self, node):
+        """Double-click on a test in the Results tab: its keyword calls as written, from the suite index."""
+        index = self.core.suite_index
+        entry = index.test(node.id) if index is not None else None
+        if entry is None:
+            self.update_status("Suite is still being indexed" if index is not None else "No suite index yet", "gray")
+            return
+        CallTreeWindow(self.root, index, entry)
 
     def log_test_end(self, data, result):
         log_test_end(self, data, result)
+        markers = []
+        tags = set(result.tags or [])
+        if "debugger-retried" in tags:
+            markers.append("retried")
+        if "debugger-skipped" in tags:
+            markers.append("keyword skipped")
+        if result.message == "Test skipped by user":
+            markers.append("skipped by user")
+        test_id, status, seconds = data.id, result.status, self._elapsed_seconds(result)
+        self.render_scheduler.post(lambda: self.result_tree.test_ended(test_id, status, seconds, markers))
+
+    @staticmethod
+    def _elapsed_seconds(result):
+        elapsed = getattr(result, "elapsed_time", None)
+        if elapsed is not None:
+            return elapsed.total_seconds()
+        elapsed_ms = getattr(result, "elapsedtime", None)
+        return elapsed_ms / 1000 if elapsed_ms is not None else None
+
+    def _baseline_keyword_note(self, keyword):
+        """Segments describing how a keyword behaved in the baseline run, if one is loaded."""
+        baseline = self.core.run_baseline
+        stats = baseline.keyword_stats(keyword) if baseline is not None else None
+        if stats is None:
+            return []
+        text = f"{stats.calls} calls, avg {stats.avg_seconds:.2f}s, {stats.failures} failed"
+        tag = "warning" if stats.failures else "value"
+        return [
+            ("[LAST RUN] ", "label"),
+            (f"{text}{' (known flaky)' if stats.flaky else ''}\n", tag),
+        ]
+
+    def _update_run_estimate(self):
+        """Show live slowdown and predicted remaining time against the baseline run."""
+        estimator = self.core.run_estimator
+        if estimator is not None:
+            parts = []
+            slowdown = estimator.current_slowdown()
+            if slowdown is not None:
+                parts.append(f"running {slowdown[1]:.1f}× slower than last run")
+            remaining = estimator.remaining_seconds()
+            if remaining is not None:
+                minutes, seconds = divmod(int(remaining), 60)
+                parts.append(f"~{minutes}m {seconds:02d}s left")
+            self.estimate_label.config(
+                text="  ·  ".join(parts),
+                fg="#CC6600" if slowdown is not None else "#003366"
+            )
+        try:
+            self.root.after(self.ESTIMATE_REFRESH_MS, self._update_run_estimate)
+        except tk.TclError:
+            pass  # Window closed
+
+    def _jump_to_test_log(self, node):
+        """Show the first log entry of a test selected in the result tree."""
+        seq = node.log_seq
+        if seq is None or self.log_buffer.get(seq) is None:
+            matches = self.log_index.search(kind="test_start", test=node.name)
+            seq = matches[-1] if matches else None
+        if seq is None or not self.log_panel.show_seq(seq):
+            self.update_status(f"No log entries kept for '{node.name}'", "gray")
 
     def safe_close(self):
         """Safely close the GUI and unblock Robot Framework if waiting."""
@@ -1614,11 +2454,11 @@ class SimpleRetryGUI:
                     return
                 elif response:  # Yes - continue
                     self.core.continue_event.set()
-                    logging.info("[Debugger] User closed window - continuing test")
+                    logger.info("[Debugger] User closed window - continuing test")
                 else:  # No - abort
                     self.core.abort_suite = True
                     self.core.continue_event.set()
-                    logging.warning("[Debugger] User closed window - aborting suite")
+                    logger.warning("[Debugger] User closed window - aborting suite")
             
             # Stop any running timers
             self._stop_variable_refresh()
@@ -1626,7 +2466,7 @@ class SimpleRetryGUI:
             # Close the window
             self.root.after(0, self.root.quit)
         except Exception as e:
-            logging.warning(f"GUI close failed: {e}")
+            logger.warning(f"GUI close failed: {e}")
             try:
                 self.root.destroy()
             except:
@@ -1644,7 +2484,7 @@ class SimpleRetryGUI:
             self.core.continue_event.set()
             self.core.abort_suite = False  # Clear abort flag
             self._stop_variable_refresh()
-            logging.warning("[Debugger] Emergency exit triggered - force continuing")
+            logger.warning("[Debugger] Emergency exit triggered - force continuing")
             try:
                 self.root.destroy()
             except:
@@ -1662,8 +2502,7 @@ class SimpleRetryGUI:
         try:
             self._refresh_variable_view()
         except Exception as e:
-            import logging
-            logging.warning(f"Variable refresh failed: {e}")
+            logger.warning(f"Variable refresh failed: {e}")
 
     def _log_custom_executor_result(self, text, status="pass"):
         """
@@ -1673,15 +2512,9 @@ class SimpleRetryGUI:
         icons = {"pass": "✅", "fail": "❌", "pending": "🕓"}
         icon = icons.get(status, "🕓")
 
-        full_text = (
-            f"[{timestamp}] {icon} Custom Keyword Executor\n"
-            f"  {text}\n"
-            f"{'-' * 60}\n"
-        )
-
-        self.failure_text.config(state=tk.NORMAL)
-        self.failure_text.insert(tk.END, full_text, status)
-        self.failure_text.see(tk.END)
-        self.failure_text.config(state=tk.DISABLED)
-        self._trim_failure_log()
+        self.append_log("custom", [
+            (f"[{timestamp}] {icon} Custom Keyword Executor\n", status),
+            *self.payloads.fold_message(text, status, indent="  "),
+            (f"{'-' * 60}\n", status),
+        ], tag=status)
 
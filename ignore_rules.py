@@ -0,0 +1,271 @@
+# ignore_rules.py
+import fnmatch
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+GLOB_CHARS = "*?["
+REGEX_PREFIXES = ("re:", "regex:")
+GLOB_PREFIX = "glob:"
+MESSAGE_PREFIXES = ("message:", "msg:")
+
+
+def default_profile_dir():
+    return os.path.join(os.path.expanduser("~"), ".rfdb", "ignore_profiles")
+
+
+def _normalize(name):
+    """Same normalization as the core applies to keyword names: first cell, lowercased."""
+    return name.strip().split("  ")[0].strip().lower()
+
+
+def rule_kind(rule):
+    """exact | glob | regex | message. Library.Keyword rules are exact rules on the qualified name."""
+    lowered = rule.lower()
+    if lowered.startswith(MESSAGE_PREFIXES):
+        return "message"
+    if lowered.startswith(REGEX_PREFIXES):
+        return "regex"
+    if lowered.startswith(GLOB_PREFIX) or any(c in rule for c in GLOB_CHARS):
+        return "glob"
+    return "exact"
+
+
+def _pattern_text(rule):
+    return rule.split(":", 1)[1].strip() if ":" in rule and rule_kind(rule) != "exact" else rule
+
+
+def _rule_regex(rule):
+    """Regex source for a glob/regex rule (matched against the whole normalized name)."""
+    text = _pattern_text(rule)
+    if rule.lower().startswith(REGEX_PREFIXES):
+        re.compile(text)  # Fail early with the rule's own error
+        return text
+    return fnmatch.translate(_normalize(text))[:-2]  # Drop fnmatch's \Z anchor, fullmatch anchors
+
+
+def _message_regex(rule):
+    """(regex source, is_regex) for a message rule; globs match the whole message, regexes search it."""
+    text = _pattern_text(rule)
+    if text.lower().startswith("re:"):
+        source = text[3:]
+        re.compile(source)
+        return source, True
+    return fnmatch.translate(text)[:-2], False
+
+
+def rule_error(rule):
+    """Why a rule cannot be compiled, or None if it is valid."""
+    try:
+        kind = rule_kind(rule)
+        if kind == "message":
+            _message_regex(rule)
+        elif kind != "exact":
+            _rule_regex(rule)
+    except re.error as e:
+        return str(e)
+    return None
+
+
+class CompiledRules:
+    """
+    One immutable matcher for a rule set. Exact names sit in a hash set;
+    glob name rules are bucketed by the first PREFIX_KEY characters of
+    their literal prefix, each bucket compiled into one alternation regex;
+    globs starting with a wildcard share one more alternation, and message
+    globs another. A check is a dict lookup plus a few regex calls, whose
+    size depends on the rules that could match the name rather than on the
+    whole list.
+
+    `re:` rules are compiled one by one: inline flags, back-references and
+    named groups of a user regex would break (or change) an alternation.
+    Name regexes must match the whole name, message regexes match anywhere
+    in the message. A rule that does not compile is skipped with a warning.
+    """
+
+    PREFIX_KEY = 3
+    FLAGS = re.IGNORECASE | re.DOTALL
+
+    def __init__(self, rules):
+        self.exact = {}  # Normalized name -> rule
+        self._groups = {}  # Regex group name -> rule
+        buckets = {}  # Literal prefix -> [(group, pattern)]
+        general = []
+        messages = []
+        self._regexes = []  # [(compiled, rule)] for re: name rules
+        self._message_regexes = []  # [(compiled, rule)] for message:re: rules
+        for i, rule in enumerate(rules):
+            kind = rule_kind(rule)
+            group = f"r{i}"
+            try:
+                if kind == "exact":
+                    self.exact[_normalize(rule)] = rule
+                elif kind == "message":
+                    source, is_regex = _message_regex(rule)
+                    if is_regex:
+                        self._message_regexes.append((re.compile(source, self.FLAGS), rule))
+                    else:
+                        messages.append((group, source))
+                elif kind == "regex":
+                    self._regexes.append((re.compile(_rule_regex(rule), self.FLAGS), rule))
+                else:
+                    prefix = self._literal_prefix(rule)
+                    target = buckets.setdefault(prefix[:self.PREFIX_KEY], []) \
+                        if len(prefix) >= self.PREFIX_KEY else general
+                    target.append((group, _rule_regex(rule)))
+            except re.error as e:
+                logger.warning(f"[Debugger] Invalid ignore rule '{rule}': {e}")
+                continue
+            self._groups[group] = rule
+        self._buckets = {key: self._compile(patterns) for key, patterns in buckets.items()}
+        self._names = self._compile(general)
+        self._messages = self._compile(messages)
+
+    @staticmethod
+    def _literal_prefix(rule):
+        text = _normalize(_pattern_text(rule))
+        end = min((text.find(c) for c in GLOB_CHARS if c in text), default=len(text))
+        return text[:end]
+
+    def _compile(self, patterns):
+        """One alternation over translated globs, or [(compiled, rule)] if it does not compile."""
+        if not patterns:
+            return None
+        try:
+            return re.compile("|".join(f"(?P<{group}>{source})" for group, source in patterns), self.FLAGS)
+        except re.error as e:
+            logger.warning(f"[Debugger] Ignore rules matched one by one: {e}")
+            return [(re.compile(source, self.FLAGS), self._groups[group]) for group, source in patterns]
+
+    def _fullmatch(self, matcher, text):
+        if matcher is None:
+            return None
+        if isinstance(matcher, list):
+            return next((rule for regex, rule in matcher if regex.fullmatch(text)), None)
+        found = matcher.fullmatch(text)
+        return self._groups[found.lastgroup] if found else None
+
+    def match(self, name, full_name=None, message=None):
+        """The rule matching a failed keyword, or None."""
+        names = (_normalize(name), _normalize(full_name)) if full_name else (_normalize(name),)
+        for normalized in names:
+            rule = self.exact.get(normalized)
+            if rule is not None:
+                return rule
+        for normalized in names:
+            rule = (self._fullmatch(self._buckets.get(normalized[:self.PREFIX_KEY]), normalized)
+                    or self._fullmatch(self._names, normalized)
+                    or next((rule for regex, rule in self._regexes if regex.fullmatch(normalized)), None))
+            if rule is not None:
+                return rule
+        if message:
+            return (self._fullmatch(self._messages, message)
+                    or next((rule for regex, rule in self._message_regexes if regex.search(message)), None))
+        return None
+
+
+class IgnoreRules:
+    """
+    The ignore list: a set of rule strings, compiled into a CompiledRules
+    matcher on first use after a change.
+
+    Rules: `Keyword Name` (exact, case-insensitive), `Library.Keyword Name`
+    (exact on the qualified name), globs such as `Wait Until *` or
+    `glob:...`, `re:<regex>`, and `message:<glob>` / `message:re:<regex>`
+    on the failure message. Behaves like a set for the GUI; `match` is
+    safe to call from the Robot thread while the GUI edits the rules.
+    """
+
+    def __init__(self, rules=()):
+        self._lock = threading.Lock()
+        self._rules = set(rules)
+        self._compiled = None
+
+    def __contains__(self, rule):
+        return rule in self._rules
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._rules))
+
+    def __len__(self):
+        return len(self._rules)
+
+    def add(self, rule):
+        with self._lock:
+            self._rules.add(rule)
+            self._compiled = None
+
+    def update(self, rules):
+        with self._lock:
+            self._rules.update(rules)
+            self._compiled = None
+
+    def remove(self, rule):
+        with self._lock:
+            self._rules.remove(rule)
+            self._compiled = None
+
+    def clear(self):
+        with self._lock:
+            self._rules.clear()
+            self._compiled = None
+
+    def match(self, name, full_name=None, message=None):
+        """The matching rule or None; never raises into the listener hook calling it."""
+        compiled = self._compiled
+        if compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = CompiledRules(sorted(self._rules))
+                compiled = self._compiled
+        try:
+            return compiled.match(name, full_name, message)
+        except Exception as e:
+            logger.warning(f"[Debugger] Ignore rule check failed for '{name}': {e}")
+            return None
+
+
+# === Profiles ===
+def _profile_path(name, directory=None):
+    if name.endswith(".json") or os.sep in name or "/" in name:
+        return name  # Explicit file
+    safe = re.sub(r"[^\w.-]", "_", name)
+    return os.path.join(directory or default_profile_dir(), f"{safe}.json")
+
+
+def list_profiles(directory=None):
+    directory = directory or default_profile_dir()
+    try:
+        return sorted(f[:-5] for f in os.listdir(directory) if f.endswith(".json"))
+    except OSError:
+        return []
+
+
+def load_profile(name, directory=None):
+    """Rules of a named profile (or a profile file path)."""
+    with open(_profile_path(name, directory), encoding="utf-8") as f:
+        data = json.load(f)
+    rules = data.get("rules", []) if isinstance(data, dict) else data
+    return [str(rule) for rule in rules if str(rule).strip()]
+
+
+def save_profile(name, rules, directory=None):
+    """Write a profile atomically (temp file + os.replace)."""
+    path = _profile_path(name, directory)
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"name": name, "rules": sorted(rules)}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
@@ -0,0 +1,317 @@
+# keyword_catalog.py
+import hashlib
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from robot.libdocpkg import LibraryDocumentation
+from .arg_converters import normalize_name
+
+try:  # RF 7 library model: keyword names without building every keyword's docs
+    from robot.running import TestLibrary, ResourceFileBuilder
+    from robot.running.testlibraries import DynamicLibrary, DynamicKeywordCreator
+    from robot.running.librarykeyword import DynamicKeyword
+    from robot.utils import printable_name
+except ImportError:
+    TestLibrary = None
+
+logger = logging.getLogger(__name__)
+
+LOADER_WORKERS = 2  # Parallel library loads
+DOC_CACHE_SIZE = 200  # Keyword docs kept in memory across all libraries
+
+
+def library_key(name):
+    """Import name as libdoc expects it: file-based libraries by module name."""
+    if os.path.isfile(name) or name.endswith(".py"):
+        return os.path.splitext(os.path.basename(name))[0]
+    return name
+
+
+def _locations(keywords):
+    """{keyword name: (source file, line)} for keywords that know where they are defined."""
+    locations = {}
+    for name, kw in keywords.items():
+        source, lineno = getattr(kw, "source", None), getattr(kw, "lineno", None)
+        if source:
+            locations[name] = (sys.intern(str(source)), lineno)
+    return locations
+
+
+class LibrarySource:
+    """
+    An imported library that describes its keywords on demand.
+
+    Static and hybrid libraries expose argument specs for free when their
+    keywords are created. Dynamic (and remote) libraries only list names up
+    front; arguments and docs cost library calls per keyword and are only
+    fetched by `describe` when a keyword is actually looked at.
+    """
+
+    kind = "library"
+
+    def __init__(self, name):
+        self._lock = threading.Lock()  # Dynamic/remote libraries are not expected to be thread-safe
+        self._dynamic_names = {}
+        if TestLibrary is None:
+            libdoc = LibraryDocumentation(name)
+            self.name = libdoc.name
+            self.lazy = False
+            self._keywords = {kw.name: kw for kw in libdoc.keywords}
+            return
+        library = TestLibrary.from_name(name, create_keywords=False)
+        self.name = library.name
+        self.lazy = isinstance(library, DynamicLibrary)
+        self._library = library
+        self._keywords = {}
+        if self.lazy:
+            names = DynamicKeywordCreator(library).get_keyword_names()
+            self._dynamic_names = {printable_name(n, code_style=True): n for n in names}
+        else:
+            library.create_keywords()
+            self._keywords = {kw.name: kw for kw in library.keywords}
+
+    @property
+    def names(self):
+        return list(self._dynamic_names) if self.lazy else list(self._keywords)
+
+    def known_args(self):
+        """Argument specs available without calling into the library."""
+        return {name: kw.args for name, kw in self._keywords.items()}
+
+    def locations(self):
+        return _locations(self._keywords)
+
+    def describe(self, kw_name):
+        """(argument spec, doc) of one keyword."""
+        kw = self._keywords.get(kw_name)
+        if kw is None and kw_name in self._dynamic_names:
+            with self._lock:
+                kw = DynamicKeyword.from_name(self._dynamic_names[kw_name], self._library)
+        if kw is None:
+            raise KeyError(kw_name)
+        return kw.args, kw.doc
+
+
+class ResourceSource(LibrarySource):
+    """User keywords of a resource file, parsed without running anything."""
+
+    kind = "resource"
+
+    def __init__(self, path):
+        self.lazy = False
+        self._dynamic_names = {}
+        resource = ResourceFileBuilder(process_curdir=False).build(path)
+        self.name = resource.name or os.path.splitext(os.path.basename(path))[0]
+        self._keywords = {kw.name: kw for kw in resource.keywords}
+
+
+class LibraryCatalog:
+    """
+    Keyword names of one library or resource file, loaded eagerly, with
+    argument specs that are filled in as they become known and the source
+    location of each keyword when known. Docs are not held here: they are
+    fetched through `fetch(kw name) -> (args or None, doc)` on the loader
+    pool and kept in the loader's bounded DocCache.
+    """
+
+    def __init__(self, name, names, args=None, fetch=None, locations=None, kind="library"):
+        self.name = name
+        self.names = names
+        self.fetch = fetch
+        self.kind = kind  # library | resource
+        self._args = args or {}  # Keyword name -> arg spec
+        self._locations = locations or {}  # Keyword name -> (source file, line)
+        self._normalized = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def args(self, kw_name):
+        """Known argument spec, or None if it has not been fetched yet."""
+        return self._args.get(kw_name)
+
+    def set_args(self, kw_name, args):
+        self._args[kw_name] = args
+
+    def location(self, kw_name):
+        """(source file, line) where the keyword is defined, or None."""
+        return self._locations.get(kw_name)
+
+    def find(self, kw_name):
+        """Keyword name as listed by the library for a normalized name, or None."""
+        if self._normalized is None:
+            self._normalized = {normalize_name(n): n for n in self.names}
+        return self._normalized.get(normalize_name(kw_name))
+
+
+class DocCache:
+    """Least recently used keyword docs, bounded by entry count."""
+
+    def __init__(self, max_entries=DOC_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._docs = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            doc = self._docs.get(key)
+            if doc is not None:
+                self._docs.move_to_end(key)
+            return doc
+
+    def put(self, key, doc):
+        with self._lock:
+            self._docs[key] = doc
+            self._docs.move_to_end(key)
+            while len(self._docs) > self.max_entries:
+                self._docs.popitem(last=False)
+
+
+class LibraryLoader:
+    """
+    Loads imported libraries on a small worker pool so neither the Robot
+    thread nor GUI startup waits on it.
+
+    `submit` returns immediately; each finished library is handed to
+    `on_loaded(key, library name, LibraryCatalog, error)` on the worker
+    thread, so the callback must marshal to the Tk thread itself. A library
+    is only loaded once, however often it is imported. Resource files go
+    through the same pool with `submit_resource`. With a CatalogCache,
+    unchanged libraries and resources are read from disk instead of imported.
+
+    Only keyword names (and arg specs that come for free) are loaded up
+    front; `describe` fetches a keyword's doc, and for dynamic libraries
+    its arguments, on the pool when the keyword is looked at.
+    """
+
+    def __init__(self, on_loaded, cache=None, workers=LOADER_WORKERS):
+        self.on_loaded = on_loaded
+        self.cache = cache
+        self.docs = DocCache()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rfdb-libdoc")
+        self._submitted = set()  # Keys queued, running or done
+        self.total = 0
+        self.done = 0
+        self._closed = False
+
+    def submit(self, name, source=None, version=None, args=()):
+        """Queue a library for loading. Returns False if it is already known.
+        source/version/args come from the import and key the disk cache.
+        """
+        key = library_key(name)
+        with self._lock:
+            if self._closed or key in self._submitted:
+                return False
+            self._submitted.add(key)
+            self.total += 1
+        self._executor.submit(self._load, key, source, version, args)
+        return True
+
+    def submit_resource(self, path):
+        """Queue a resource file for parsing. Returns False if it is already known."""
+        key = os.path.normcase(os.path.abspath(str(path)))
+        with self._lock:
+            if self._closed or key in self._submitted:
+                return False
+            self._submitted.add(key)
+            self.total += 1
+        # Cache entries are named by file name plus a path hash: resource names are not unique
+        stem = os.path.splitext(os.path.basename(key))[0]
+        cache_name = f"{stem}@{hashlib.sha1(key.encode('utf-8')).hexdigest()[:8]}"
+        self._executor.submit(self._load, key, key, None, (), ResourceSource, cache_name)
+        return True
+
+    def describe(self, catalog, kw_name, callback):
+        """
+        (args, doc) of a keyword if both are already known. Otherwise returns
+        None and calls `callback(args, doc)` from a worker once fetched.
+        """
+        args = catalog.args(kw_name)
+        doc = self.docs.get((catalog.name, kw_name))
+        if args is not None and doc is not None:
+            return args, doc
+        with self._lock:
+            if self._closed:
+                return None
+        self._executor.submit(self._describe, catalog, kw_name, callback)
+        return None
+
+    def progress(self):
+        with self._lock:
+            return self.done, self.total
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load(self, key, source, version, args, opener=LibrarySource, cache_name=None):
+        libname, catalog, error = key, None, None
+        cache_name = cache_name or key
+        try:
+            cache_key = self.cache.key(cache_name, version, args, source) if self.cache else None
+            cached = self.cache.load(cache_name, cache_key) if cache_key else None
+            if cached is not None:
+                libname, names, known_args, lazy, locations, doc_spans = cached
+                fetch = self._source_fetch(key) if lazy else self._cache_fetch(cache_name, cache_key, doc_spans)
+                catalog = LibraryCatalog(libname, names, known_args, fetch, locations, opener.kind)
+                logger.info(f"[Debugger GUI] Loaded {opener.kind} from cache: {libname} with {len(names)} keywords")
+            else:
+                library = opener(key)
+                libname = library.name
+                catalog = LibraryCatalog(libname, library.names, library.known_args(), library.describe,
+                                         library.locations(), library.kind)
+                logger.info(f"[Debugger GUI] Loaded {library.kind}: {libname} with {len(catalog)} keywords")
+                if cache_key:
+                    self.cache.store(cache_name, cache_key, library)
+        except ImportError as e:
+            error = e
+            logger.warning(f"[Debugger GUI] Library '{key}' not found: {e}")
+        except Exception as e:
+            error = e
+            logger.warning(f"[Debugger GUI] Failed to load library '{key}': {e}")
+        with self._lock:
+            self.done += 1
+        try:
+            self.on_loaded(key, libname, catalog, error)
+        except Exception as e:
+            logger.warning(f"[Debugger GUI] Library load callback failed for '{key}': {e}")
+
+    def _cache_fetch(self, key, cache_key, doc_spans):
+        def fetch(kw_name):
+            span = doc_spans.get(kw_name)
+            return None, self.cache.load_doc(key, cache_key, span) if span else None
+        return fetch
+
+    def _source_fetch(self, key):
+        """Describe a cached dynamic library, importing it on the first call only."""
+        holder = []
+        lock = threading.Lock()
+
+        def fetch(kw_name):
+            with lock:
+                if not holder:
+                    holder.append(LibrarySource(key))
+            return holder[0].describe(kw_name)
+        return fetch
+
+    def _describe(self, catalog, kw_name, callback):
+        try:
+            args, doc = catalog.fetch(kw_name)
+            if args is None:
+                args = catalog.args(kw_name) or []
+            else:
+                catalog.set_args(kw_name, args)
+            doc = doc or ""
+            self.docs.put((catalog.name, kw_name), doc)
+        except Exception as e:
+            logger.warning(f"[Debugger GUI] Cannot describe keyword '{catalog.name}.{kw_name}': {e}")
+            args, doc = catalog.args(kw_name) or [], f"(documentation not available: {e})"
+        try:
+            callback(args, doc)
+        except Exception as e:
+            logger.warning(f"[Debugger GUI] Keyword describe callback failed for '{kw_name}': {e}")
@@ -0,0 +1,223 @@
+# keyword_index.py
+import heapq
+import re
+from collections import Counter
+from bisect import bisect_left, insort
+from .arg_converters import normalize_name
+
+WORD_SPLIT = re.compile(r"[\s_.]+")
+MIN_TRIGRAM_SHARE = 0.5  # Share of the query's trigrams a fuzzy match must contain
+MAX_FUZZY_CANDIDATES = 20000  # Typo-tolerant pass is skipped when its rarest trigrams cover more names
+MAX_FUZZY_FILLER = 1000  # Names scored to pad results when whole words already matched
+
+
+def _words(text):
+    return [normalize_name(w) for w in WORD_SPLIT.split(text) if w]
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class KeywordIndex:
+    """
+    Fuzzy search over keyword names from every source (libraries, resource
+    files, keywords seen during the run), updated incrementally with `add`.
+
+    Names are matched Robot style (case, space and underscore insensitive).
+    Names starting with the query come first and are found by bisecting a
+    sorted name list. Queries of three or more characters then go through a
+    trigram index, which tolerates typos and word order; shorter ones match
+    word prefixes through a sorted word list. Scans stop once `limit`
+    results are collected, so past the name-prefix matches ranking is best
+    effort; the typo-tolerant pass only runs when fewer than `limit` names
+    contain every query trigram, and only over names sharing one of the
+    query's rarest trigrams.
+    All methods run on the Tk thread.
+    """
+
+    def __init__(self):
+        self._entries = []  # id -> (name, source, normalized name)
+        self._ids = {}  # (normalized name, source) -> id
+        self._trigrams = {}  # Trigram -> ids
+        self._names = []  # Sorted (normalized name, id), for name prefix lookup
+        self._words = []  # Sorted (normalized word, id), for word prefix lookup
+        self._by_source = {}  # Source -> ids
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, name, source):
+        """Index one keyword name. Re-adding the same name from the same source is a no-op."""
+        added = self._add(name, source)
+        if added:
+            insort(self._names, added[0])
+            for item in added[1]:
+                insort(self._words, item)
+
+    def add_many(self, names, source):
+        """Index a batch, merging its names and words into the sorted lists with one sort each."""
+        new_names, new_words = [], []
+        for name in names:
+            added = self._add(name, source)
+            if added:
+                new_names.append(added[0])
+                new_words.extend(added[1])
+        if new_names:
+            self._names.extend(new_names)
+            self._names.sort()
+            self._words.extend(new_words)
+            self._words.sort()
+
+    def _add(self, name, source):
+        """((normalized name, id), [(word, id)]) for a new name, or None."""
+        normalized = normalize_name(name)
+        if not normalized or (normalized, source) in self._ids:
+            return None
+        kw_id = len(self._entries)
+        self._entries.append((name, source, normalized))
+        self._ids[(normalized, source)] = kw_id
+        self._by_source.setdefault(source, set()).add(kw_id)
+        for trigram in _trigrams(normalized):
+            ids = self._trigrams.get(trigram)
+            if ids is None:
+                self._trigrams[trigram] = {kw_id}
+            else:
+                ids.add(kw_id)
+        return (normalized, kw_id), [(word, kw_id) for word in set(_words(name))]
+
+    def search(self, query, limit=50, source=None):
+        """Best matches as [(name, source)], best first. With `source`, only that source's keywords."""
+        words = _words(query)
+        joined = "".join(words)
+        if not joined:
+            return []
+        allowed = self._by_source.get(source, set()) if source is not None else None
+        seen = set()  # Ids already collected
+        scored = self._name_prefix_matches(joined, limit, allowed, seen)
+        if len(scored) < limit:
+            if len(joined) < 3:
+                scored += self._word_prefix_matches(joined, limit - len(scored), allowed, seen)
+            else:
+                scored += self._fuzzy_matches(words, joined, limit - len(scored), allowed, seen)
+        entries = self._entries
+        scored.sort(key=lambda item: (-item[0], len(entries[item[1]][2]), entries[item[1]][0]))
+        return [entries[kw_id][:2] for _, kw_id in scored[:limit]]
+
+    def _prefix_range(self, items, prefix, allowed, limit, skip, matches):
+        """
+        Ids of the sorted (key, id) items whose key starts with prefix, at most `limit`.
+        With `allowed` smaller than the matching range, its ids are tested with `matches`.
+        """
+        pos = bisect_left(items, (prefix, -1))
+        if allowed is not None and len(allowed) < bisect_left(items, (prefix + "\uffff", -1)) - pos:
+            ids = sorted(kw_id for kw_id in allowed - skip if matches(kw_id))
+            del ids[limit:]
+            skip.update(ids)
+            return ids
+        ids = []
+        while pos < len(items) and len(ids) < limit and items[pos][0].startswith(prefix):
+            kw_id = items[pos][1]
+            if (allowed is None or kw_id in allowed) and kw_id not in skip:
+                ids.append(kw_id)
+                skip.add(kw_id)
+            pos += 1
+        return ids
+
+    def _name_prefix_matches(self, joined, limit, allowed, seen):
+        """Names starting with the query: the best scores, so they are collected first."""
+        entries = self._entries
+        bonus = 2.5 if len(joined) >= 3 else 0.5  # Fuzzy scores go up to 2.0, word prefix scores are 2.0
+        ids = self._prefix_range(self._names, joined, allowed, limit, seen,
+                                 lambda kw_id: entries[kw_id][2].startswith(joined))
+        return [(2.0 + bonus + (3.0 if entries[kw_id][2] == joined else 0.0), kw_id) for kw_id in ids]
+
+    def _word_prefix_matches(self, prefix, limit, allowed, seen):
+        entries = self._entries
+        word_start = re.compile(r"(?:^|[\s_.])" + re.escape(prefix), re.IGNORECASE)
+        ids = self._prefix_range(self._words, prefix, allowed, limit, seen,
+                                 lambda kw_id: word_start.search(entries[kw_id][0]) is not None)
+        return [(2.0, kw_id) for kw_id in ids]
+
+    def _fuzzy_matches(self, words, joined, limit, allowed, seen):
+        query_trigrams = set()
+        for word in words:
+            query_trigrams |= _trigrams(word)
+        if not query_trigrams:
+            query_trigrams = _trigrams(joined)
+        postings = sorted((self._trigrams.get(t, set()) for t in query_trigrams), key=len)
+        total = len(postings)
+        if allowed is not None and len(allowed) < len(postings[0]):
+            postings.insert(0, allowed)  # Intersect from the smallest set
+
+        # Names containing every query trigram: one C-level intersection, smallest set first.
+        # Names holding every query word score higher; stop once `limit` of those are found.
+        full = set.intersection(*postings) if postings[0] else set()
+        if postings[0] is allowed:
+            postings.pop(0)
+        elif allowed is not None:
+            full &= allowed
+        full -= seen
+        entries = self._entries
+        best, rest = [], []
+        for kw_id in full:
+            if all(word in entries[kw_id][2] for word in words):
+                best.append((2.0, kw_id))
+                if len(best) >= limit:
+                    return best
+            elif len(rest) < limit:
+                rest.append((1.0, kw_id))
+        scored = best + rest[:limit - len(best)]
+        if len(scored) >= limit:
+            return scored
+
+        # Not enough: typo tolerant pass over names sharing at least MIN_TRIGRAM_SHARE of the
+        # trigrams. Such a name holds one of the (total - needed + 1) rarest trigrams at least.
+        needed = max(1, int(total * MIN_TRIGRAM_SHARE + 0.5))
+        rarest = postings[:total - needed + 1]
+        if sum(len(ids) for ids in rarest) > MAX_FUZZY_CANDIDATES:
+            return scored
+        candidates = set().union(*rarest) - full - seen
+        if allowed is not None:
+            candidates &= allowed
+        if scored and len(candidates) > MAX_FUZZY_FILLER:
+            return scored  # Typos only pad real matches here; not worth scoring thousands of names
+        counts = Counter()
+        for ids in postings:
+            counts.update(ids & candidates)  # Set intersections and counting stay in C
+        partial = [(shared / total, kw_id) for kw_id, shared in counts.items() if shared >= needed]
+        return scored + heapq.nlargest(limit - len(scored), partial, key=lambda item: item[0])
+
+
+class SortedNames:
+    """
+    Unique keyword names in case-insensitive order, for browsing a window
+    of the full list. Merging k new names costs k log n comparisons (one
+    bisect each); a batch that is large relative to the list is merged in
+    one linear pass instead.
+    All methods run on the Tk thread.
+    """
+
+    def __init__(self):
+        self._keys = []  # Sorted (lowercased name, name)
+        self._known = set()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def merge(self, names):
+        """Add names not seen before. Returns how many were added."""
+        new_keys = sorted({(name.lower(), name) for name in names if name not in self._known})
+        if not new_keys:
+            return 0
+        self._known.update(name for _, name in new_keys)
+        if len(new_keys) * 64 > len(self._keys):
+            self._keys += new_keys
+            self._keys.sort()  # Two sorted runs: timsort merges them in linear time
+        else:
+            for key in new_keys:
+                insort(self._keys, key)
+        return len(new_keys)
+
+    def window(self, start, size):
+        return [name for _, name in self._keys[start:start + size]]
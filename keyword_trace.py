@@ -0,0 +1,108 @@
+# keyword_trace.py
+import threading
+import time
+from .variable_history import preview_value
+
+TRACE_LEVELS = ("off", "failures", "user", "all")
+MAX_TRACE_ARGS = 5  # Arguments shown per traced call
+TRACE_ARG_CHARS = 60  # Preview length per argument
+
+# Result types that are keyword calls (not FOR/IF/TRY... control structures)
+_KEYWORD_TYPES = ("KEYWORD", "SETUP", "TEARDOWN")
+
+
+def is_user_keyword(result):
+    """
+    Fallback when the listener hook did not say: a finished keyword call with
+    its own steps in the result model. RF 7 also keeps log messages in the
+    body, so those do not count as steps.
+    """
+    if getattr(result, "type", "KEYWORD") not in _KEYWORD_TYPES:
+        return False
+    body = getattr(result, "body", None)
+    if not body:
+        return False
+    try:
+        return bool(body.filter(messages=False))
+    except (AttributeError, TypeError):
+        return True  # Older result models have no messages in the body
+
+
+class KeywordTrace:
+    """
+    Decides which keyword events reach the live trace and caps their rate.
+
+    Levels: off, failures (failed keywords only), user (user keywords, reported
+    when they finish, plus failures), all (every start and end). Listener hooks
+    only check `enabled`, so the off level costs a single attribute read.
+    At most `max_per_second` events are passed on; the rest are counted and
+    the count is reported with the next event that gets through.
+    """
+
+    def __init__(self, level="off", max_per_second=20):
+        self.max_per_second = max_per_second
+        self._lock = threading.Lock()
+        self._window_start = 0.0
+        self._window_count = 0
+        self._skipped = 0
+        self.level = "off"
+        self.enabled = False
+        self.set_level(level)
+
+    def set_level(self, level):
+        level = str(level).lower()
+        if level not in TRACE_LEVELS:
+            raise ValueError(f"Unknown trace level '{level}', expected one of {', '.join(TRACE_LEVELS)}")
+        self.level = level
+        self.enabled = level != "off"
+
+    def start_event(self, data):
+        """(name, args) for a keyword start worth tracing, else None."""
+        if self.level != "all" or not self._admit():
+            return None
+        return getattr(data, "name", str(data)), self._format_args(getattr(data, "args", ()))
+
+    def end_event(self, data, result, user_keyword=None):
+        """
+        (name, status, message, elapsed seconds) for a keyword end worth tracing, else None.
+        `user_keyword` comes from the RF 7 user/library hooks; None means guess from the result.
+        """
+        status = getattr(result, "status", "")
+        if self.level == "failures" and status != "FAIL":
+            return None
+        if self.level == "user" and status != "FAIL":
+            if user_keyword is None:
+                user_keyword = is_user_keyword(result)
+            if not user_keyword:
+                return None
+        if not self._admit():
+            return None
+        elapsed = getattr(result, "elapsed_time", None)
+        seconds = elapsed.total_seconds() if elapsed is not None else None
+        message = (getattr(result, "message", "") or "").split("\n", 1)[0] if status == "FAIL" else ""
+        return getattr(data, "name", str(data)), status, preview_value(message), seconds
+
+    def take_skipped(self):
+        """Number of events dropped by the rate cap since the last call."""
+        with self._lock:
+            skipped, self._skipped = self._skipped, 0
+        return skipped
+
+    def _admit(self):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
+            if self._window_count >= self.max_per_second:
+                self._skipped += 1
+                return False
+            self._window_count += 1
+            return True
+
+    @staticmethod
+    def _format_args(args):
+        shown = [preview_value(arg)[:TRACE_ARG_CHARS] for arg in list(args)[:MAX_TRACE_ARGS]]
+        if len(args) > MAX_TRACE_ARGS:
+            shown.append(f"... +{len(args) - MAX_TRACE_ARGS}")
+        return shown
@@ -0,0 +1,172 @@
+# log_index.py
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+class LogIndex:
+    """
+    Search index over a LogBuffer, updated as entries are appended.
+
+    Every posting list holds sequence numbers in append order, so lists are
+    sorted for free and next/previous navigation is a bisect. Words are
+    matched by prefix through a sorted vocabulary. Seqs that have fallen out
+    of the ring buffer are pruned once per buffer capacity of appends.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self._lock = threading.Lock()
+        self._by_kind = {}
+        self._by_status = {}
+        self._by_test = {}  # Lowercased test name -> seqs
+        self._postings = {}  # Token -> seqs
+        self._vocabulary = []  # Sorted tokens, for prefix lookup
+        self._since_prune = 0
+
+    def add(self, entry):
+        tokens = tokenize(entry.text)
+        with self._lock:
+            self._post(self._by_kind, entry.kind, entry.seq)
+            if entry.status:
+                self._post(self._by_status, entry.status, entry.seq)
+            if entry.test:
+                self._post(self._by_test, entry.test.lower(), entry.seq)
+            for token in tokens:
+                if token not in self._postings:
+                    insort(self._vocabulary, token)
+                self._post(self._postings, token, entry.seq)
+            self._since_prune += 1
+            if self._since_prune >= self.buffer.capacity:
+                self._prune()
+
+    @staticmethod
+    def _post(table, key, seq):
+        seqs = table.get(key)
+        if seqs is None:
+            table[key] = [seq]
+        else:
+            seqs.append(seq)
+
+    def _prune(self):
+        first = self.buffer.first_seq
+        for table in (self._by_kind, self._by_status, self._by_test, self._postings):
+            for key in list(table):
+                seqs = table[key]
+                cut = bisect_left(seqs, first)
+                if cut == len(seqs):
+                    del table[key]
+                elif cut:
+                    del seqs[:cut]
+        self._vocabulary = sorted(self._postings)
+        self._since_prune = 0
+
+    # === Queries ===
+    def kinds(self):
+        with self._lock:
+            return sorted(self._by_kind)
+
+    def search(self, text="", kind=None, status=None, test=None):
+        """Return the sorted seqs of live entries matching every given filter."""
+        with self._lock:
+            candidates = []
+            if kind:
+                candidates.append(self._by_kind.get(kind, []))
+            if status:
+                candidates.append(self._by_status.get(status, []))
+            if test:
+                needle = test.lower()
+                candidates.append(self._union(
+                    seqs for name, seqs in self._by_test.items() if needle in name
+                ))
+            for word in tokenize(text):
+                candidates.append(self._union(self._prefix_postings(word)))
+            if not candidates:
+                return []
+            result = self._intersect(candidates)
+        first = self.buffer.first_seq
+        return result[bisect_left(result, first):]
+
+    def _prefix_postings(self, prefix):
+        i = bisect_left(self._vocabulary, prefix)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(prefix):
+            yield self._postings[self._vocabulary[i]]
+            i += 1
+
+    @staticmethod
+    def _union(lists):
+        lists = list(lists)
+        if len(lists) == 1:
+            return lists[0]
+        merged = set()
+        for seqs in lists:
+            merged.update(seqs)
+        return sorted(merged)
+
+    @staticmethod
+    def _intersect(lists):
+        lists = sorted(lists, key=len)
+        result = lists[0]
+        for other in lists[1:]:
+            if not result:
+                break
+            other_set = set(other)
+            result = [seq for seq in result if seq in other_set]
+        return list(result)
+
+
+class LogSearch:
+    """A query over a LogIndex with a cursor for next/previous navigation."""
+
+    def __init__(self, index):
+        self.index = index
+        self.query = None
+        self.matches = []
+        self._indexed_upto = -1
+        self.current = None  # Seq of the match last jumped to
+
+    def set_query(self, text="", kind=None, status=None, test=None):
+        query = (text, kind, status, test)
+        if query != self.query:
+            self.query = query
+            self.current = None
+            self._indexed_upto = -1
+
+    def _refresh(self):
+        next_seq = self.index.buffer.next_seq
+        if self.query is not None and self._indexed_upto != next_seq:
+            self.matches = self.index.search(*self.query)
+            self._indexed_upto = next_seq
+
+    def next(self):
+        self._refresh()
+        if not self.matches:
+            return None
+        if self.current is None:
+            i = 0
+        else:
+            i = bisect_right(self.matches, self.current)
+            if i == len(self.matches):
+                i = 0  # Wrap around
+        self.current = self.matches[i]
+        return self.current
+
+    def previous(self):
+        self._refresh()
+        if not self.matches:
+            return None
+        i = len(self.matches) - 1 if self.current is None else bisect_left(self.matches, self.current) - 1
+        self.current = self.matches[i]  # -1 wraps to the last match
+        return self.current
+
+    def position(self):
+        """(1-based index of the current match, total matches)."""
+        if self.current is None:
+            return 0, len(self.matches)
+        return bisect_left(self.matches, self.current) + 1, len(self.matches)
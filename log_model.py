@@ -0,0 +1,73 @@
+# log_model.py
+import threading
+import time
+
+
+class LogEntry:
+    """One structured log record: a block of styled text segments plus metadata."""
+
+    __slots__ = ("seq", "timestamp", "kind", "tag", "segments", "test", "status")
+
+    def __init__(self, seq, timestamp, kind, tag, segments, test=None, status=None):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.kind = kind  # e.g. failure, retry, custom, test_start, test_end, ignore, control
+        self.tag = tag  # Primary style/status tag (pass, fail, warning, header...)
+        self.segments = segments  # Tuple of (text, tags)
+        self.test = test  # Name of the test running when the entry was logged
+        self.status = status  # PASS, FAIL, WARN... when the entry reports an outcome
+
+    @property
+    def text(self):
+        return "".join(text for text, _ in self.segments)
+
+
+class LogBuffer:
+    """
+    Fixed-capacity ring buffer of LogEntry objects addressed by a monotonically
+    increasing sequence number. Appending never moves existing entries, so
+    trimming the oldest entry is O(1).
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._entries = [None] * capacity
+        self._next_seq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._next_seq - self.first_seq
+
+    @property
+    def first_seq(self):
+        return max(0, self._next_seq - self.capacity)
+
+    @property
+    def next_seq(self):
+        return self._next_seq
+
+    def append(self, kind, segments, tag=None, test=None, status=None):
+        """Append an entry built from [(text, tags), ...] and return it."""
+        segments = tuple((text, tags) for text, tags in segments if text)
+        if segments and not segments[-1][0].endswith("\n"):
+            segments += (("\n", None),)  # Entries always end on a line boundary
+        with self._lock:
+            entry = LogEntry(self._next_seq, time.time(), kind, tag, segments, test, status)
+            self._entries[self._next_seq % self.capacity] = entry
+            self._next_seq += 1
+        return entry
+
+    def get(self, seq):
+        if self.first_seq <= seq < self._next_seq:
+            return self._entries[seq % self.capacity]
+        return None
+
+    def range(self, start, stop):
+        """Return entries with start <= seq < stop that are still in the buffer."""
+        with self._lock:
+            start = max(start, self.first_seq)
+            stop = min(stop, self._next_seq)
+            return [self._entries[seq % self.capacity] for seq in range(start, stop)]
+
+    def all_text(self):
+        return "".join(entry.text for entry in self.range(0, self._next_seq))
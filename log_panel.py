@@ -0,0 +1,213 @@
+# log_panel.py
+import tkinter as tk
+from collections import deque
+
+
+class LogPanel(tk.Frame):
+    """
+    Virtualized view over a LogBuffer.
+
+    Only a window of entries (what is visible plus a margin) lives in the Text
+    widget. New entries are appended and the oldest rendered one deleted in
+    O(1); scrolling past either edge slides the window through the buffer.
+    Entries are always rendered from their styled segments, so tags survive.
+    Non-string items in a segment's tags (payload ids) stay with the entry and
+    are never created as Tk tags; `segment_at` finds them from a click.
+    """
+
+    def __init__(self, parent, buffer, window=300, margin=100, **text_options):
+        super().__init__(parent)
+        self.buffer = buffer
+        self.window = window
+        self.margin = margin
+
+        self.text = tk.Text(self, **text_options)
+        self.scrollbar = tk.Scrollbar(self, command=self.text.yview)
+        self.text.configure(yscrollcommand=self._on_yscroll, state=tk.DISABLED)
+        self.text.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        self.text.tag_config("jump", background="#3a3f4b")
+
+        self._start = self._end = buffer.next_seq  # Rendered entries: start <= seq < end
+        self._line_counts = deque()  # Line count of every rendered entry
+        self._total_lines = 0
+        self._edge_pending = False
+
+    # === Public API ===
+    def is_at_bottom(self):
+        return self.text.yview()[1] >= 0.999
+
+    def refresh(self):
+        """Render entries appended to the buffer since the last call, if following the tail."""
+        next_seq = self.buffer.next_seq
+        if self._end >= next_seq or not self.is_at_bottom():
+            return  # Nothing new, or user scrolled up (picked up later at the bottom edge)
+        if next_seq - self._end > self.window or self._end < self.buffer.first_seq:
+            self._render_range(max(self.buffer.first_seq, next_seq - self.window), next_seq)
+        else:
+            self._edit(lambda: self._append(self.buffer.range(self._end, next_seq)))
+        self.text.see(tk.END)
+
+    def show_seq(self, seq):
+        """Re-render the window around an entry, scroll to it and highlight it."""
+        if self.buffer.get(seq) is None:
+            return False
+        if not self._start <= seq < self._end:
+            start = max(self.buffer.first_seq, seq - self.margin)
+            self._render_range(start, min(self.buffer.next_seq, start + self.window))
+        line = 1 + sum(self._line_counts[i] for i in range(seq - self._start))
+        count = self._line_counts[seq - self._start]
+        self.text.tag_remove("jump", "1.0", tk.END)
+        self.text.tag_add("jump", f"{line}.0", f"{line + count}.0")
+        self.text.yview(f"{line}.0")
+        return True
+
+    def segment_at(self, index):
+        """The (text, tags) segment of the rendered entry at a Text index, or None."""
+        line, column = map(int, self.text.index(index).split("."))
+        line -= 1
+        for offset, count in enumerate(self._line_counts):
+            if line < count:
+                break
+            line -= count
+        else:
+            return None
+        entry = self.buffer.get(self._start + offset)
+        if entry is None:
+            return None
+        position = (line, column)
+        start = (0, 0)
+        for text, tags in entry.segments:
+            newlines = text.count("\n")
+            if newlines:
+                end = (start[0] + newlines, len(text) - text.rfind("\n") - 1)
+            else:
+                end = (start[0], start[1] + len(text))
+            if start <= position < end:
+                return text, tags
+            start = end
+        return None
+
+    def scroll_to_end(self):
+        next_seq = self.buffer.next_seq
+        if self._end < next_seq:
+            self._render_range(max(self.buffer.first_seq, next_seq - self.window), next_seq)
+        self.text.see(tk.END)
+
+    # === Rendering ===
+    def _edit(self, action):
+        self.text.configure(state=tk.NORMAL)
+        try:
+            action()
+        finally:
+            self.text.configure(state=tk.DISABLED)
+
+    def _render_range(self, start, stop):
+        def render():
+            self.text.delete("1.0", tk.END)
+            self._line_counts.clear()
+            self._total_lines = 0
+            self._start = self._end = start
+            self._append(self.buffer.range(start, stop))
+        self._edit(render)
+
+    @staticmethod
+    def _insert_args(entries):
+        """Flatten entries into one Text.insert argument list, merging adjacent text with equal tags."""
+        chunks = []
+        for entry in entries:
+            for text, tags in entry.segments:
+                tags = tags or ()
+                if type(tags) is tuple:
+                    tags = tuple(tag for tag in tags if type(tag) is str)
+                if chunks and chunks[-1][1] == tags:
+                    chunks[-1][0].append(text)
+                else:
+                    chunks.append(([text], tags))
+        args = []
+        for texts, tags in chunks:
+            args.extend(("".join(texts), tags))
+        return args
+
+    def _append(self, entries):
+        args = self._insert_args(entries)
+        if args:
+            self.text.insert(tk.END, *args)  # One Tk call for the whole batch
+        for entry in entries:
+            lines = entry.text.count("\n")
+            self._line_counts.append(lines)
+            self._total_lines += lines
+            self._end = entry.seq + 1
+        while len(self._line_counts) > self.window:
+            self._drop_first()
+
+    def _prepend(self, entries):
+        args = self._insert_args(entries)
+        if args:
+            self.text.insert("1.0", *args)
+        added = 0
+        for entry in reversed(entries):
+            lines = entry.text.count("\n")
+            self._line_counts.appendleft(lines)
+            added += lines
+            self._start = entry.seq
+        self._total_lines += added
+        while len(self._line_counts) > self.window:
+            self._drop_last()
+        return added
+
+    def _drop_first(self):
+        lines = self._line_counts.popleft()
+        self.text.delete("1.0", f"{lines + 1}.0")
+        self._total_lines -= lines
+        self._start += 1
+        return lines
+
+    def _drop_last(self):
+        lines = self._line_counts.pop()
+        self.text.delete(f"{self._total_lines - lines + 1}.0", "end-1c")
+        self._total_lines -= lines
+        self._end -= 1
+
+    # === Window sliding on scroll ===
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self._edge_pending:
+            return
+        if float(first) <= 0.0 and self._start > self.buffer.first_seq:
+            self._edge_pending = True
+            self.after_idle(self._extend_up)
+        elif float(last) >= 1.0 and self._end < self.buffer.next_seq:
+            self._edge_pending = True
+            self.after_idle(self._extend_down)
+
+    def _extend_up(self):
+        self._edge_pending = False
+        start = max(self.buffer.first_seq, self._start - self.margin)
+        entries = self.buffer.range(start, self._start)
+        if not entries:
+            return
+        added = []
+        self._edit(lambda: added.append(self._prepend(entries)))
+        # Keep the previously visible content in place
+        self.text.yview(f"{added[0] + 1}.0")
+
+    def _extend_down(self):
+        self._edge_pending = False
+        if self._end < self.buffer.first_seq:
+            self.scroll_to_end()
+            return
+        entries = self.buffer.range(self._end, self._end + self.margin)
+        if not entries:
+            return
+        top_line = int(self.text.index("@0,0").split(".")[0])
+        removed = []
+
+        def extend():
+            before = self._total_lines
+            self._append(entries)
+            removed.append(before + sum(entry.text.count("\n") for entry in entries) - self._total_lines)
+        self._edit(extend)
+        self.text.yview(f"{max(1, top_line - removed[0])}.0")
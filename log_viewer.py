@@ -0,0 +1,283 @@
+# log_viewer.py
+import logging
+import os
+import re
+import threading
+import tkinter as tk
+from tkinter import filedialog, font as tkfont
+from .mapped_log import MappedLog, timestamp_key
+from .payload_store import format_size
+
+logger = logging.getLogger(__name__)
+
+
+class LogViewer(tk.Toplevel):
+    """
+    Viewer for large log files (rfdb debug log, Robot syslog/debug files,
+    application logs). Only the visible page is read from the memory-mapped
+    file; scrolling works on byte offsets so it never waits for indexing.
+    """
+
+    PAGE_LINES = 80  # Lines rendered per page (more than fit on screen)
+    POLL_MS = 1000  # Tail-follow check interval
+    SCROLL_LINES = 3
+
+    def __init__(self, parent, path=None):
+        super().__init__(parent)
+        self.title("[LOG] File Viewer")
+        self.geometry("1000x650")
+        self.minsize(600, 350)
+        self.log = None
+        self.top = 0  # Byte offset of the first rendered line
+        self._poll_id = None
+        self._search_cancel = threading.Event()
+
+        # === Toolbar: file and follow ===
+        file_bar = tk.Frame(self)
+        file_bar.pack(fill=tk.X, padx=8, pady=(8, 2))
+        tk.Label(file_bar, text="File:").pack(side=tk.LEFT)
+        self.path_var = tk.StringVar(value=path or "")
+        path_entry = tk.Entry(file_bar, textvariable=self.path_var)
+        path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=4)
+        path_entry.bind("<Return>", lambda e: self.open_file(self.path_var.get()))
+        tk.Button(file_bar, text="Open...", command=self._browse).pack(side=tk.LEFT)
+        self.follow_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(file_bar, text="Follow tail", variable=self.follow_var,
+                       command=self._on_follow_toggled).pack(side=tk.LEFT, padx=6)
+
+        # === Toolbar: navigation and search ===
+        nav_bar = tk.Frame(self)
+        nav_bar.pack(fill=tk.X, padx=8, pady=2)
+        tk.Label(nav_bar, text="Time:").pack(side=tk.LEFT)
+        self.time_var = tk.StringVar()
+        time_entry = tk.Entry(nav_bar, textvariable=self.time_var, width=20)
+        time_entry.pack(side=tk.LEFT, padx=(2, 2))
+        time_entry.bind("<Return>", lambda e: self._on_goto_time())
+        tk.Button(nav_bar, text="Go", command=self._on_goto_time).pack(side=tk.LEFT, padx=(0, 8))
+
+        tk.Label(nav_bar, text="Line:").pack(side=tk.LEFT)
+        self.line_var = tk.StringVar()
+        line_entry = tk.Entry(nav_bar, textvariable=self.line_var, width=10)
+        line_entry.pack(side=tk.LEFT, padx=(2, 2))
+        line_entry.bind("<Return>", lambda e: self._on_goto_line())
+        tk.Button(nav_bar, text="Go", command=self._on_goto_line).pack(side=tk.LEFT, padx=(0, 8))
+
+        tk.Label(nav_bar, text="Regex:").pack(side=tk.LEFT)
+        self.regex_var = tk.StringVar()
+        regex_entry = tk.Entry(nav_bar, textvariable=self.regex_var, width=24)
+        regex_entry.pack(side=tk.LEFT, padx=(2, 2))
+        regex_entry.bind("<Return>", lambda e: self._on_search(backward=False))
+        regex_entry.bind("<Shift-Return>", lambda e: self._on_search(backward=True))
+        tk.Button(nav_bar, text="<", width=2, command=lambda: self._on_search(backward=True)).pack(side=tk.LEFT)
+        tk.Button(nav_bar, text=">", width=2, command=lambda: self._on_search(backward=False)).pack(side=tk.LEFT, padx=2)
+
+        # === Page view ===
+        view = tk.Frame(self)
+        view.pack(fill=tk.BOTH, expand=True, padx=8, pady=4)
+        view.columnconfigure(0, weight=1)
+        view.rowconfigure(0, weight=1)
+        self.text = tk.Text(view, wrap=tk.NONE, font=("Consolas", 10), bg="#1e1e1e", fg="#e0e0e0",
+                            insertbackground="white", state=tk.DISABLED)
+        self.text.grid(row=0, column=0, sticky="nsew")
+        self.text.tag_config("match", background="#5c4d00")
+        self._line_height = max(1, tkfont.Font(font=self.text["font"]).metrics("linespace"))
+        self.vscroll = tk.Scrollbar(view, command=self._on_scrollbar)
+        self.vscroll.grid(row=0, column=1, sticky="ns")
+        hscroll = tk.Scrollbar(view, orient=tk.HORIZONTAL, command=self.text.xview)
+        hscroll.grid(row=1, column=0, sticky="ew")
+        self.text.configure(xscrollcommand=hscroll.set)
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.text.bind(sequence, self._on_wheel)
+        self.text.bind("<Prior>", lambda e: self._scroll_lines(-self._visible_lines()))
+        self.text.bind("<Next>", lambda e: self._scroll_lines(self._visible_lines()))
+
+        self.status_label = tk.Label(self, text="", anchor="w", fg="#666666")
+        self.status_label.pack(fill=tk.X, padx=8, pady=(0, 6))
+
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        if path:
+            self.open_file(path)
+
+    # === File handling ===
+    def _browse(self):
+        path = filedialog.askopenfilename(parent=self, filetypes=[("Log files", "*.log *.txt"), ("All files", "*.*")])
+        if path:
+            self.path_var.set(path)
+            self.open_file(path)
+
+    def open_file(self, path):
+        self._close_log()
+        if not path or not os.path.isfile(path):
+            self._set_status(f"File not found: {path}", error=True)
+            return
+        try:
+            self.log = MappedLog(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[Debugger GUI] Cannot open {path} in log viewer: {e}")
+            self._set_status(f"Cannot open file: {e}", error=True)
+            return
+        self.log.build_index()
+        self.update_idletasks()  # Page size depends on the laid out text height
+        self.top = self.log.last_page_offset(self._visible_lines()) if self.follow_var.get() else 0
+        self._render()
+        self._poll()
+
+    def _close_log(self):
+        self._search_cancel.set()
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+    def _on_close(self):
+        self._close_log()
+        self.destroy()
+
+    def _poll(self):
+        self._poll_id = None
+        if self.log is None:
+            return
+        generation = self.log.generation
+        try:
+            changed = self.log.refresh()
+        except (OSError, ValueError) as e:
+            self._set_status(f"File unavailable: {e}", error=True)
+            changed = False
+        if changed and self.log.generation != generation and not self.follow_var.get():
+            self.top = 0  # Rotated or truncated: old offsets point into another file
+            self._render()
+        elif changed and self.follow_var.get():
+            self.top = self.log.last_page_offset(self._visible_lines())
+            self._render()
+        elif changed:
+            self._update_status()
+        self._poll_id = self.after(self.POLL_MS, self._poll)
+
+    def _on_follow_toggled(self):
+        if self.follow_var.get() and self.log is not None:
+            self.top = self.log.last_page_offset(self._visible_lines())
+            self._render()
+
+    # === Rendering ===
+    def _visible_lines(self):
+        return max(1, self.text.winfo_height() // self._line_height)
+
+    def _render(self, highlight=None):
+        if self.log is None:
+            return
+        lines = self.log.read_lines(self.top, self.PAGE_LINES)
+        self.text.configure(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", "\n".join(lines))
+        if highlight is not None and lines:
+            for match in highlight.finditer(lines[0]):
+                self.text.tag_add("match", f"1.{match.start()}", f"1.{match.end()}")
+        self.text.configure(state=tk.DISABLED)
+        size = self.log.size or 1
+        page_bytes = sum(len(line) + 1 for line in lines[:self._visible_lines()])
+        self.vscroll.set(self.top / size, min(1.0, (self.top + page_bytes) / size))
+        self._update_status()
+
+    def _update_status(self):
+        if self.log is None:
+            return
+        line = self.log.line_number(self.top)
+        position = f"Line {line + 1:,}" if line is not None else "Line ?"
+        progress = self.log.index_progress
+        total = f"{self.log.indexed_lines:,} lines" + ("" if progress >= 1.0 else f" (indexing {progress:.0%})")
+        self._set_status(f"{position} of {total}  |  {format_size(self.log.size)}  |  {self.log.path}")
+
+    def _set_status(self, text, error=False):
+        self.status_label.config(text=text, fg="#8B0000" if error else "#666666")
+
+    # === Scrolling ===
+    def _scroll_lines(self, lines):
+        if self.log is None:
+            return "break"
+        self.top = self.log.move(self.top, lines)
+        if lines < 0:
+            self.follow_var.set(False)
+        self._render()
+        return "break"
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            return self._scroll_lines(-self.SCROLL_LINES)
+        return self._scroll_lines(self.SCROLL_LINES)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if self.log is None:
+            return
+        if action == "moveto":
+            self.follow_var.set(False)
+            self.top = self.log.line_start(int(float(amount) * self.log.size))
+            self._render()
+        elif action == "scroll":
+            step = int(amount) * (self._visible_lines() if unit == "pages" else 1)
+            self._scroll_lines(step)
+
+    # === Navigation ===
+    def _on_goto_line(self):
+        if self.log is None:
+            return
+        try:
+            line = int(self.line_var.get().replace(",", "").strip()) - 1
+        except ValueError:
+            self._set_status("Line must be a number", error=True)
+            return
+        self.follow_var.set(False)
+        self.top = self.log.offset_of_line(max(0, line))
+        self._render()
+
+    def _on_goto_time(self):
+        if self.log is None:
+            return
+        target = timestamp_key(self.time_var.get().strip().encode())
+        if target is None:
+            self._set_status("Time format: HH:MM:SS or YYYY-MM-DD HH:MM:SS", error=True)
+            return
+        self.follow_var.set(False)
+        self.top = self.log.find_timestamp(target)
+        self._render()
+
+    def _on_search(self, backward=False):
+        if self.log is None or not self.regex_var.get():
+            return
+        try:
+            pattern = re.compile(self.regex_var.get().encode("utf-8"))
+            highlight = re.compile(self.regex_var.get())
+        except re.error as e:
+            self._set_status(f"Invalid regex: {e}", error=True)
+            return
+
+        self._search_cancel.set()  # Stop a search still running
+        cancel = self._search_cancel = threading.Event()
+        log = self.log
+        start = self.top if backward else log.move(self.top, 1)
+        if not backward and start == self.top:
+            start = log.size  # Already on the last line
+        self._set_status("Searching...")
+
+        def worker():
+            try:
+                offset = log.search(pattern, start, backward=backward, cancel=cancel)
+            except (OSError, ValueError) as e:
+                logger.warning(f"[Debugger GUI] Log viewer search failed: {e}")
+                offset = None
+            if not cancel.is_set():
+                self.after(0, lambda: self._show_search_result(offset, highlight))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show_search_result(self, offset, highlight):
+        if self.log is None:
+            return
+        if offset is None:
+            self._set_status(f"No more matches for {self.regex_var.get()!r}", error=True)
+            return
+        self.follow_var.set(False)
+        self.top = offset
+        self._render(highlight)
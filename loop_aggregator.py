@@ -0,0 +1,135 @@
+# loop_aggregator.py
+import time
+
+
+def loop_label(data):
+    """Readable header of a FOR/WHILE loop, e.g. 'FOR ${i} IN RANGE 10'."""
+    loop_type = getattr(data, "type", "LOOP")
+    if loop_type == "WHILE":
+        condition = getattr(data, "condition", None)
+        return f"WHILE {condition}" if condition else "WHILE"
+    assign = getattr(data, "assign", None) or getattr(data, "variables", None) or ()
+    flavor = getattr(data, "flavor", "IN")
+    values = list(getattr(data, "values", None) or ())
+    shown = " ".join(str(v) for v in values[:3]) + (" ..." if len(values) > 3 else "")
+    return f"FOR {' '.join(assign)} {flavor} {shown}".strip()
+
+
+class LoopStats:
+    """
+    Aggregated outcome of one loop: iteration counts and min/avg/max iteration
+    duration, plus the same for the loops nested in it (merged in at their end).
+    """
+
+    __slots__ = ("label", "depth", "iterations", "passed", "failed", "other",
+                 "total_seconds", "min_seconds", "max_seconds", "keyword_calls", "_iteration_start",
+                 "nested_loops", "nested_iterations", "nested_failed",
+                 "nested_total_seconds", "nested_min_seconds", "nested_max_seconds")
+
+    def __init__(self, label, depth):
+        self.label = label
+        self.depth = depth
+        self.iterations = 0
+        self.passed = 0
+        self.failed = 0
+        self.other = 0  # SKIP / NOT RUN
+        self.total_seconds = 0.0
+        self.min_seconds = None
+        self.max_seconds = 0.0
+        self.keyword_calls = 0
+        self._iteration_start = None
+        self.nested_loops = 0
+        self.nested_iterations = 0
+        self.nested_failed = 0
+        self.nested_total_seconds = 0.0
+        self.nested_min_seconds = None
+        self.nested_max_seconds = 0.0
+
+    @property
+    def avg_seconds(self):
+        return self.total_seconds / self.iterations if self.iterations else 0.0
+
+    @property
+    def nested_avg_seconds(self):
+        return self.nested_total_seconds / self.nested_iterations if self.nested_iterations else 0.0
+
+    @property
+    def any_failed(self):
+        return bool(self.failed or self.nested_failed)
+
+    def add_iteration(self, status, seconds):
+        self.iterations += 1
+        if status == "PASS":
+            self.passed += 1
+        elif status == "FAIL":
+            self.failed += 1
+        else:
+            self.other += 1
+        self.total_seconds += seconds
+        self.min_seconds = seconds if self.min_seconds is None else min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def merge(self, inner):
+        """Fold a finished nested loop (and everything nested in it) into this loop's nested totals."""
+        self.nested_loops += 1 + inner.nested_loops
+        self.nested_iterations += inner.iterations + inner.nested_iterations
+        self.nested_failed += inner.failed + inner.nested_failed
+        self.nested_total_seconds += inner.total_seconds + inner.nested_total_seconds
+        for low in (inner.min_seconds, inner.nested_min_seconds):
+            if low is not None:
+                self.nested_min_seconds = low if self.nested_min_seconds is None else min(self.nested_min_seconds, low)
+        self.nested_max_seconds = max(self.nested_max_seconds, inner.max_seconds, inner.nested_max_seconds)
+
+
+class LoopTracker:
+    """
+    Follows FOR/WHILE loops through the loop hooks and aggregates their
+    iterations. Nested loops are merged into their parent when they end, so
+    the outermost loop, the only one reported, carries their totals too. While `active`, per-keyword work (variable refresh,
+    trace lines after the first iteration) can be skipped by the caller.
+    """
+
+    def __init__(self):
+        self._stack = []  # LoopStats of the loops currently running, outermost first
+
+    @property
+    def active(self):
+        return bool(self._stack)
+
+    @property
+    def sampling(self):
+        """True during the first iteration of the outermost loop (traced in full)."""
+        return not self._stack or self._stack[0].iterations == 0
+
+    def enter(self, data):
+        self._stack.append(LoopStats(loop_label(data), len(self._stack)))
+
+    def start_iteration(self):
+        if self._stack:
+            self._stack[-1]._iteration_start = time.monotonic()
+
+    def end_iteration(self, result):
+        if not self._stack:
+            return
+        stats = self._stack[-1]
+        elapsed = getattr(result, "elapsed_time", None)
+        if elapsed is not None:
+            seconds = elapsed.total_seconds()
+        elif stats._iteration_start is not None:
+            seconds = time.monotonic() - stats._iteration_start
+        else:
+            seconds = 0.0
+        stats.add_iteration(getattr(result, "status", "PASS"), seconds)
+
+    def count_call(self):
+        self._stack[0].keyword_calls += 1
+
+    def exit(self):
+        """Leave the innermost loop. Returns the outermost loop's LoopStats when it ends, else None."""
+        if not self._stack:
+            return None
+        stats = self._stack.pop()
+        if not self._stack:
+            return stats
+        self._stack[-1].merge(stats)
+        return None
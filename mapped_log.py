@@ -0,0 +1,336 @@
+# mapped_log.py
+import mmap
+import os
+import re
+import threading
+from bisect import bisect_right
+
+INDEX_BLOCK_BYTES = 64 * 1024  # One sparse index mark per block of file
+SEARCH_WINDOW_BYTES = 256 * 1024  # Regex search granularity: one window is copied out under the lock, then scanned
+MAX_LINE_BYTES = 4096  # Longer lines are clipped when rendered
+
+# Timestamps found in rfdb, Robot syslog/debug files and common application logs:
+# 2026-10-18 14:30:05 | 2026-10-18T14:30:05 | 20261018 14:30:05.123 | 14:30:05
+_TIMESTAMP = re.compile(rb"(?:(\d{4})-?(\d{2})-?(\d{2})[ T])?(\d{2}):(\d{2}):(\d{2})")
+
+
+def _open_shared(path):
+    """
+    Open a file for reading. On Windows the handle allows rename/delete, so a
+    RotatingFileHandler writing the file can still roll it over while it is viewed.
+    """
+    if os.name == "nt":
+        try:
+            import ctypes
+            import msvcrt
+            GENERIC_READ, OPEN_EXISTING = 0x80000000, 3
+            FILE_SHARE_READ_WRITE_DELETE = 0x1 | 0x2 | 0x4
+            create_file = ctypes.windll.kernel32.CreateFileW
+            create_file.restype = ctypes.c_void_p
+            handle = create_file(path, GENERIC_READ, FILE_SHARE_READ_WRITE_DELETE, None, OPEN_EXISTING, 0, None)
+            if handle not in (None, ctypes.c_void_p(-1).value):
+                return os.fdopen(msvcrt.open_osfhandle(handle, os.O_RDONLY), "rb")
+        except (OSError, AttributeError, ImportError):
+            pass
+    return open(path, "rb")
+
+
+def _identity(stat):
+    return stat.st_dev, stat.st_ino
+
+
+def timestamp_key(data):
+    """Return (date digits or '', time digits) of the first timestamp in a line, or None."""
+    match = _TIMESTAMP.search(data[:200])
+    if not match:
+        return None
+    date = b"".join(match.group(1, 2, 3)) if match.group(1) else b""
+    return date.decode(), b"".join(match.group(4, 5, 6)).decode()
+
+
+class MappedLog:
+    """
+    Read-only memory-mapped view of a (possibly multi-gigabyte) text file.
+
+    Lines are addressed by byte offset, so paging never needs the whole file.
+    A sparse index of (line number, offset) marks, one per INDEX_BLOCK_BYTES,
+    is built in a background thread and gives line numbers and a binary
+    searchable skeleton for timestamp jumps. Growing files are remapped and
+    the index extended (tail-follow); a shrunk file (truncation) is reindexed
+    and a file renamed away (rotation) is closed and the new file at the same
+    path opened instead. `generation` counts those restarts.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = _open_shared(path)
+        self._identity = _identity(os.fstat(self._file.fileno()))
+        self._map = None
+        self.size = 0
+        self.generation = 0
+        self._lock = threading.Lock()
+        # Sparse index: marks[i] = (line number, byte offset of that line's start)
+        self._mark_lines = [0]
+        self._mark_offsets = [0]
+        self._indexed_upto = 0  # Byte offset covered by the index
+        self._indexed_lines = 0
+        self._index_thread = None
+        self._remap()
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+
+    def _remap(self):
+        size = os.fstat(self._file.fileno()).st_size
+        old = self._map
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.size = size
+        if old is not None:
+            old.close()
+
+    def _reset_index(self):
+        self._mark_lines, self._mark_offsets = [0], [0]
+        self._indexed_upto = self._indexed_lines = 0
+        self.generation += 1
+
+    def _reopen(self):
+        """The path now names another file (the viewed one was rotated away): switch to it."""
+        new_file = _open_shared(self.path)
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+        self._file = new_file
+        self._identity = _identity(os.fstat(new_file.fileno()))
+        self.size = 0
+        self._reset_index()
+
+    def refresh(self):
+        """Pick up appended data, truncation or rotation. Returns True if the file changed."""
+        with self._lock:
+            try:
+                renamed = _identity(os.stat(self.path)) != self._identity  # fstat would only see the old file
+            except FileNotFoundError:
+                renamed = False  # Between the rollover rename and the new file being created
+            if renamed:
+                self._reopen()
+            size = os.fstat(self._file.fileno()).st_size
+            if size == self.size and not renamed:
+                return False
+            if size < self.size:
+                # Truncated in place: start the index over
+                self._reset_index()
+            self._remap()
+        self.build_index()
+        return True
+
+    # === Sparse index ===
+    @property
+    def index_progress(self):
+        return 1.0 if not self.size else min(1.0, self._indexed_upto / self.size)
+
+    @property
+    def indexed_lines(self):
+        return self._indexed_lines
+
+    def build_index(self):
+        """Extend the sparse index up to the current size in a background thread."""
+        if self._index_thread is not None and self._index_thread.is_alive():
+            return
+        self._index_thread = threading.Thread(target=self._index_worker, daemon=True)
+        self._index_thread.start()
+
+    def _index_worker(self):
+        while True:
+            with self._lock:
+                data = self._map
+                start = self._indexed_upto
+                if data is None or start >= self.size:
+                    return
+                stop = min(self.size, start + INDEX_BLOCK_BYTES)
+                self._indexed_lines += data[start:stop].count(b"\n")
+                self._indexed_upto = stop
+                if stop < self.size:
+                    newline = data.find(b"\n", stop)
+                    if newline != -1:
+                        # Mark the first line starting after this block
+                        self._indexed_lines += data[stop:newline + 1].count(b"\n")
+                        self._indexed_upto = newline + 1
+                        self._mark_lines.append(self._indexed_lines)
+                        self._mark_offsets.append(newline + 1)
+
+    def line_number(self, offset):
+        """0-based line number of the line starting at offset, or None if not indexed yet."""
+        with self._lock:
+            if offset > self._indexed_upto or self._map is None:
+                return None
+            i = bisect_right(self._mark_offsets, offset) - 1
+            base = self._mark_offsets[i]
+            return self._mark_lines[i] + self._map[base:offset].count(b"\n")
+
+    def offset_of_line(self, line):
+        """Byte offset of a 0-based line number, using the nearest index mark below it."""
+        with self._lock:
+            if self._map is None:
+                return 0
+            i = bisect_right(self._mark_lines, line) - 1
+            offset, current = self._mark_offsets[i], self._mark_lines[i]
+            while current < line:
+                newline = self._map.find(b"\n", offset)
+                if newline == -1:
+                    break
+                offset = newline + 1
+                current += 1
+            return min(offset, self.size)
+
+    # === Paging ===
+    def line_start(self, offset):
+        """Start offset of the line containing offset."""
+        with self._lock:
+            if self._map is None or offset <= 0:
+                return 0
+            offset = min(offset, self.size)
+            return self._map.rfind(b"\n", 0, offset) + 1
+
+    def move(self, offset, lines):
+        """Offset of the line `lines` lines after (or before, if negative) the line at offset."""
+        with self._lock:
+            if self._map is None:
+                return 0
+            if lines >= 0:
+                for _ in range(lines):
+                    newline = self._map.find(b"\n", offset)
+                    if newline == -1 or newline + 1 >= self.size:
+                        break
+                    offset = newline + 1
+                return offset
+            for _ in range(-lines):
+                if offset <= 0:
+                    return 0
+                offset = self._map.rfind(b"\n", 0, offset - 1) + 1
+            return offset
+
+    def read_lines(self, offset, count):
+        """Up to count decoded lines starting at offset."""
+        with self._lock:
+            if self._map is None:
+                return []
+            lines = []
+            for _ in range(count):
+                if offset >= self.size:
+                    break
+                newline = self._map.find(b"\n", offset)
+                end = self.size if newline == -1 else newline
+                text = self._map[offset:min(end, offset + MAX_LINE_BYTES)].decode("utf-8", "replace").rstrip("\r")
+                lines.append(text if end - offset <= MAX_LINE_BYTES else text + " ...")
+                offset = end + 1
+            return lines
+
+    def last_page_offset(self, count):
+        end = self.size
+        if end and self._map is not None and self._map[end - 1:end] == b"\n":
+            end -= 1
+        return self.move(self.line_start(end), -(count - 1))
+
+    # === Timestamp jump ===
+    def find_timestamp(self, target):
+        """
+        Offset of the first line whose timestamp is >= target (a timestamp_key).
+        Binary search over the index marks, then a scan of one block.
+        """
+        lo, hi = 0, len(self._mark_offsets) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            key = self._key_near(self._mark_offsets[mid])
+            if key is not None and self._before(key, target):
+                lo = mid
+            else:
+                hi = mid - 1
+        offset = self._mark_offsets[lo]
+        limit = self._mark_offsets[lo + 1] if lo + 1 < len(self._mark_offsets) else self.size
+        while offset < limit:
+            key = self._key_at(offset)
+            if key is not None and not self._before(key, target):
+                return offset
+            next_offset = self.move(offset, 1)
+            if next_offset == offset:
+                break
+            offset = next_offset
+        return offset
+
+    @staticmethod
+    def _before(key, target):
+        if target[0] and key[0]:
+            return key < target
+        return key[1] < target[1]  # Time-only comparison
+
+    def _key_at(self, offset):
+        with self._lock:
+            if self._map is None:
+                return None
+            return timestamp_key(self._map[offset:offset + 200])
+
+    def _key_near(self, offset, max_lines=50):
+        """Timestamp of the first timestamped line at or after offset (continuation lines have none)."""
+        for _ in range(max_lines):
+            key = self._key_at(offset)
+            if key is not None:
+                return key
+            next_offset = self.move(offset, 1)
+            if next_offset == offset:
+                return None
+            offset = next_offset
+        return None
+
+    # === Regex search ===
+    def _window(self, begin, end):
+        """Copy of the bytes in [begin, end); only the copy holds the lock, not the scan."""
+        with self._lock:
+            return None if self._map is None else self._map[begin:end]
+
+    def search(self, pattern, start, backward=False, cancel=None):
+        """
+        Offset of the line holding the next (or previous) match of a compiled bytes
+        pattern, streaming over the mapping in windows that start and end on line
+        boundaries; None if there is none. `re` holds the GIL while scanning, so
+        windows are small and scanned outside the lock to keep paging responsive.
+        """
+        if backward:
+            end = start
+            while end > 0:
+                if cancel is not None and cancel.is_set():
+                    return None
+                begin = self.line_start(max(0, end - SEARCH_WINDOW_BYTES))
+                data = self._window(begin, end)
+                if data is None:
+                    return None
+                last = None
+                for last in pattern.finditer(data):
+                    pass
+                if last is not None:
+                    return self.line_start(begin + last.start())
+                end = begin
+            return None
+
+        pos = start
+        while pos < self.size:
+            if cancel is not None and cancel.is_set():
+                return None
+            with self._lock:
+                if self._map is None:
+                    return None
+                stop = min(self.size, pos + SEARCH_WINDOW_BYTES)
+                newline = self._map.find(b"\n", stop)
+                stop = self.size if newline == -1 else newline + 1  # Windows end on a line boundary
+            data = self._window(pos, stop)
+            if data is None:
+                return None
+            match = pattern.search(data)
+            if match is not None:
+                return self.line_start(pos + match.start())
+            pos = stop
+        return None
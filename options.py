@@ -0,0 +1,65 @@
+# options.py
+import logging
+from .debug_log import default_log_path, DEFAULT_LOG_MAX_BYTES, DEFAULT_LOG_BACKUPS
+from .keyword_trace import TRACE_LEVELS
+
+logger = logging.getLogger(__name__)
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+class DebuggerOptions:
+    """
+    Listener arguments given as key=value pairs, e.g.
+    robot --listener rfdb.RobotFrameworkDebugger:log_level=DEBUG:log_path=rfdb.log
+    """
+
+    DEFAULTS = {
+        "log_path": None,  # None -> default_log_path()
+        "log_level": "INFO",
+        "log_max_bytes": DEFAULT_LOG_MAX_BYTES,
+        "log_backups": DEFAULT_LOG_BACKUPS,
+        "trace": "off",  # Live keyword trace level
+        "trace_rate": 20,  # Max traced keyword events per second
+        "baseline_output": "",  # output.xml of a previous run for duration/flakiness baselines
+        "catalog_cache": None,  # Keyword catalog cache directory, None -> ~/.rfdb/catalog, "off" disables
+        "ignore_profile": "",  # Saved ignore rule profile (name under ~/.rfdb/ignore_profiles or a .json path)
+    }
+
+    def __init__(self, **values):
+        for key, default in self.DEFAULTS.items():
+            setattr(self, key, values.get(key, default))
+        if self.log_path is None:
+            self.log_path = default_log_path()
+
+    @classmethod
+    def parse(cls, args):
+        """Build options from listener arguments; bad entries are logged and skipped."""
+        values = {}
+        for arg in args:
+            if not arg:
+                continue
+            key, sep, text = str(arg).partition("=")
+            key = key.strip().lower()
+            if not sep or key not in cls.DEFAULTS:
+                logger.warning(f"[Debugger] Ignoring unknown listener argument: {arg}")
+                continue
+            try:
+                values[key] = cls._convert(key, text.strip())
+            except ValueError as e:
+                logger.warning(f"[Debugger] Invalid listener argument {arg}: {e}")
+        return cls(**values)
+
+    @classmethod
+    def _convert(cls, key, text):
+        if key == "log_level":
+            if text.upper() not in LOG_LEVELS:
+                raise ValueError(f"expected one of {', '.join(LOG_LEVELS)}")
+            return text.upper()
+        if key == "trace":
+            if text.lower() not in TRACE_LEVELS:
+                raise ValueError(f"expected one of {', '.join(TRACE_LEVELS)}")
+            return text.lower()
+        if isinstance(cls.DEFAULTS[key], int):
+            return int(text)
+        return text
@@ -0,0 +1,207 @@
+# output_import.py
+import logging
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from .arg_converters import normalize_name
+
+logger = logging.getLogger(__name__)
+
+SLOWER_RATIO = 1.5  # Report tests running this much slower than in the baseline run
+
+
+def _status_seconds(attrs):
+    """Duration of a <status> element: RF 7 'elapsed' or RF 6 'starttime'/'endtime'."""
+    elapsed = attrs.get("elapsed")
+    if elapsed is not None:
+        try:
+            return float(elapsed)
+        except ValueError:
+            return None
+    start, end = attrs.get("starttime"), attrs.get("endtime")
+    if not start or not end or start == "N/A" or end == "N/A":
+        return None
+    try:
+        fmt = "%Y%m%d %H:%M:%S.%f"
+        return (datetime.strptime(end, fmt) - datetime.strptime(start, fmt)).total_seconds()
+    except ValueError:
+        return None
+
+
+class KeywordStats:
+    __slots__ = ("name", "calls", "failures", "total_seconds")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+
+    @property
+    def avg_seconds(self):
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    @property
+    def flaky(self):
+        """Failed at least once but also passed in the baseline run."""
+        return 0 < self.failures < self.calls
+
+
+class RunBaseline:
+    """Durations and outcomes of a previous run, streamed from its output.xml."""
+
+    def __init__(self, source):
+        self.source = source
+        self.test_seconds = {}  # Test full name -> seconds
+        self.keywords = {}  # Normalized keyword name -> KeywordStats
+        self.load_seconds = 0.0
+
+    @classmethod
+    def load(cls, path):
+        """
+        Stream-parse output.xml with iterparse, clearing every finished element
+        so memory stays flat regardless of file size.
+        """
+        baseline = cls(path)
+        started = time.monotonic()
+        suites = []  # Names of open suites
+        stack = []  # [tag, name, status, seconds, depth] of open suite/test/kw elements
+        depth = 0  # Depth of the element being parsed
+        for event, elem in ET.iterparse(path, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                depth += 1
+                if tag in ("suite", "test", "kw"):
+                    name = elem.get("name", "")
+                    if tag == "kw":
+                        owner = elem.get("owner") or elem.get("library")
+                        name = f"{owner}.{name}" if owner else name
+                    elif tag == "suite":
+                        suites.append(name)
+                    stack.append([tag, name, None, None, depth])
+                continue
+
+            depth -= 1
+            if tag == "status":
+                # Only a direct child: FOR, IF, TRY, GROUP, VAR, ... have their own <status>
+                if stack and stack[-1][4] == depth:
+                    stack[-1][2] = elem.get("status")
+                    stack[-1][3] = _status_seconds(elem.attrib)
+            elif tag in ("suite", "test", "kw"):
+                _, name, status, seconds, _ = stack.pop()
+                if tag == "kw":
+                    baseline._add_keyword(name, status, seconds)
+                elif tag == "test":
+                    if seconds is not None:
+                        baseline.test_seconds[".".join(suites + [name])] = seconds
+                else:
+                    suites.pop()
+            elem.clear()
+        baseline.load_seconds = time.monotonic() - started
+        return baseline
+
+    def _add_keyword(self, name, status, seconds):
+        key = normalize_name(name)
+        stats = self.keywords.get(key)
+        if stats is None:
+            stats = self.keywords[key] = KeywordStats(name)
+        stats.calls += 1
+        if status == "FAIL":
+            stats.failures += 1
+        if seconds is not None:
+            stats.total_seconds += seconds
+
+    # === Lookups ===
+    def expected_test_seconds(self, full_name):
+        return self.test_seconds.get(full_name)
+
+    def keyword_stats(self, name, owner=None):
+        """Stats by qualified name if given, else by plain name (first library wins)."""
+        if owner:
+            stats = self.keywords.get(normalize_name(f"{owner}.{name}"))
+            if stats is not None:
+                return stats
+        key = normalize_name(name)
+        stats = self.keywords.get(key)
+        if stats is not None:
+            return stats
+        suffix = "." + key
+        return next((s for k, s in self.keywords.items() if k.endswith(suffix)), None)
+
+    def flaky_keywords(self):
+        return [stats.name for stats in self.keywords.values() if stats.flaky]
+
+    def keyword_names(self):
+        """Plain keyword names, for seeding the seen-keyword catalog."""
+        return {stats.name.rsplit(".", 1)[-1] for stats in self.keywords.values()}
+
+
+class RunEstimator:
+    """
+    Compares the current run against a RunBaseline: live slowdown of the
+    running test and a prediction of the remaining suite time, scaled by how
+    fast this run has been so far.
+    """
+
+    def __init__(self, baseline):
+        self.baseline = baseline
+        self._lock = threading.Lock()
+        self._planned = []  # Full names of tests not run yet
+        self._planned_set = set()
+        self._current = None  # (full name, start monotonic)
+        self._actual_total = 0.0  # Seconds of finished tests that have a baseline
+        self._expected_total = 0.0
+        known = list(baseline.test_seconds.values())
+        self._default_expected = sum(known) / len(known) if known else 0.0
+
+    def plan(self, full_names):
+        with self._lock:
+            for name in full_names:
+                if name not in self._planned_set:
+                    self._planned_set.add(name)
+                    self._planned.append(name)
+
+    def test_started(self, full_name):
+        with self._lock:
+            self._current = (full_name, time.monotonic())
+
+    def test_ended(self, full_name, seconds):
+        with self._lock:
+            self._current = None
+            self._planned_set.discard(full_name)
+            expected = self.baseline.expected_test_seconds(full_name)
+            if expected and seconds is not None:
+                self._actual_total += seconds
+                self._expected_total += expected
+
+    @property
+    def speed_ratio(self):
+        """Actual / expected time over the tests finished so far (1.0 until known)."""
+        return self._actual_total / self._expected_total if self._expected_total else 1.0
+
+    def current_slowdown(self):
+        """(test name, ratio) when the running test is already SLOWER_RATIO slower than its baseline."""
+        with self._lock:
+            if self._current is None:
+                return None
+            name, started = self._current
+        expected = self.baseline.expected_test_seconds(name)
+        if not expected:
+            return None
+        ratio = (time.monotonic() - started) / expected
+        return (name, ratio) if ratio >= SLOWER_RATIO else None
+
+    def remaining_seconds(self):
+        """Predicted time left for tests not finished yet, or None without a plan."""
+        with self._lock:
+            if not self._planned_set:
+                return None
+            expected = sum(
+                self.baseline.test_seconds.get(name, self._default_expected)
+                for name in self._planned if name in self._planned_set
+            )
+            if self._current is not None:
+                expected -= min(time.monotonic() - self._current[1],
+                                self.baseline.test_seconds.get(self._current[0], self._default_expected))
+        return max(0.0, expected * self.speed_ratio)
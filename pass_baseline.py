@@ -0,0 +1,202 @@
+# pass_baseline.py
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+STORED_PREVIEW_LENGTH = 80  # Previews kept on disk are shorter than in-memory ones
+MAX_POSITIONS_PER_TEST = 300  # Keyword positions recorded per test
+DEFAULT_STORE_BYTES = 20 * 1024 * 1024  # Total size bound of the on-disk store
+
+
+def default_baseline_dir():
+    return os.path.join(os.path.expanduser("~"), ".rfdb", "baselines")
+
+
+class BaselineStore:
+    """Size-bounded directory of per-test variable baselines, one JSON file per test longname."""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_STORE_BYTES):
+        self.directory = directory or default_baseline_dir()
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, longname):
+        key = hashlib.sha1(longname.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, longname):
+        try:
+            with open(self._path(longname), "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Guard against hash collisions and files written by other versions
+        if record.get("longname") != longname:
+            return None
+        return record
+
+    def save(self, longname, record):
+        path = self._path(longname)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(record, f, separators=(",", ":"))
+            os.replace(tmp_path, path)  # Atomic, so readers never see a partial file
+            self._enforce_limit()
+        except OSError as e:
+            logger.warning(f"[Debugger] Failed to save pass baseline for '{longname}': {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def save_async(self, longname, record):
+        threading.Thread(target=self.save, args=(longname, record), daemon=True).start()
+
+    def _enforce_limit(self):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+            if total <= self.max_bytes:
+                break
+
+
+class BaselineRecorder:
+    """Collects delta-encoded variable digests per keyword position while a test runs."""
+
+    def __init__(self, longname):
+        self.longname = longname
+        self._last = {}  # name -> digest at the previous position
+        self._positions = {}  # position -> step index
+        self._steps = []  # [changed {name: [digest, preview]}, removed [names]]
+        self.truncated = False  # Positions past MAX_POSITIONS_PER_TEST were not recorded
+
+    def record(self, position, snapshot):
+        if position in self._positions:
+            return
+        if len(self._steps) >= MAX_POSITIONS_PER_TEST:
+            if not self.truncated:
+                self.truncated = True
+                logger.info(f"[Debugger] Pass baseline for '{self.longname}' keeps only the first "
+                            f"{MAX_POSITIONS_PER_TEST} keyword positions")
+            return
+        last = self._last
+        changed = {
+            name: [value.digest, value.preview[:STORED_PREVIEW_LENGTH]]
+            for name, value in snapshot.items() if last.get(name) != value.digest
+        }
+        removed = [name for name in last if name not in snapshot]
+        self._last = {name: value.digest for name, value in snapshot.items()}
+        self._positions[position] = len(self._steps)
+        self._steps.append([changed, removed])
+
+    def to_record(self):
+        return {
+            "longname": self.longname,
+            "saved": time.time(),
+            "positions": self._positions,
+            "steps": self._steps,
+            "truncated": self.truncated,
+        }
+
+
+class PassDiff:
+    """
+    Incrementally maintained difference between the current variables and the
+    stored baseline of the last passing run, aligned by keyword position.
+
+    Each update only re-compares names that changed on either side since the
+    previous update, so the diff is already complete when a failure pauses.
+    A position the baseline does not have (another IF branch, an extra
+    retry, or past a truncated baseline) is reported in `missing` rather
+    than compared against the last matched step.
+    """
+
+    def __init__(self, record):
+        self.saved = record.get("saved")
+        self._positions = record.get("positions", {})
+        self._steps = record.get("steps", [])
+        self.truncated = record.get("truncated", False)
+        self._lock = threading.Lock()
+        self._baseline = {}  # name -> [digest, preview] at the cursor
+        self._cursor = -1
+        self._current = {}  # name -> VariableValue
+        self.position = None  # Last position matched in the baseline
+        self.missing = None  # Current position, when the baseline has no step for it
+        self._differences = {}  # name -> (current VariableValue or None, baseline [digest, preview] or None)
+
+    def update(self, position, snapshot):
+        with self._lock:
+            changed = set()
+
+            index = self._positions.get(position)
+            if index is not None:
+                if index <= self._cursor:
+                    # Went backwards (e.g. a retried keyword) - replay from the start
+                    changed.update(self._baseline)
+                    self._baseline = {}
+                    self._cursor = -1
+                for step_changes, removed in self._steps[self._cursor + 1:index + 1]:
+                    self._baseline.update(step_changes)
+                    for name in removed:
+                        self._baseline.pop(name, None)
+                    changed.update(step_changes)
+                    changed.update(removed)
+                self._cursor = index
+                self.position = position
+                self.missing = None
+            else:
+                self.missing = position
+
+            current = self._current
+            for name, value in snapshot.items():
+                old = current.get(name)
+                if old is None or old.digest != value.digest:
+                    changed.add(name)
+            changed.update(name for name in current if name not in snapshot)
+            self._current = snapshot
+
+            for name in changed:
+                now = snapshot.get(name)
+                then = self._baseline.get(name)
+                if (now.digest if now else None) == (then[0] if then else None):
+                    self._differences.pop(name, None)
+                else:
+                    self._differences[name] = (now, then)
+
+    @property
+    def recorded_positions(self):
+        return len(self._positions)
+
+    def differences(self):
+        """Return a sorted list of (name, current preview, baseline preview, change kind)."""
+        with self._lock:
+            if self.position is None or self.missing is not None:
+                return []
+            rows = []
+            for name, (now, then) in self._differences.items():
+                if now is None:
+                    kind = "removed"
+                elif then is None:
+                    kind = "added"
+                else:
+                    kind = "changed"
+                rows.append((name, now.preview if now else "", then[1] if then else "", kind))
+            return sorted(rows)
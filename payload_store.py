@@ -0,0 +1,163 @@
+# payload_store.py
+import itertools
+import sys
+import threading
+from collections import OrderedDict
+from .variable_history import preview_value
+
+FOLD_CHARS = 4000  # Messages longer than this are folded
+FOLD_LINES = 40  # ...or with more lines than this
+PREVIEW_LINES = 8  # Lines shown above the fold summary
+PREVIEW_LINE_CHARS = 200  # Max characters per preview line
+MAX_ARGS_SHOWN = 20  # Further arguments are folded into one payload
+SIZE_SAMPLE_ITEMS = 32  # Items sampled to estimate the size of a non-string payload
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def estimate_size(value):
+    """
+    Approximate bytes held by a payload: exact for strings, otherwise the
+    container plus its length times the average size of the first
+    SIZE_SAMPLE_ITEMS items (one level deep), so big lists are not counted
+    as a few dozen bytes and sizing never walks the whole value.
+    """
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    size = sys.getsizeof(value)
+    try:
+        count = len(value)
+        if not count:
+            return size
+        items = value.values() if isinstance(value, dict) else value
+        sample = list(itertools.islice(iter(items), SIZE_SAMPLE_ITEMS))
+    except Exception:
+        return size
+    sampled = sum(len(item) if isinstance(item, (str, bytes)) else sys.getsizeof(item) for item in sample)
+    return size + sampled * count // max(1, len(sample))
+
+
+class PayloadStore:
+    """
+    Keeps large log payloads (failure messages, argument values) out of the
+    Text widget. Payloads are addressed by id and evicted least recently used
+    once the byte budget is exceeded. Non-string values are kept as objects
+    and only turned into text when opened.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._payloads = OrderedDict()  # id -> (value, size)
+        self._bytes = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def put(self, value):
+        size = estimate_size(value)
+        with self._lock:
+            payload_id = next(self._ids)
+            self._payloads[payload_id] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._payloads) > 1:
+                _, (_, old_size) = self._payloads.popitem(last=False)
+                self._bytes -= old_size
+        return payload_id
+
+    def get_text(self, payload_id):
+        """Full text of a payload, or None once it has been evicted."""
+        with self._lock:
+            item = self._payloads.get(payload_id)
+            if item is None:
+                return None
+            self._payloads.move_to_end(payload_id)
+        value = item[0]
+        if isinstance(value, str):
+            return value
+        try:
+            return str(value)
+        except Exception:
+            return preview_value(value)
+
+    def __len__(self):
+        return len(self._payloads)
+
+    # === Log segment builders ===
+    def fold_message(self, text, tag, indent="   "):
+        """
+        Segments for a multi-line message. Small messages are inlined line by
+        line; large ones show a bounded preview plus a clickable fold summary.
+        Only the preview is split, so cost does not grow with message size.
+        """
+        if len(text) <= FOLD_CHARS and text.count("\n") < FOLD_LINES:
+            return [(f"{indent}{line}\n", tag) for line in text.split("\n") if line.strip()]
+
+        head = text[:PREVIEW_LINES * PREVIEW_LINE_CHARS]
+        segments = []
+        for line in head.split("\n")[:PREVIEW_LINES]:
+            if line.strip():
+                segments.append((f"{indent}{self._clip(line)}\n", tag))
+        line_count = text.count("\n") + 1
+        summary = f"[+] {format_size(len(text))}, {line_count:,} lines - click to view all"
+        segments.append(self.fold_segment(text, summary, indent))
+        return segments
+
+    def fold_args(self, args, indent="   "):
+        """Segments for an argument list: bounded previews, overflow folded into one payload."""
+        segments = []
+        for i, arg in enumerate(args[:MAX_ARGS_SHOWN], 1):
+            segments.append((f"{indent}[{i}] ", "label"))
+            text = arg if isinstance(arg, str) else preview_value(arg)
+            if len(text) > 100 or "\n" in text or (text is not arg and "..." in text):
+                size = format_size(len(arg)) if isinstance(arg, str) else self._describe(arg)
+                first_line = text.split("\n", 1)[0]
+                segments.append((f"{self._clip(first_line, 97)} ", "args"))
+                segments.append(self.fold_segment(arg, f"[+] {size}", ""))
+            else:
+                segments.append((f"{text}\n", "args"))
+        hidden = len(args) - MAX_ARGS_SHOWN
+        if hidden > 0:
+            rest = _LazyArgs(args, MAX_ARGS_SHOWN)
+            segments.append(self.fold_segment(rest, f"[+] {hidden:,} more arguments - click to view", indent))
+        return segments
+
+    def fold_segment(self, value, summary, indent="   "):
+        """
+        A clickable summary segment referring to a stored payload. The payload id
+        rides in the segment's tags but is not a Tk tag (see LogPanel), so the
+        widget's tag table does not grow with every folded payload.
+        """
+        payload_id = self.put(value)
+        return (f"{indent}{summary}\n", ("fold", payload_id))
+
+    @staticmethod
+    def _describe(value):
+        try:
+            return f"{type(value).__name__}, {len(value):,} items"
+        except TypeError:
+            return type(value).__name__
+
+    @staticmethod
+    def _clip(line, limit=PREVIEW_LINE_CHARS):
+        return line if len(line) <= limit else line[:limit] + "..."
+
+
+class _LazyArgs:
+    """Remaining arguments of a call, formatted only when the payload is opened."""
+
+    def __init__(self, args, start):
+        self.args = list(args[start:])
+        self.start = start
+
+    def __len__(self):
+        return len(self.args)
+
+    def __iter__(self):
+        return iter(self.args)
+
+    def __str__(self):
+        return "\n".join(f"[{i}] {arg}" for i, arg in enumerate(self.args, self.start + 1))
@@ -0,0 +1,87 @@
+# payload_viewer.py
+import logging
+import tkinter as tk
+from tkinter import filedialog, messagebox, scrolledtext
+from .payload_store import format_size
+
+logger = logging.getLogger(__name__)
+
+
+class PayloadViewer(tk.Toplevel):
+    """Popup showing a large payload one page at a time, with copy and save of the full text."""
+
+    PAGE_CHARS = 64 * 1024
+
+    def __init__(self, parent, title, text):
+        super().__init__(parent)
+        self.title(title)
+        self.geometry("800x550")
+        self.minsize(500, 300)
+        self.transient(parent)
+        self.full_text = text
+        self.page_count = max(1, -(-len(text) // self.PAGE_CHARS))
+        self.page = 0
+
+        header = tk.Label(
+            self,
+            text=f"{title}  ({format_size(len(text))})",
+            font=("Segoe UI", 11, "bold"),
+            bg="#4A90E2",
+            fg="white",
+            pady=8
+        )
+        header.pack(fill=tk.X)
+
+        self.text = scrolledtext.ScrolledText(
+            self,
+            wrap=tk.CHAR,
+            font=("Consolas", 10),
+            bg="#1e1e1e",
+            fg="#e0e0e0",
+            padx=10,
+            pady=10
+        )
+        self.text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+
+        nav = tk.Frame(self)
+        nav.pack(fill=tk.X, padx=10, pady=(0, 10))
+        self.prev_btn = tk.Button(nav, text="< Prev", command=lambda: self.show_page(self.page - 1))
+        self.prev_btn.pack(side=tk.LEFT)
+        self.next_btn = tk.Button(nav, text="Next >", command=lambda: self.show_page(self.page + 1))
+        self.next_btn.pack(side=tk.LEFT, padx=5)
+        self.page_label = tk.Label(nav, text="")
+        self.page_label.pack(side=tk.LEFT, padx=10)
+        tk.Button(nav, text="Save...", command=self._save).pack(side=tk.RIGHT)
+        tk.Button(nav, text="Copy All", command=self._copy).pack(side=tk.RIGHT, padx=5)
+
+        self.show_page(0)
+
+    def show_page(self, page):
+        self.page = min(max(page, 0), self.page_count - 1)
+        start = self.page * self.PAGE_CHARS
+        self.text.configure(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", self.full_text[start:start + self.PAGE_CHARS])
+        self.text.configure(state=tk.DISABLED)
+        self.page_label.config(text=f"Page {self.page + 1} / {self.page_count}")
+        self.prev_btn.config(state=tk.NORMAL if self.page > 0 else tk.DISABLED)
+        self.next_btn.config(state=tk.NORMAL if self.page < self.page_count - 1 else tk.DISABLED)
+
+    def _copy(self):
+        self.clipboard_clear()
+        self.clipboard_append(self.full_text)
+
+    def _save(self):
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.full_text)
+        except OSError as e:
+            logger.warning(f"[Debugger GUI] Could not save payload to {path}: {e}")
+            messagebox.showerror("Save Failed", str(e), parent=self)
@@ -0,0 +1,66 @@
+# render_scheduler.py
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RenderScheduler:
+    """
+    Buffers UI mutations posted from any thread and applies them on the Tk
+    thread in one batched pass, at most `max_fps` times per second.
+
+    Keyed mutations (e.g. the status label) are coalesced so only the latest
+    one runs. Flush hooks run once per pass, after all posted mutations,
+    which lets the log panel render every new entry with a single refresh.
+    """
+
+    def __init__(self, root, max_fps=20):
+        self.root = root
+        self.interval = 1.0 / max_fps
+        self._lock = threading.Lock()
+        self._pending = []  # Ordered callables
+        self._keyed = {}  # key -> latest callable
+        self._flush_hooks = []
+        self._scheduled = False
+        self._last_flush = 0.0
+
+    def on_flush(self, callback):
+        self._flush_hooks.append(callback)
+
+    def post(self, action, key=None):
+        """Queue a UI mutation. With a key, a newer mutation replaces a pending older one."""
+        with self._lock:
+            if key is None:
+                self._pending.append(action)
+            else:
+                self._keyed[key] = action
+        self.request_flush()
+
+    def request_flush(self):
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+            delay = max(0.0, self._last_flush + self.interval - time.monotonic())
+        try:
+            self.root.after(int(delay * 1000), self._flush)
+        except Exception as e:
+            # Tk is gone (window closed) - drop pending work
+            logger.debug(f"[Debugger GUI] Render flush not scheduled: {e}")
+            with self._lock:
+                self._scheduled = False
+
+    def _flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            keyed, self._keyed = self._keyed, {}
+            self._scheduled = False
+            self._last_flush = time.monotonic()
+
+        for action in pending + list(keyed.values()) + self._flush_hooks:
+            try:
+                action()
+            except Exception as e:
+                logger.warning(f"[Debugger GUI] Render update failed: {e}")
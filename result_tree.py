@@ -0,0 +1,209 @@
+# result_tree.py
+import tkinter as tk
+from tkinter import ttk
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return ""
+    if seconds < 60:
+        return f"{seconds:.2f}s"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+class ResultNode:
+    """A suite or test in the result tree. Suites aggregate the statuses of all tests below them."""
+
+    __slots__ = ("id", "name", "kind", "parent", "children", "status", "seconds",
+                 "markers", "counts", "total", "log_seq", "loaded", "iid")
+
+    def __init__(self, node_id, name, kind, parent=None):
+        self.id = node_id
+        self.name = name
+        self.kind = kind  # suite | test
+        self.parent = parent
+        self.children = []
+        self.status = "NOT RUN"
+        self.seconds = None
+        self.markers = []  # e.g. "retried", "skipped by user"
+        self.counts = {"PASS": 0, "FAIL": 0, "SKIP": 0}
+        self.total = 0  # Tests below a suite
+        self.log_seq = None  # First log entry of a test
+        self.loaded = 0  # Children materialized in the Treeview
+        self.iid = None  # Treeview item id once materialized
+
+
+class ResultTree(tk.Frame):
+    """
+    Suite/test hierarchy with per-test status, duration and markers.
+
+    The model holds every node, but Treeview items are only created for the
+    children of expanded suites, PAGE_SIZE at a time with a "more" item to
+    load the next page. Updates touch only nodes that are materialized.
+    All methods run on the Tk thread.
+    """
+
+    PAGE_SIZE = 200
+
+    def __init__(self, parent, on_test_selected=None, on_test_activated=None):
+        super().__init__(parent)
+        self.on_test_selected = on_test_selected
+        self.on_test_activated = on_test_activated  # Double-click
+        self._nodes = {}
+        self._by_iid = {}  # Treeview item id -> materialized node
+        self._more_items = {}  # "more" item iid -> suite node
+
+        self.tree = ttk.Treeview(self, columns=("status", "time", "info"), selectmode="browse")
+        self.tree.heading("#0", text="Suite / Test")
+        self.tree.heading("status", text="Status")
+        self.tree.heading("time", text="Duration")
+        self.tree.heading("info", text="Counts / Markers")
+        self.tree.column("#0", width=360, stretch=True)
+        self.tree.column("status", width=80, stretch=False, anchor="center")
+        self.tree.column("time", width=80, stretch=False, anchor="e")
+        self.tree.column("info", width=260, stretch=True)
+        for status, color in (("PASS", "#006600"), ("FAIL", "#8B0000"), ("SKIP", "#CC6600"),
+                              ("RUNNING", "#003366"), ("NOT RUN", "#666666")):
+            self.tree.tag_configure(status, foreground=color)
+
+        scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<Double-1>", self._on_activate)
+
+    # === Model updates (called with plain data extracted in the listener hooks) ===
+    def suite_started(self, suite_id, name, child_suites, tests):
+        """child_suites / tests: [(id, name)] of the suite's direct children."""
+        node = self._nodes.get(suite_id)
+        if node is None:
+            parent = self._nodes.get(suite_id.rsplit("-", 1)[0]) if "-" in suite_id else None
+            node = self._add_node(suite_id, name, "suite", parent)
+        node.status = "RUNNING"
+        if not node.children:
+            for child_id, child_name in child_suites:
+                self._add_node(child_id, child_name, "suite", node)
+            for test_id, test_name in tests:
+                self._add_node(test_id, test_name, "test", node)
+            self._add_planned(node, len(tests))
+            if node.parent is None and not node.loaded and node.children:
+                # Top-level suite starts expanded
+                self.tree.delete(*self.tree.get_children(node.iid))
+                self._load_page(node)
+                self.tree.item(node.iid, open=True)
+        self._render(node)
+
+    def suite_ended(self, suite_id, status, seconds):
+        node = self._nodes.get(suite_id)
+        if node is not None:
+            node.status = status
+            node.seconds = seconds
+            self._render(node)
+
+    def test_started(self, test_id, name, log_seq):
+        node = self._nodes.get(test_id) or self._add_node(
+            test_id, name, "test", self._nodes.get(test_id.rsplit("-", 1)[0]))
+        node.status = "RUNNING"
+        node.log_seq = log_seq
+        self._render(node)
+
+    def test_ended(self, test_id, status, seconds, markers):
+        node = self._nodes.get(test_id)
+        if node is None:
+            return
+        node.status = status
+        node.seconds = seconds
+        node.markers = markers
+        self._render(node)
+        parent = node.parent
+        while parent is not None:
+            if status in parent.counts:
+                parent.counts[status] += 1
+            self._render(parent)
+            parent = parent.parent
+
+    def _add_node(self, node_id, name, kind, parent):
+        node = ResultNode(node_id, name, kind, parent)
+        self._nodes[node_id] = node
+        if parent is None:
+            node.iid = self.tree.insert("", tk.END, text=name)
+            self._by_iid[node.iid] = node
+            return node
+        parent.children.append(node)
+        if parent.iid is None:
+            return node
+        if parent.loaded and parent.loaded == len(parent.children) - 1 and parent.loaded < self.PAGE_SIZE:
+            # Suite already expanded with every child shown: show the new one too
+            self._materialize(node)
+            parent.loaded += 1
+        elif not parent.loaded and not self.tree.get_children(parent.iid):
+            self.tree.insert(parent.iid, tk.END, text="...")  # Placeholder so the suite is expandable
+        return node
+
+    def _add_planned(self, suite, count):
+        while suite is not None:
+            suite.total += count
+            self._render(suite)
+            suite = suite.parent
+
+    # === Rendering ===
+    def _render(self, node):
+        if node.iid is None:
+            return
+        if node.kind == "suite":
+            counts = node.counts
+            info = f"{counts['PASS']} pass · {counts['FAIL']} fail · {counts['SKIP']} skip / {node.total}"
+        else:
+            info = ", ".join(node.markers)
+        self.tree.item(node.iid, values=(node.status, format_duration(node.seconds), info), tags=(node.status,))
+
+    def _materialize(self, node):
+        node.iid = self.tree.insert(node.parent.iid, tk.END, text=node.name)
+        self._by_iid[node.iid] = node
+        if node.children:
+            self.tree.insert(node.iid, tk.END, text="...")
+        self._render(node)
+
+    def _load_page(self, suite):
+        start = suite.loaded
+        for child in suite.children[start:start + self.PAGE_SIZE]:
+            self._materialize(child)
+        suite.loaded = min(len(suite.children), start + self.PAGE_SIZE)
+        remaining = len(suite.children) - suite.loaded
+        if remaining > 0:
+            more = self.tree.insert(suite.iid, tk.END, text=f"... {remaining:,} more (select to load)")
+            self._more_items[more] = suite
+
+    def _on_open(self, event=None):
+        iid = self.tree.focus()
+        suite = self._by_iid.get(iid)
+        if suite is None or suite.kind != "suite" or suite.loaded:
+            return
+        self.tree.delete(*self.tree.get_children(iid))  # Drop the placeholder
+        self._load_page(suite)
+
+    def _on_select(self, event=None):
+        selection = self.tree.selection()
+        if not selection:
+            return
+        iid = selection[0]
+        suite = self._more_items.pop(iid, None)
+        if suite is not None:
+            self.tree.delete(iid)
+            self._load_page(suite)
+            return
+        node = self._by_iid.get(iid)
+        if node is not None and node.kind == "test" and self.on_test_selected is not None:
+            self.on_test_selected(node)
+
+    def _on_activate(self, event=None):
+        node = self._by_iid.get(self.tree.focus())
+        if node is not None and node.kind == "test" and self.on_test_activated is not None:
+            self.on_test_activated(node)
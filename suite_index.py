@@ -0,0 +1,156 @@
+# suite_index.py
+import logging
+import sys
+import threading
+import time
+from .arg_converters import normalize_name
+
+logger = logging.getLogger(__name__)
+
+KEYWORD_TYPES = ("KEYWORD", "SETUP", "TEARDOWN")
+BRANCH_ROOTS = ("IF/ELSE ROOT", "TRY/EXCEPT ROOT")  # Containers of branches, not a nesting level of their own
+
+
+class CallSite:
+    """A keyword call written in a test, setup/teardown or suite-file keyword."""
+
+    __slots__ = ("name", "args", "source", "lineno", "depth", "owner")
+
+    def __init__(self, name, args, source, lineno, depth, owner):
+        self.name = name
+        self.args = args
+        self.source = source
+        self.lineno = lineno
+        self.depth = depth  # Control structure nesting inside the body, 0 for top-level steps
+        self.owner = owner  # TestEntry, or the keyword name for calls inside a suite-file keyword
+
+
+class TestEntry:
+    __slots__ = ("position", "id", "longname", "name", "suite", "tags", "source", "lineno",
+                 "setup", "teardown", "calls")
+
+    def __init__(self, position, test, suite_name):
+        self.position = position
+        self.id = test.id
+        self.longname = getattr(test, "full_name", None) or getattr(test, "longname", None) or test.name
+        self.name = test.name
+        self.suite = suite_name
+        self.tags = tuple(test.tags)
+        self.source = sys.intern(str(test.source)) if test.source else None
+        self.lineno = test.lineno
+        self.setup = None
+        self.teardown = None
+        self.calls = []
+
+
+class SuiteIndex:
+    """
+    Static view of the running suite, built once from the model `start_suite`
+    receives: every test in execution order with its tags, setup/teardown
+    and the keyword calls in its body (with file and line), plus the bodies
+    of keywords defined in suite files.
+
+    `build` walks the model on a daemon thread so the first test never waits
+    for it; lookups return None / empty results until `ready` is set, after
+    which the index is read-only and safe to read from any thread.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.tests = []
+        self.build_seconds = None
+        self._by_id = {}
+        self._by_longname = {}
+        self._sites = {}  # Normalized keyword name -> [CallSite]
+        self._user_keywords = {}  # (suite file, normalized name) -> (name, source, lineno, [CallSite])
+
+    @classmethod
+    def build(cls, suite, on_ready=None):
+        """Start indexing `suite` in the background and return the (not yet ready) index."""
+        index = cls()
+        threading.Thread(target=index._build, args=(suite, on_ready), daemon=True,
+                         name="rfdb-suite-index").start()
+        return index
+
+    def _build(self, suite, on_ready):
+        started = time.perf_counter()
+        try:
+            self._walk_suite(suite)
+        except Exception as e:
+            logger.warning(f"[Debugger] Suite indexing failed: {e}")
+            return
+        self.build_seconds = time.perf_counter() - started
+        self.ready = True
+        logger.info(f"[Debugger] Suite indexed in {self.build_seconds:.2f}s: {len(self.tests)} tests, "
+                    f"{sum(len(sites) for sites in self._sites.values())} keyword calls")
+        if on_ready is not None:
+            try:
+                on_ready(self)
+            except Exception as e:
+                logger.warning(f"[Debugger] Suite index callback failed: {e}")
+
+    def _walk_suite(self, suite):
+        source = sys.intern(str(suite.source)) if suite.source else None
+        for kw in getattr(getattr(suite, "resource", None), "keywords", ()):
+            calls = []
+            self._walk_body(kw.body, kw.name, source, 0, calls)
+            # has_teardown/has_setup: the plain getters create fixtures on the running model
+            if kw.has_teardown:
+                self._walk_body([kw.teardown], kw.name, source, 0, calls)
+            self._user_keywords.setdefault((source, normalize_name(kw.name)), (kw.name, source, kw.lineno, calls))
+        for test in suite.tests:
+            entry = TestEntry(len(self.tests), test, suite.name)
+            self.tests.append(entry)
+            self._by_id[entry.id] = entry
+            self._by_longname[entry.longname] = entry
+            if test.has_setup:
+                entry.setup = self._add_call(test.setup, entry, entry.source, 0)
+            self._walk_body(test.body, entry, entry.source, 0, entry.calls)
+            if test.has_teardown:
+                entry.teardown = self._add_call(test.teardown, entry, entry.source, 0)
+        for child in suite.suites:
+            self._walk_suite(child)
+
+    def _walk_body(self, body, owner, source, depth, calls):
+        for item in body:
+            if getattr(item, "type", None) in KEYWORD_TYPES:
+                calls.append(self._add_call(item, owner, source, depth))
+            else:
+                # IF/TRY roots hold branches, branches and FOR/WHILE/GROUP hold steps: all are a `body`
+                nested = getattr(item, "body", None)
+                if nested:
+                    level = depth if item.type in BRANCH_ROOTS else depth + 1
+                    self._walk_body(nested, owner, source, level, calls)
+
+    def _add_call(self, kw, owner, source, depth):
+        site = CallSite(kw.name, tuple(str(a) for a in kw.args), source, kw.lineno, depth, owner)
+        self._sites.setdefault(normalize_name(kw.name), []).append(site)
+        return site
+
+    # === Lookups ===
+    def test(self, test_id):
+        """TestEntry by test id (s1-s2-t3) or full name, or None."""
+        return (self._by_id.get(test_id) or self._by_longname.get(test_id)) if self.ready else None
+
+    def position(self, test_id):
+        """(1-based position, total tests) of a test, or None."""
+        entry = self.test(test_id)
+        return (entry.position + 1, len(self.tests)) if entry is not None else None
+
+    def longnames(self):
+        return [entry.longname for entry in self.tests] if self.ready else None
+
+    def call_sites(self, name=None, matches=None):
+        """Static calls of a keyword by (normalized) name, or of every keyword name `matches` accepts."""
+        if not self.ready:
+            return []
+        if matches is None:
+            return list(self._sites.get(normalize_name(name), ()))
+        return [site for sites in self._sites.values() if matches(sites[0].name) for site in sites]
+
+    def user_keyword(self, name, source):
+        """
+        (name, source, lineno, [CallSite]) of the keyword `name` defined in the suite
+        file `source` (where a call in that file resolves first), or None.
+        """
+        return self._user_keywords.get((source, normalize_name(name))) if self.ready else None
@@ -0,0 +1,38 @@
+import pytest
+from robot.variables import Variables
+
+from rfdb.breakpoints import Breakpoint, evaluate_condition
+
+
+@pytest.fixture
+def variables():
+    variables = Variables()
+    variables["${name}"] = "abc"
+    variables["${count}"] = 5
+    variables["@{items}"] = [1, 2, 3]
+    variables["${flag}"] = True
+    return variables
+
+
+@pytest.mark.parametrize("condition, expected", [
+    ("'${name}' == 'abc'", True),
+    ('"${name}" != "abc"', False),
+    ("$name == 'abc'", True),
+    ("'$name' == 'abc'", False),
+    ("${count} > 3", True),
+    ("$count > 3 and len($items) == 3", True),
+    ("${flag}", True),
+])
+def test_conditions_evaluate_like_robot_if(variables, condition, expected):
+    assert evaluate_condition(condition, variables) is expected
+
+
+def test_condition_syntax_is_checked_when_added():
+    Breakpoint("Log", condition="'${name}' == 'abc' and ${count}.real > 3")
+    with pytest.raises(SyntaxError):
+        Breakpoint("Log", condition="$count >")
+
+
+def test_unbalanced_condition_is_a_syntax_error():
+    with pytest.raises(SyntaxError):
+        Breakpoint("Log", condition="len($x")
@@ -0,0 +1,20 @@
+import os
+
+from rfdb.catalog_cache import CatalogCache
+
+
+def test_editing_a_package_submodule_changes_the_key(tmp_path):
+    package = tmp_path / "MyLib"
+    package.mkdir()
+    (package / "__init__.py").write_text("from .keywords import *\n")
+    submodule = package / "keywords.py"
+    submodule.write_text("def first():\n    pass\n")
+    cache = CatalogCache(str(tmp_path / "cache"))
+
+    key = cache.key("MyLib", "1.0", (), str(package / "__init__.py"))
+    assert key == cache.key("MyLib", "1.0", (), str(package))
+
+    submodule.write_text("def first():\n    pass\n\ndef second():\n    pass\n")
+    stat = submodule.stat()
+    os.utime(submodule, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.key("MyLib", "1.0", (), str(package / "__init__.py")) != key
@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+
+from rfdb.ignore_rules import IgnoreRules, load_profile, rule_error, rule_kind, save_profile
+
+
+def test_rule_kinds():
+    assert rule_kind("Click Element") == "exact"
+    assert rule_kind("SeleniumLibrary.Click Element") == "exact"
+    assert rule_kind("Wait Until *") == "glob"
+    assert rule_kind("glob:Wait") == "glob"
+    assert rule_kind("re:^get .*") == "regex"
+    assert rule_kind("message:*timeout*") == "message"
+    assert rule_kind("msg:re:timeout") == "message"
+
+
+def test_exact_and_qualified_names():
+    rules = IgnoreRules(["Click Element", "SeleniumLibrary.Input Text"])
+    assert rules.match("click element") == "Click Element"
+    assert rules.match("Input Text") is None
+    assert rules.match("Input Text", "SeleniumLibrary.Input Text") == "SeleniumLibrary.Input Text"
+
+
+def test_globs_in_buckets_and_general():
+    rules = IgnoreRules(["Wait Until *", "*Should Be Visible", "glob:Get ?ount"])
+    assert rules.match("Wait Until Element Is Visible") == "Wait Until *"
+    assert rules.match("Element Should Be Visible") == "*Should Be Visible"
+    assert rules.match("Get Count") == "glob:Get ?ount"
+    assert rules.match("Click Element") is None
+
+
+def test_many_glob_rules():
+    rules = IgnoreRules([f"Keyword {i} *" for i in range(500)])
+    assert rules.match("Keyword 321 Does Things") == "Keyword 321 *"
+    assert rules.match("Other Keyword") is None
+
+
+@pytest.mark.parametrize("rule, name", [
+    ("re:(?i)wait.*", "WaitForIt"),
+    (r"re:(a)\1.*", "aa keyword"),
+    ("re:(?P<x>get) .*", "get count"),
+])
+def test_regex_rules_with_flags_backrefs_and_groups(rule, name):
+    assert rule_error(rule) is None
+    rules = IgnoreRules([rule, "re:(?P<x>set) .*", "Wait Until *", "*Visible"])
+    assert rules.match(name) == rule
+
+
+def test_regex_rules_match_whole_name():
+    rules = IgnoreRules(["re:get .* count"])
+    assert rules.match("Get Element Count") == "re:get .* count"
+    assert rules.match("Get Element Count Twice") is None
+
+
+def test_message_rules():
+    rules = IgnoreRules(["message:*StaleElement*", "message:re:timeout", "msg:re:(?i)^(e)\\1rror"])
+    assert rules.match("Click", message="StaleElementReferenceException: gone") == "message:*StaleElement*"
+    assert rules.match("Click", message="Element timeout after 5s") == "message:re:timeout"
+    assert rules.match("Click", message="EError here") == "msg:re:(?i)^(e)\\1rror"
+    assert rules.match("Click", message="Something else") is None
+    assert rules.match("Click") is None
+
+
+def test_invalid_rule_is_skipped_with_warning(caplog):
+    assert rule_error("re:(unclosed") is not None
+    rules = IgnoreRules(["re:(unclosed", "Click Element"])
+    with caplog.at_level(logging.WARNING):
+        assert rules.match("Click Element") == "Click Element"
+        assert rules.match("Other") is None
+    assert "re:(unclosed" in caplog.text
+
+
+def test_edits_recompile():
+    rules = IgnoreRules(["Click Element"])
+    assert rules.match("Click Element")
+    rules.remove("Click Element")
+    assert rules.match("Click Element") is None
+    rules.add("Click *")
+    assert rules.match("Click Element") == "Click *"
+    rules.clear()
+    assert not rules
+    assert rules.match("Click Element") is None
+
+
+def test_profiles_round_trip(tmp_path):
+    path = save_profile("flaky ui", ["Wait Until *", "Click Element"], str(tmp_path))
+    assert path.endswith("flaky_ui.json")
+    assert load_profile("flaky ui", str(tmp_path)) == ["Click Element", "Wait Until *"]
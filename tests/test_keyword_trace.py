@@ -0,0 +1,24 @@
+from robot.result import Keyword
+
+from rfdb.keyword_trace import KeywordTrace, is_user_keyword
+
+
+def test_logging_library_keyword_is_not_a_user_keyword():
+    logged = Keyword("Log", status="PASS")
+    logged.body.create_message("hello")
+    assert not is_user_keyword(logged)
+
+    user = Keyword("My Keyword", status="PASS")
+    user.body.create_message("hello")
+    user.body.create_keyword("Log")
+    assert is_user_keyword(user)
+
+
+def test_user_level_follows_the_hook_kind():
+    trace = KeywordTrace("user", max_per_second=100)
+    logged = Keyword("Log", status="PASS")
+    logged.body.create_message("hello")
+    assert trace.end_event(logged, logged, user_keyword=False) is None
+    assert trace.end_event(logged, logged) is None
+    assert trace.end_event(Keyword("Empty"), Keyword("Empty", status="PASS"), user_keyword=True)[0] == "Empty"
+    assert trace.end_event(logged, Keyword("Log", status="FAIL"), user_keyword=False)[1] == "FAIL"
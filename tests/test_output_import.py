@@ -0,0 +1,35 @@
+import textwrap
+
+from robot import run
+
+from rfdb.output_import import RunBaseline
+
+
+def test_control_structure_status_is_not_taken_by_the_test(tmp_path):
+    suite = tmp_path / "timing.robot"
+    suite.write_text(textwrap.dedent("""\
+        *** Test Cases ***
+        Loop First
+            FOR    ${i}    IN RANGE    3
+                Sleep    0.05
+            END
+            Sleep    0.3
+
+        If First
+            IF    True
+                Sleep    0.05
+            ELSE
+                No Operation
+            END
+            VAR    ${x}    value
+            Sleep    0.3
+    """))
+    output = tmp_path / "output.xml"
+    assert run(str(suite), output=str(output), report=None, log=None, stdout=None) == 0
+
+    baseline = RunBaseline.load(str(output))
+    assert baseline.test_seconds["Timing.Loop First"] >= 0.45
+    assert baseline.test_seconds["Timing.If First"] >= 0.35
+    sleep = baseline.keyword_stats("Sleep", "BuiltIn")
+    assert sleep.calls == 6
+    assert 0.8 <= sleep.total_seconds < 1.5
@@ -0,0 +1,67 @@
+import textwrap
+
+from robot import run
+
+from rfdb.core import SimpleRetryCore
+
+
+class Listener:
+    """Forwards the hooks the debugger follows and reads the inspector rows after every keyword."""
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, core):
+        self.core = core
+        self.rows = []
+
+    def start_test(self, data, result):
+        self.core.start_test(data, result)
+
+    def end_test(self, data, result):
+        self.core.end_test(data, result)
+
+    def start_library_keyword(self, data, implementation, result):
+        self.core.start_keyword(data, result)
+
+    def end_library_keyword(self, data, implementation, result):
+        self.core.end_keyword(data, result)
+        rows = {name: value for name, value, _, _ in self.core.variable_scopes.rows()}
+        self.rows.append((data.name, rows.get("${i}"), rows.get("@{lst}")))
+
+    def start_for(self, data, result):
+        self.core.start_loop(data, result)
+
+    def end_for(self, data, result):
+        self.core.end_loop(data, result)
+
+    def start_for_iteration(self, data, result):
+        self.core.start_loop_iteration(data, result)
+
+    def end_for_iteration(self, data, result):
+        self.core.end_loop_iteration(data, result)
+
+
+def test_loop_variable_and_in_place_changes_are_refreshed(tmp_path):
+    suite = tmp_path / "loop.robot"
+    suite.write_text(textwrap.dedent("""\
+        *** Settings ***
+        Library    Collections
+
+        *** Test Cases ***
+        Loop
+            ${lst} =    Create List    a
+            FOR    ${i}    IN RANGE    3
+                Append To List    ${lst}    ${i}
+            END
+    """))
+    core = SimpleRetryCore()
+    core.test_start_event.set()
+    listener = Listener(core)
+    assert run(str(suite), listener=listener, output=None, report=None, log=None, stdout=None) == 0
+
+    appends = [(i, lst) for name, i, lst in listener.rows if name == "Append To List"]
+    assert appends == [
+        ("0", "['a', 0]"),
+        ("1", "['a', 0, 1]"),
+        ("2", "['a', 0, 1, 2]"),
+    ]
@@ -0,0 +1,207 @@
+# variable_history.py
+import hashlib
+import reprlib
+import threading
+import time
+from collections import deque, namedtuple
+from collections.abc import Collection, Mapping, Set
+from itertools import islice
+
+# Compact, immutable description of a variable value at one point in time
+VariableValue = namedtuple("VariableValue", "type preview digest")
+
+PREVIEW_LENGTH = 200  # Max characters kept per value preview
+DIGEST_SAMPLE_ITEMS = 16  # Items hashed from each end of a larger container
+DIGEST_MAX_ITEMS = 256  # Items hashed per value in total, nested containers included
+DIGEST_MAX_DEPTH = 8
+ENTRY_OVERHEAD_BYTES = 64  # Rough per-item bookkeeping cost used for the memory budget
+
+# Values of these types can be reused by identity between snapshots
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None), tuple, frozenset)
+
+_repr = reprlib.Repr()
+_repr.maxstring = PREVIEW_LENGTH
+_repr.maxother = PREVIEW_LENGTH
+_repr.maxlist = _repr.maxtuple = _repr.maxset = _repr.maxdict = 20
+_repr.maxlevel = 3
+
+
+def preview_value(value):
+    """Return a bounded text preview of a value without stringifying all of it."""
+    if isinstance(value, str):
+        text = value
+    else:
+        try:
+            text = _repr.repr(value)
+        except Exception:
+            text = object.__repr__(value)
+    if len(text) > PREVIEW_LENGTH:
+        text = text[:PREVIEW_LENGTH - 3] + "..."
+    return text
+
+
+def _digest_sample(value):
+    """Items of a container to hash: all of a small one, else the first and last DIGEST_SAMPLE_ITEMS."""
+    items = value.items() if isinstance(value, Mapping) else value
+    if len(value) <= 2 * DIGEST_SAMPLE_ITEMS:
+        if isinstance(value, Set):
+            return sorted(items, key=preview_value)  # Set order changes between runs (string hashing)
+        return list(items)
+    if isinstance(value, Set):
+        return []  # Large sets: no order to sample in that holds across runs, length only
+    sample = list(islice(items, DIGEST_SAMPLE_ITEMS))
+    try:
+        sample += islice(reversed(items), DIGEST_SAMPLE_ITEMS)
+    except TypeError:
+        sample += islice(items, DIGEST_SAMPLE_ITEMS, 2 * DIGEST_SAMPLE_ITEMS)  # Not reversible
+    return sample
+
+
+def _feed_digest(hasher, value, budget, depth=0):
+    """Hash a value's content; containers by type, length and a bounded sample of their items."""
+    if isinstance(value, str):
+        hasher.update(value.encode("utf-8", "replace"))
+    elif isinstance(value, (bytes, bytearray)):
+        hasher.update(value)
+    elif isinstance(value, (Mapping, Collection)):
+        hasher.update(f"<{type(value).__name__}:{len(value)}>".encode())
+        if depth >= DIGEST_MAX_DEPTH:
+            return
+        for item in _digest_sample(value):
+            if budget[0] <= 0:
+                return
+            budget[0] -= 1
+            _feed_digest(hasher, item, budget, depth + 1)
+            hasher.update(b"\x1f")
+    else:
+        hasher.update(str(value).encode("utf-8", "replace"))
+
+
+def describe_value(value):
+    """
+    Build a VariableValue (type, bounded preview, content digest) for a value.
+
+    Containers are never stringified whole: the digest covers their type,
+    length and at most DIGEST_MAX_ITEMS items taken from both ends, so it is
+    stable across runs but misses in-place changes in the middle of a large
+    container.
+    """
+    preview = preview_value(value)
+    hasher = hashlib.blake2b(digest_size=8)
+    try:
+        _feed_digest(hasher, value, [DIGEST_MAX_ITEMS])
+    except Exception:
+        hasher = hashlib.blake2b(preview.encode("utf-8", "replace"), digest_size=8)
+    return VariableValue(type(value).__name__, preview, hasher.hexdigest())
+
+
+def value_size(name, value):
+    """Approximate memory cost of one stored variable entry."""
+    if value is None:
+        return len(name) + ENTRY_OVERHEAD_BYTES
+    return len(name) + len(value.preview) + len(value.type) + ENTRY_OVERHEAD_BYTES
+
+
+class VariableSnapshotter:
+    """Turns Robot variables into snapshots, reusing descriptions of unchanged immutable values."""
+
+    def __init__(self):
+        self._known = {}  # name -> (value object, VariableValue)
+
+    def snapshot(self, variables):
+        snapshot = {}
+        known = {}
+        for name, value in variables.items():
+            name = str(name)
+            previous = self._known.get(name)
+            if previous is not None and previous[0] is value and isinstance(value, _IMMUTABLE_TYPES):
+                described = previous[1]
+            else:
+                described = describe_value(value)
+            snapshot[name] = described
+            known[name] = (value, described)
+        self._known = known
+        return snapshot
+
+    def reset(self):
+        self._known = {}
+
+
+class VariableHistory:
+    """
+    Ring buffer of variable snapshots taken at keyword ends.
+
+    Only the newest snapshot is kept in full. Older snapshots are stored as
+    reverse deltas (what to restore to step one snapshot back), and the oldest
+    deltas are dropped once the memory budget is exceeded.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self._head = {}
+        self._head_size = 0
+        self._labels = deque()  # (keyword, timestamp) for every reachable snapshot, oldest first
+        self._deltas = deque()  # (reverse delta, size); delta i turns snapshot i+1 into snapshot i
+        self._delta_bytes = 0
+
+    def __len__(self):
+        return len(self._labels)
+
+    @property
+    def memory_used(self):
+        return self._head_size + self._delta_bytes
+
+    def record(self, keyword, snapshot):
+        """Store a new snapshot (dict of name -> VariableValue) as the newest entry."""
+        with self._lock:
+            if self._labels:
+                head = self._head
+                delta = {
+                    name: old for name, old in head.items()
+                    if name not in snapshot or snapshot[name].digest != old.digest
+                }
+                for name in snapshot:
+                    if name not in head:
+                        delta[name] = None
+                size = sum(value_size(name, old) for name, old in delta.items()) + ENTRY_OVERHEAD_BYTES
+                self._deltas.append((delta, size))
+                self._delta_bytes += size
+
+            self._head = snapshot
+            self._head_size = sum(value_size(name, value) for name, value in snapshot.items())
+            self._labels.append((keyword, time.time()))
+            self._enforce_budget()
+
+    def _enforce_budget(self):
+        while self._deltas and self.memory_used > self.budget_bytes:
+            _, size = self._deltas.popleft()
+            self._delta_bytes -= size
+            self._labels.popleft()
+
+    def snapshot_at(self, steps_back):
+        """
+        Reconstruct the snapshot taken `steps_back` keyword ends before the newest one.
+        Returns (keyword, timestamp, {name: VariableValue}) or None if out of range.
+        """
+        with self._lock:
+            if steps_back < 0 or steps_back >= len(self._labels):
+                return None
+            state = dict(self._head)
+            for i in range(1, steps_back + 1):
+                delta, _ = self._deltas[-i]
+                for name, old in delta.items():
+                    if old is None:
+                        state.pop(name, None)
+                    else:
+                        state[name] = old
+            keyword, timestamp = self._labels[-1 - steps_back]
+            return keyword, timestamp, state
+
+    def clear(self):
+        with self._lock:
+            self._head = {}
+            self._head_size = 0
+            self._labels.clear()
+            self._deltas.clear()
+            self._delta_bytes = 0
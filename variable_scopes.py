@@ -0,0 +1,123 @@
+# variable_scopes.py
+import threading
+from robot.libraries.BuiltIn import BuiltIn
+from .variable_history import preview_value
+
+# Narrowest first - a name defined in several scopes is attributed to the narrowest one
+SCOPES = ("local", "test", "suite", "global")
+
+# Keywords that write variables, mapped to the scope they write to
+SCOPE_SETTERS = {
+    "set global variable": "global",
+    "set suite variable": "suite",
+    "set test variable": "test",
+    "set task variable": "test",
+    "set local variable": "local",
+    "import variables": "suite",
+    "import resource": "suite",
+}
+
+# VAR statement scopes (RF 7) mapped to ours
+VAR_SCOPES = {
+    "global": "global",
+    "suites": "suite",
+    "suite": "suite",
+    "test": "test",
+    "task": "test",
+    "local": "local",
+}
+
+# Robot propagates writes downwards, so changing a scope also changes every narrower one
+_INVALIDATES = {
+    "global": ("global", "suite", "test"),
+    "suite": ("suite", "test"),
+    "test": ("test",),
+    "local": (),
+}
+
+
+class ScopedVariableCache:
+    """
+    Per-scope variable rows read from Robot's variable scopes.
+
+    Which names a test, suite or global scope holds is cached until the
+    listener reports a write to that scope (`Set Global Variable`, VAR, a
+    FOR loop variable, ...). Only the value objects are cached, not their
+    previews: lists and dicts changed in place (`Append To List`) are
+    described again on every read. The local (keyword) scope changes with
+    every call and is always read fresh.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}  # scope -> {name: value object}
+
+    def invalidate(self, scope):
+        with self._lock:
+            for name in _INVALIDATES.get(scope, ()):
+                self._values.pop(name, None)
+
+    def invalidate_all(self):
+        with self._lock:
+            self._values.clear()
+
+    def rows(self, scope="all"):
+        """
+        Return [(name, value_str, type, scope)] for one scope, or for all scopes merged.
+        Raises RuntimeError when no execution context is available.
+        """
+        scopes = BuiltIn()._variables
+        if scope != "all":
+            return [(name, preview_value(value), type(value).__name__, scope)
+                    for name, value in self._scope_values(scopes, scope).items()]
+
+        merged = {}
+        for name in reversed(SCOPES):
+            for var_name, value in self._scope_values(scopes, name).items():
+                merged[var_name] = (value, name)
+        return [(var_name, preview_value(value), type(value).__name__, name)
+                for var_name, (value, name) in merged.items()]
+
+    def _scope_values(self, scopes, scope):
+        if scope != "local":
+            with self._lock:
+                cached = self._values.get(scope)
+            if cached is not None:
+                return cached
+
+        values = self._read_scope(scopes, scope)
+
+        if scope != "local":
+            with self._lock:
+                self._values[scope] = values
+        return values
+
+    def _read_scope(self, scopes, scope):
+        store, parent = self._stores(scopes, scope)
+        if store is None:
+            return {}
+        parent_values = parent.as_dict() if parent is not None else {}
+        values = {}
+        for name, value in store.as_dict().items():
+            # Only show names defined (or overridden) in this scope, not inherited copies
+            if name in parent_values and parent_values[name] is value:
+                continue
+            values[str(name)] = value
+        return values
+
+    @staticmethod
+    def _stores(scopes, scope):
+        """Return (scope store, parent store) from Robot's VariableScopes."""
+        global_ = getattr(scopes, "_global", None)
+        suite = getattr(scopes, "_suite", None)
+        test = getattr(scopes, "_test", None)
+        if scope == "global":
+            return global_, None
+        if scope == "suite":
+            return suite, global_
+        if scope == "test":
+            return test, suite
+        current = scopes.current
+        if current is global_ or current is suite or current is test:
+            return None, None
+        return current, test or suite